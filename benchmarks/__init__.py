@@ -0,0 +1 @@
+"""Benchmarks of the casino simulations. Run with ``python -m benchmarks``."""
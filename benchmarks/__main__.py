@@ -0,0 +1,49 @@
+"""Runs the benchmark suite and optionally compares it with a baseline.
+
+E.g. ``python -m benchmarks --output current.json --baseline baseline.json``
+exits with status 1 if any scenario is slower than the baseline by more than
+the tolerance.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks import suite
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help="Only run scenarios whose names start with one of these.",
+    )
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Save the JSON report to this path.")
+    parser.add_argument("--baseline", help="Compare with the report at this path.")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    measurements = suite.run(args.names or None, args.scale, args.repeat)
+    for m in measurements:
+        print(
+            f"{m.name:40s}{m.operations_per_second:>14,.0f} {m.unit}/s"
+            f"{m.peak_bytes_per_operation:>12,.1f} B/{m.unit}"
+        )
+    results = suite.report(measurements)
+    if args.output:
+        suite.save_report(results, args.output)
+    if not args.baseline:
+        return 0
+
+    rows = suite.compare(results, suite.load_report(args.baseline), args.tolerance)
+    for row in rows:
+        flag = "REGRESSED" if row["regressed"] else ""
+        print(f"{row['name']:40s}{row['ratio']:>8.2f}x {flag}")
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
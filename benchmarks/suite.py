@@ -0,0 +1,300 @@
+"""Seeded benchmark scenarios for every game, player and engine path.
+
+Each `Scenario` runs a fixed amount of work from a fixed seed, so the same
+operations are timed on every run. A run reports the operations per second of
+each scenario and its memory use per operation, and can be compared with a
+stored baseline report to catch regressions.
+"""
+
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Type
+
+import casino.main
+import casino.players
+
+SEED = 2024
+
+
+@dataclass
+class Scenario:
+    """A benchmark which does a fixed amount of seeded work.
+
+    Attributes:
+        name: The unique name of the scenario, e.g. "roulette.cycle.Roulette1326".
+        setup: Builds the state of a run and returns the function which runs it.
+            The function returns the number of operations it performed, e.g. the
+            number of cycles played.
+        unit: What one operation is, e.g. "cycle" or "choice".
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], int]]
+    unit: str
+
+
+@dataclass
+class Measurement:
+    """The result of benchmarking one `Scenario`.
+
+    Attributes:
+        name: The name of the scenario.
+        unit: What one operation is.
+        operations: The number of operations of one run.
+        seconds: The fastest wall time of a run.
+        operations_per_second: ``operations`` divided by ``seconds``.
+        peak_bytes_per_operation: The peak memory allocated during a run, as
+            traced by `tracemalloc`, divided by ``operations``.
+        blocks_per_operation: The net number of memory blocks still allocated
+            after a run, divided by ``operations``. This is zero unless the
+            scenario keeps objects.
+    """
+
+    name: str
+    unit: str
+    operations: int
+    seconds: float
+    operations_per_second: float
+    peak_bytes_per_operation: float
+    blocks_per_operation: float
+
+
+def players_of(game_type: Type[casino.main.Game]) -> List[Type]:
+    """Returns every concrete `Player` of ``game_type``, by name."""
+    return casino.main.BulkSimulator.get_all_players(game_type)
+
+
+def _construct(factory_type: Type[casino.main.RandomEventFactory], count: int):
+    def setup() -> Callable[[], int]:
+        def run() -> int:
+            for _ in range(count):
+                factory_type()
+            return count
+
+        return run
+
+    return setup
+
+
+def _choose(factory_type: Type[casino.main.RandomEventFactory], count: int):
+    def setup() -> Callable[[], int]:
+        factory = factory_type()
+        factory.seed(SEED)
+
+        def run() -> int:
+            choose = factory.choose
+            for _ in range(count):
+                choose()
+            return count
+
+        return run
+
+    return setup
+
+
+def _game_simulator(
+    game_type: Type[casino.main.Game],
+    factory_type: Type[casino.main.RandomEventFactory],
+    player_type: Type[casino.players.Player],
+) -> casino.main.Simulator:
+    table = casino.main.Table()
+    game = game_type(factory_type(), table)  # type: ignore
+    table.set_game(game)
+    return casino.main.Simulator(
+        game, player_type(table), casino.main.SeedSequence(SEED)  # type: ignore
+    )
+
+
+def _cycle(
+    game_type: Type[casino.main.Game],
+    factory_type: Type[casino.main.RandomEventFactory],
+    player_type: Type[casino.players.Player],
+    cycles: int,
+):
+    def setup() -> Callable[[], int]:
+        sim = _game_simulator(game_type, factory_type, player_type)
+        sim.samples = 1
+
+        def run() -> int:
+            # Whole sessions are gathered until at least ``cycles`` cycles are.
+            played = session = 0
+            while played < cycles:
+                sim.first_sample = session
+                sim.gather()
+                played += sim.durations[-1]
+                session += 1
+            return played
+
+        return run
+
+    return setup
+
+
+def _gather(player_type: Type[casino.players.Player], samples: int):
+    def setup() -> Callable[[], int]:
+        def run() -> int:
+            sim = _game_simulator(
+                casino.main.RouletteGame, casino.main.Wheel, player_type
+            )
+            sim.samples = samples
+            sim.gather()
+            return sum(sim.durations)
+
+        return run
+
+    return setup
+
+
+def _gather_all(samples: int, workers: int):
+    def setup() -> Callable[[], int]:
+        def run() -> int:
+            table = casino.main.Table()
+            game = casino.main.RouletteGame(casino.main.Wheel(), table)
+            table.set_game(game)
+            b_sim = casino.main.BulkSimulator(game, seed=SEED, workers=workers)
+            b_sim.players = players_of(casino.main.RouletteGame)
+            b_sim.samples = samples
+            b_sim.gather_all()
+            return sum(sum(result.durations) for result in b_sim.results)
+
+        return run
+
+    return setup
+
+
+def scenarios(scale: float = 1.0) -> List[Scenario]:
+    """Returns every benchmark scenario.
+
+    Args:
+        scale: Multiplies the amount of work of every scenario, e.g. 0.01 for a
+            quick smoke test.
+    """
+
+    def size(amount: int, least: int = 1) -> int:
+        return max(least, int(amount * scale))
+
+    found = [
+        Scenario("wheel.construct", _construct(casino.main.Wheel, size(20)), "wheel"),
+        Scenario("dice.construct", _construct(casino.main.Dice, size(20)), "dice"),
+        Scenario("wheel.choose", _choose(casino.main.Wheel, size(200_000)), "choice"),
+        Scenario("dice.choose", _choose(casino.main.Dice, size(200_000)), "choice"),
+    ]
+    for player in players_of(casino.main.RouletteGame):
+        cycle = _cycle(
+            casino.main.RouletteGame, casino.main.Wheel, player, size(20_000)
+        )
+        found.append(Scenario(f"roulette.cycle.{player.__name__}", cycle, "cycle"))
+    for player in players_of(casino.main.CrapsGame):
+        cycle = _cycle(casino.main.CrapsGame, casino.main.Dice, player, size(20_000))
+        found.append(Scenario(f"craps.cycle.{player.__name__}", cycle, "cycle"))
+    for samples in (10, 50, 200):
+        gather = _gather(casino.players.RouletteMartingale, size(samples, 2))
+        found.append(Scenario(f"simulator.gather.{samples}", gather, "cycle"))
+    # Every player's statistics need at least two samples.
+    for workers in (1, 2):
+        gather_all = _gather_all(size(50, 2), workers)
+        name = "bulk.gather_all" + (f".workers{workers}" if workers > 1 else "")
+        found.append(Scenario(name, gather_all, "cycle"))
+    return found
+
+
+def measure(scenario: Scenario, repeat: int = 3) -> Measurement:
+    """Runs ``scenario`` ``repeat`` times and keeps the fastest time, then once
+    more with `tracemalloc` to measure its memory use.
+    """
+    seconds = float("inf")
+    operations = 0
+    for _ in range(repeat):
+        run = scenario.setup()
+        start = time.perf_counter()
+        operations = run()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    run = scenario.setup()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        _, baseline = tracemalloc.get_traced_memory()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return Measurement(
+        scenario.name,
+        scenario.unit,
+        operations,
+        seconds,
+        operations / seconds if seconds else float("inf"),
+        (peak - baseline) / operations,
+        max(0, blocks) / operations,
+    )
+
+
+def run(
+    names: Optional[Iterable[str]] = None, scale: float = 1.0, repeat: int = 3
+) -> List[Measurement]:
+    """Measures the scenarios whose names start with any of ``names``, or every
+    scenario if ``names`` is `None`."""
+    prefixes = tuple(names) if names is not None else ("",)
+    return [
+        measure(scenario, repeat)
+        for scenario in scenarios(scale)
+        if scenario.name.startswith(prefixes)
+    ]
+
+
+def report(measurements: Iterable[Measurement]) -> Dict:
+    """Returns the machine readable report of ``measurements``."""
+    return {
+        "seed": SEED,
+        "scenarios": {m.name: asdict(m) for m in measurements},
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float = 0.2) -> List[Dict]:
+    """Compares two `report`s.
+
+    Args:
+        current: The report of this run.
+        baseline: The stored report to compare with.
+        tolerance: The fraction by which the operations per second of a
+            scenario may drop below the baseline before it is a regression.
+
+    Returns:
+        A row for each scenario in both reports with its baseline and current
+        operations per second, their ratio and whether it regressed.
+    """
+    rows = []
+    for name, measurement in current["scenarios"].items():
+        stored = baseline["scenarios"].get(name)
+        if stored is None:
+            continue
+        ratio = measurement["operations_per_second"] / stored["operations_per_second"]
+        rows.append(
+            {
+                "name": name,
+                "baseline": stored["operations_per_second"],
+                "current": measurement["operations_per_second"],
+                "ratio": ratio,
+                "regressed": ratio < 1 - tolerance,
+            }
+        )
+    return rows
+
+
+def load_report(file_path) -> Dict:
+    """Loads a report saved by `save_report`."""
+    with open(file_path) as json_file:
+        return json.load(json_file)
+
+
+def save_report(results: Dict, file_path) -> None:
+    """Saves a `report` to a JSON file, e.g. as the baseline of later runs."""
+    with open(file_path, "w") as json_file:
+        json.dump(results, json_file, indent=2)
@@ -0,0 +1,5 @@
+import sys
+
+import casino.cli
+
+sys.exit(casino.cli.main())
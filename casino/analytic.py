@@ -0,0 +1,958 @@
+"""Exact evaluation of casino betting strategies by dynamic programming.
+
+Several players bet with an amount which only depends on a small amount of
+state, such as the loss count of `RouletteMartingale` or the
+`Roulette1326State` of `Roulette1326`. A session of such a player is a Markov
+chain over (state, stake), so rather than sampling sessions with
+`Simulator.gather` the probability of every session result can be computed
+exactly, one cycle at a time.
+
+Each supported Roulette player is described by a `StrategyModel` and each
+supported Craps player by a `CrapsStrategyModel`, which mirror the player's
+`place_bets`, `win` and `lose` methods and the `Table` limit rules. In Craps the
+state also includes the point and the bets on the table, and the point follows
+the `CrapsGameState` machine and `CRAPS_RESOLUTION`.
+
+This module requires the optional ``numpy`` dependency.
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+import numpy as np
+
+import casino.main
+import casino.odds
+import casino.players
+
+
+class Branch(NamedTuple):
+    """One of the ways a cycle of a `SessionChain` can go.
+
+    Attributes:
+        change: The change in the player's stake over the cycle.
+        state: The state after the cycle.
+        probability: The probability of this branch.
+    """
+
+    change: int
+    state: Hashable
+    probability: float
+
+
+class SessionChain(ABC):
+    """A game session as a Markov chain over (state, stake).
+
+    Attributes:
+        gain: An upper bound of the increase in stake in a single cycle.
+    """
+
+    gain: int
+
+    @abstractmethod
+    def initial_state(self) -> Hashable:
+        """Returns the state at the start of a session."""
+        pass
+
+    @abstractmethod
+    def branches(self, state: Hashable, stake: int) -> Tuple[Branch, ...]:
+        """Returns the `Branch`es of a cycle played in ``state`` with ``stake``.
+
+        Raises:
+            InvalidBet: The player places a bet which violates the table rules.
+        """
+        pass
+
+    def has_bets(self, state: Hashable) -> bool:
+        """Returns `True` if the player has bets on the table in ``state``, so
+        keeps playing when out of rounds or stake.
+        """
+        return False
+
+    def stopped(self, state: Hashable) -> bool:
+        """Returns `True` if the player has stopped playing in ``state``."""
+        return False
+
+
+class Move(NamedTuple):
+    """The bet a `StrategyModel` places in a given state, and the states which
+    follow it.
+
+    Attributes:
+        amount: The amount bet. Zero if no bet is placed this cycle.
+        won: The state after the bet wins, or the next state if no bet is placed.
+        lost: The state after the bet loses.
+        last: `True` if the player stops playing after this cycle.
+    """
+
+    amount: int
+    won: Hashable
+    lost: Hashable
+    last: bool = False
+
+
+class StrategyModel(ABC):
+    """Describes the betting strategy of a `Player` subclass as a finite state
+    machine.
+
+    The state must be hashable and, together with the stake, determine the
+    player's next bet. Only the player's preferred `Outcome` may be bet on.
+
+    Attributes:
+        outcome_name: The name of the `Outcome` every bet is placed on.
+        limit: The table limit of the player's bets.
+    """
+
+    outcome_name: str = "Black"
+
+    def __init__(self, limit: int = 30) -> None:
+        self.limit = limit
+
+    @abstractmethod
+    def initial_state(self) -> Hashable:
+        """Returns the state of the strategy after `Player.reset`."""
+        pass
+
+    @abstractmethod
+    def play(self, state: Hashable, stake: int) -> Move:
+        """Returns the `Move` made by the player in ``state`` with ``stake``.
+
+        Args:
+            state: The current state of the strategy.
+            stake: The player's stake before the bet is placed.
+        """
+        pass
+
+
+class Passenger57Model(StrategyModel):
+    """Model of `RoulettePassenger57`, which has no state."""
+
+    def initial_state(self) -> Hashable:
+        return None
+
+    def play(self, state: Hashable, stake: int) -> Move:
+        amount = min(casino.players.RoulettePassenger57.bet_amount, stake)
+        if amount > self.limit:
+            raise casino.main.InvalidBet(
+                "Placing this bet violates table min/limit rules."
+            )
+        return Move(amount, None, None)
+
+
+class MartingaleModel(StrategyModel):
+    """Model of `RouletteMartingale`. The state is `loss_count`."""
+
+    def initial_state(self) -> Hashable:
+        return 0
+
+    def play(self, state: Hashable, stake: int) -> Move:
+        assert isinstance(state, int)
+        amount = min(2 ** state, stake)
+        if amount > self.limit:
+            # The player restarts the strategy when the bet is over the limit.
+            return Move(min(1, stake), 0, 1)
+        return Move(amount, 0, state + 1)
+
+
+class FibonacciModel(StrategyModel):
+    """Model of `RouletteFibonacci`. The state is (`recent`, `previous`)."""
+
+    def initial_state(self) -> Hashable:
+        return 1, 0
+
+    def play(self, state: Hashable, stake: int) -> Move:
+        assert isinstance(state, tuple)
+        recent, previous = state
+        amount = min(recent, stake)
+        if amount > self.limit:
+            return Move(0, state, state, last=True)
+        return Move(amount, (1, 0), (recent + previous, recent))
+
+
+class Roulette1326Model(StrategyModel):
+    """Model of `Roulette1326`. The state is the number of consecutive wins, which
+    selects the `Roulette1326State`.
+    """
+
+    bet_amounts: Tuple[int, ...] = (1, 3, 2, 6)
+
+    def initial_state(self) -> Hashable:
+        return 0
+
+    def play(self, state: Hashable, stake: int) -> Move:
+        assert isinstance(state, int)
+        amount = min(self.bet_amounts[state], stake)
+        if amount > self.limit:
+            raise casino.main.InvalidBet(
+                "Placing this bet violates table min/limit rules."
+            )
+        return Move(amount, (state + 1) % len(self.bet_amounts), 0)
+
+
+STRATEGY_MODELS: Dict[Type[casino.players.Player], Type[StrategyModel]] = {
+    casino.players.RoulettePassenger57: Passenger57Model,
+    casino.players.RouletteMartingale: MartingaleModel,
+    casino.players.RouletteFibonacci: FibonacciModel,
+    casino.players.Roulette1326: Roulette1326Model,
+}
+
+
+class RouletteChain(SessionChain):
+    """The `SessionChain` of a Roulette `StrategyModel`.
+
+    A state is the state of the model, or `STOPPED` once the player has stopped.
+
+    Attributes:
+        model: The `StrategyModel` of the player.
+        outcome: The `Outcome` the player bets on.
+        won: The probability that a bet on `outcome` wins.
+    """
+
+    STOPPED = "stopped"
+
+    def __init__(
+        self, model: StrategyModel, outcome: casino.main.Outcome, won: float
+    ) -> None:
+        self.model = model
+        self.outcome = outcome
+        self.won = won
+        self.gain = outcome.win_amount(model.limit)
+
+    def initial_state(self) -> Hashable:
+        return self.model.initial_state()
+
+    def branches(self, state: Hashable, stake: int) -> Tuple[Branch, ...]:
+        move = self.model.play(state, stake)
+        if move.last:
+            return (Branch(0, self.STOPPED, 1.0),)
+        elif not move.amount:
+            return (Branch(0, move.won, 1.0),)
+        return (
+            Branch(self.outcome.win_amount(move.amount), move.won, self.won),
+            Branch(-move.amount, move.lost, 1.0 - self.won),
+        )
+
+    def stopped(self, state: Hashable) -> bool:
+        return state == self.STOPPED
+
+
+class CrapsStrategyModel(ABC):
+    """Describes the betting strategy of a `CrapsPlayer` subclass which only bets
+    on the Pass Line and Pass Odds, as a finite state machine.
+
+    Attributes:
+        limit: The table limit of the player's bets.
+    """
+
+    def __init__(self, limit: int = 30) -> None:
+        self.limit = limit
+
+    @abstractmethod
+    def initial_state(self) -> Hashable:
+        """Returns the state of the strategy after `Player.reset`."""
+        pass
+
+    @abstractmethod
+    def place(
+        self, point: Optional[int], state: Hashable, stake: int, line: int, odds: int
+    ) -> Tuple[int, int]:
+        """Returns the amounts the player adds to the Pass Line and Pass Odds.
+
+        Args:
+            point: The current point, `None` when the point is off.
+            state: The current state of the strategy.
+            stake: The player's stake before any bet is placed.
+            line: The amount on the Pass Line.
+            odds: The amount on the Pass Odds.
+        """
+        pass
+
+    def settle(self, state: Hashable, name: str, won: bool) -> Hashable:
+        """Returns the state after a bet on ``name`` wins or loses."""
+        return state
+
+
+class CrapsPassModel(CrapsStrategyModel):
+    """Model of `CrapsPass`, which has no state."""
+
+    def initial_state(self) -> Hashable:
+        return None
+
+    def place(
+        self, point: Optional[int], state: Hashable, stake: int, line: int, odds: int
+    ) -> Tuple[int, int]:
+        return (0 if line else 1), 0
+
+
+class CrapsMartingaleModel(CrapsStrategyModel):
+    """Model of `CrapsMartingale`. The state is `loss_count`, which is capped
+    once the Pass Odds bet it doubles reaches the table limit.
+    """
+
+    def initial_state(self) -> Hashable:
+        return 0
+
+    def place(
+        self, point: Optional[int], state: Hashable, stake: int, line: int, odds: int
+    ) -> Tuple[int, int]:
+        assert isinstance(state, int)
+        if stake <= 0:
+            return 0, 0
+        elif not line:
+            return 1, 0
+        elif not odds:
+            amount = min(2 ** state, stake)
+            if amount >= self.limit:
+                amount = self.limit - 1
+            return 0, amount
+        return 0, 0
+
+    def settle(self, state: Hashable, name: str, won: bool) -> Hashable:
+        assert isinstance(state, int)
+        if name != "Pass Odds":
+            return state
+        elif won:
+            return 0
+        # Every bet of at least the limit is the same.
+        return min(state + 1, max(self.limit - 1, 1).bit_length())
+
+
+CRAPS_STRATEGY_MODELS: Dict[Type[casino.players.Player], Type[CrapsStrategyModel]] = {
+    casino.players.CrapsPass: CrapsPassModel,
+    casino.players.CrapsMartingale: CrapsMartingaleModel,
+}
+
+
+def model_for(
+    player_type: Type[casino.players.Player], limit: int = 30
+) -> StrategyModel:
+    """Returns the `StrategyModel` of the Roulette player ``player_type``.
+
+    Subclasses of a supported player are not supported, as they may change the
+    strategy. For example `RouletteSevenReds` extends `RouletteMartingale`.
+
+    Args:
+        player_type: The `Player` subclass to model.
+        limit: The table limit of the player's bets.
+
+    Raises:
+        KeyError: There is no model of ``player_type``.
+    """
+    model = STRATEGY_MODELS.get(player_type)
+    if model is None:
+        raise KeyError(f"No StrategyModel for {player_type.__name__}")
+    return model(limit)
+
+
+def craps_model_for(
+    player_type: Type[casino.players.Player], limit: int = 30
+) -> CrapsStrategyModel:
+    """Returns the `CrapsStrategyModel` of the Craps player ``player_type``.
+
+    See `model_for`.
+    """
+    model = CRAPS_STRATEGY_MODELS.get(player_type)
+    if model is None:
+        raise KeyError(f"No CrapsStrategyModel for {player_type.__name__}")
+    return model(limit)
+
+
+class CrapsChain(SessionChain):
+    """The `SessionChain` of a `CrapsStrategyModel`.
+
+    A state is (point, Pass Line amount, Pass Odds amount, model state).
+
+    Attributes:
+        model: The `CrapsStrategyModel` of the player.
+        throws: Maps each point, `None` when the point is off, to tuples of
+            (event_id, probability, next point) for every `Throw` event_id.
+        point_odds: The odds of Pass Odds bets by point.
+    """
+
+    def __init__(
+        self,
+        model: CrapsStrategyModel,
+        throws: Dict[Optional[int], Tuple[Tuple[int, Fraction, Optional[int]], ...]],
+        point_odds: Dict[int, Fraction],
+    ) -> None:
+        self.model = model
+        self.throws = throws
+        self.point_odds = point_odds
+        # A winning Pass Odds bet pays at most 2:1.
+        self.gain = 2 * model.limit
+
+    def initial_state(self) -> Hashable:
+        return None, 0, 0, self.model.initial_state()
+
+    def branches(self, state: Hashable, stake: int) -> Tuple[Branch, ...]:
+        assert isinstance(state, tuple)
+        point, line, odds, strategy = state
+        add_line, add_odds = self.model.place(point, strategy, stake, line, odds)
+        placed = add_line + add_odds
+        if (
+            add_line
+            and point is not None
+            or add_odds
+            and point is None
+            or placed > stake
+            or line + odds + placed > self.model.limit
+        ):
+            raise casino.main.InvalidBet(
+                "Placing this bet violates table min/limit rules."
+            )
+        line += add_line
+        odds += add_odds
+        pass_odds = Fraction(0) if point is None else self.point_odds[point]
+
+        probabilities: Dict[Tuple[int, Hashable], Fraction] = {}
+        for event_id, probability, next_point in self.throws[point]:
+            default, actions = casino.main.CRAPS_RESOLUTION.lookup(point, event_id)
+            change = -placed
+            next_strategy = strategy
+            working = {"Pass Line": line, "Pass Odds": odds}
+            for name, pays in (
+                ("Pass Line", Fraction(casino.odds.PASS_COME)),
+                ("Pass Odds", pass_odds),
+            ):
+                amount = working[name]
+                action = actions.get(name, default)
+                if not amount or action is None:
+                    continue
+                elif action is casino.main.WIN:
+                    change += amount + int(pays * amount)
+                    next_strategy = self.model.settle(next_strategy, name, True)
+                elif action is casino.main.LOSE:
+                    next_strategy = self.model.settle(next_strategy, name, False)
+                elif action is casino.main.PUSH:
+                    change += amount
+                else:
+                    raise ValueError(f"{name} bets cannot be moved.")
+                working[name] = 0
+            key = (
+                change,
+                (next_point, working["Pass Line"], working["Pass Odds"], next_strategy),
+            )
+            probabilities[key] = probabilities.get(key, Fraction(0)) + probability
+        return tuple(
+            Branch(change, next_state, float(probability))
+            for (change, next_state), probability in probabilities.items()
+        )
+
+    def has_bets(self, state: Hashable) -> bool:
+        assert isinstance(state, tuple)
+        return bool(state[1] or state[2])
+
+
+@dataclass
+class SessionDistribution:
+    """The exact probability distribution of each `Simulator` session metric.
+
+    Each attribute maps a metric value to its probability.
+
+    Attributes:
+        durations: The number of cycles played.
+        maxima: The highest stake after any cycle of the session.
+        end_stakes: The stake at the end of the session.
+    """
+
+    durations: Dict[int, float] = field(default_factory=dict)
+    maxima: Dict[int, float] = field(default_factory=dict)
+    end_stakes: Dict[int, float] = field(default_factory=dict)
+
+    def add(
+        self, duration: int, maximum: int, end_stake: int, probability: float
+    ) -> None:
+        """Adds ``probability`` to the probability of each given metric value."""
+        for metric, value in (
+            (self.durations, duration),
+            (self.maxima, maximum),
+            (self.end_stakes, end_stake),
+        ):
+            metric[value] = metric.get(value, 0) + probability
+
+    def mean(self, metric: str) -> float:
+        """Returns the expected value of ``metric``.
+
+        Args:
+            metric: One of "durations", "maxima" or "end_stakes".
+        """
+        return float(sum(value * p for value, p in getattr(self, metric).items()))
+
+    def stdev(self, metric: str) -> float:
+        """Returns the standard deviation of ``metric``."""
+        mean = self.mean(metric)
+        return math.sqrt(
+            sum((value - mean) ** 2 * p for value, p in getattr(self, metric).items())
+        )
+
+    def z_scores(self, sim: casino.main.Simulator) -> Dict[str, float]:
+        """Compares the statistics gathered by a `Simulator` with this
+        distribution.
+
+        Args:
+            sim: A `Simulator` which has gathered statistics of the same player
+                and session parameters.
+
+        Returns:
+            For each metric, the difference between the sample mean and the exact
+            mean in standard errors. Each is approximately standard normal if the
+            simulation and this distribution agree.
+        """
+        scores = {}
+        for metric in ("durations", "maxima", "end_stakes"):
+            samples = getattr(sim, metric)
+            error = self.stdev(metric) / math.sqrt(len(samples))
+            difference = samples.mean() - self.mean(metric)
+            if error:
+                scores[metric] = difference / error
+            else:
+                scores[metric] = (
+                    math.copysign(math.inf, difference) if difference else 0.0
+                )
+        return scores
+
+
+class AnalyticRoulette:
+    """Computes the exact distribution of the session metrics of a Roulette
+    player with `evaluate_chain`.
+
+    The probability that a bet wins is the fraction of the `Bin`s of a `Wheel`
+    populated by `BinBuilder` which contain its `Outcome`.
+
+    Attributes:
+        wheel: The `Wheel` which provides `Outcome`s and their probabilities.
+        limit: The table limit of the player's bets.
+    """
+
+    def __init__(self, wheel: casino.main.Wheel, limit: int = 30) -> None:
+        self.wheel = wheel
+        self.limit = limit
+
+    def win_probability(self, outcome: casino.main.Outcome) -> float:
+        """Returns the probability that a bet on ``outcome`` wins."""
+        wins = sum(1 for bin_ in self.wheel.bins if outcome in bin_)
+        return wins / len(self.wheel.bins)
+
+    def session_distribution(
+        self,
+        player_type: Type[casino.players.Player],
+        init_stake: int = 100,
+        duration: int = 250,
+    ) -> SessionDistribution:
+        """Computes the distribution of the metrics of a session of
+        ``player_type``, as recorded by `Simulator.gather`.
+
+        Args:
+            player_type: The `Player` subclass to evaluate.
+            init_stake: The stake each session starts with.
+            duration: The maximum number of cycles of a session.
+
+        Returns:
+            The `SessionDistribution` of the session metrics.
+
+        Raises:
+            KeyError: There is no `StrategyModel` for ``player_type``.
+            InvalidBet: The strategy places a bet which violates the table limit
+                rules and does not handle it.
+        """
+        return self.evaluate(model_for(player_type, self.limit), init_stake, duration)
+
+    def evaluate(
+        self, model: StrategyModel, init_stake: int = 100, duration: int = 250
+    ) -> SessionDistribution:
+        """Computes the distribution of the session metrics of ``model``.
+
+        See `session_distribution`.
+        """
+        outcome = self.wheel.get_outcome(model.outcome_name)
+        chain = RouletteChain(model, outcome, self.win_probability(outcome))
+        return evaluate_chain(chain, init_stake, duration)
+
+    def simulator_distribution(self, sim: casino.main.Simulator) -> SessionDistribution:
+        """Computes the distribution of the session metrics gathered by ``sim``,
+        from its player's type, `Simulator.init_stake` and
+        `Simulator.init_duration`.
+
+        The table limit of the player is used in place of `limit`.
+        """
+        limit = sim.game.table.limit_for(sim.player)
+        model = model_for(type(sim.player), limit)
+        return self.evaluate(model, sim.init_stake, sim.init_duration)
+
+
+class AnalyticCraps:
+    """Computes exact results of Craps line bets and the exact distribution of
+    the session metrics of a Craps player.
+
+    The game is a Markov chain over the point. The probability of each throw
+    event_id is its share of the `Throw`s of a `Dice` populated by
+    `ThrowBuilder`, and the next point is found by updating a `CrapsGame` in
+    each `CrapsGameState` with the `Throw`. Line bets are resolved by
+    `CRAPS_RESOLUTION`.
+
+    Attributes:
+        dice: The `Dice` which provides the `Throw`s.
+        limit: The table limit of the player's bets.
+        throws: Maps each point, `None` when the point is off, to tuples of
+            (event_id, probability, next point) for every `Throw` event_id.
+        point_odds: The odds of Pass Odds bets by point.
+    """
+
+    throws: Dict[Optional[int], Tuple[Tuple[int, Fraction, Optional[int]], ...]]
+    point_odds: Dict[int, Fraction]
+
+    def __init__(self, dice: casino.main.Dice, limit: int = 30) -> None:
+        self.dice = dice
+        self.limit = limit
+        counts = Counter(throw.event_id for throw in dice.throw_sequence)
+        examples = {throw.event_id: throw for throw in dice.throw_sequence}
+        game = casino.main.CrapsGame(dice, casino.main.Table())
+        self.throws = {}
+        self.point_odds = {}
+        for point in (None,) + casino.main.CrapsResolutionTable.POINTS:
+            throws = []
+            for event_id in sorted(counts):
+                game.state = self._game_state(point, game)
+                examples[event_id].update_game(game)
+                probability = Fraction(counts[event_id], len(dice.throw_sequence))
+                throws.append((event_id, probability, game.state.current_point))
+            self.throws[point] = tuple(throws)
+            odds = self._game_state(point, game).point_outcome_odds()
+            if point is not None and odds is not None:
+                self.point_odds[point] = odds
+
+    @staticmethod
+    def _game_state(
+        point: Optional[int], game: casino.main.CrapsGame
+    ) -> casino.main.CrapsGameState:
+        """Returns a new `CrapsGameState` of ``game`` with the given point."""
+        if point is None:
+            return casino.main.CrapsGamePointOff(game)
+        return casino.main.CrapsGamePointOn(point, game)
+
+    def line_bet_value(self, name: str = "Pass Line") -> Fraction:
+        """Returns the expected net win of a bet of 1 on a line bet made on the
+        come out roll.
+
+        Args:
+            name: "Pass Line" or "Don't Pass Line".
+        """
+        pays = Fraction(
+            casino.odds.PASS_COME if name == "Pass Line" else casino.odds.DONT_PASS_COME
+        )
+        return self._solve(name, {"win": pays, "lose": Fraction(-1)}, Fraction(0))
+
+    def house_edge(self, name: str = "Pass Line") -> Fraction:
+        """Returns the house edge of a line bet, the expected loss of a bet of 1.
+
+        E.g. 7/495 for the Pass Line.
+        """
+        return -self.line_bet_value(name)
+
+    def expected_throws(self, name: str = "Pass Line") -> Fraction:
+        """Returns the expected number of throws until a line bet made on the
+        come out roll is resolved. For the Pass Line this is the expected length
+        of a game.
+        """
+        return self._solve(name, {}, Fraction(1))
+
+    def _solve(
+        self, name: str, rewards: Dict[str, Fraction], per_throw: Fraction
+    ) -> Fraction:
+        """Solves for the expected total reward of a bet on ``name`` made on the
+        come out roll, by Gaussian elimination over the points.
+
+        Args:
+            name: The name of the line bet.
+            rewards: The reward by `BetAction.kind` when the bet is resolved.
+                Kinds which are not included are worth zero.
+            per_throw: The reward of every throw until the bet is resolved.
+
+        Raises:
+            ValueError: The bet is moved by a throw, so is not a line bet.
+        """
+        points: List[Optional[int]] = list(self.throws)
+        index = {point: i for i, point in enumerate(points)}
+        # Each row is the equation value(point) - sum(p * value(next)) = reward.
+        rows = []
+        for point in points:
+            row = [Fraction(0)] * (len(points) + 1)
+            row[index[point]] += 1
+            row[-1] += per_throw
+            for event_id, probability, next_point in self.throws[point]:
+                default, actions = casino.main.CRAPS_RESOLUTION.lookup(point, event_id)
+                action = actions.get(name, default)
+                if action is None:
+                    row[index[next_point]] -= probability
+                elif action.kind == "move":
+                    raise ValueError(f"{name} bets are moved, not resolved.")
+                else:
+                    row[-1] += probability * rewards.get(action.kind, Fraction(0))
+            rows.append(row)
+        for column in range(len(points)):
+            pivot = next(r for r in range(column, len(rows)) if rows[r][column])
+            rows[column], rows[pivot] = rows[pivot], rows[column]
+            rows[column] = [value / rows[column][column] for value in rows[column]]
+            for r in range(len(rows)):
+                if r != column and rows[r][column]:
+                    factor = rows[r][column]
+                    rows[r] = [a - factor * b for a, b in zip(rows[r], rows[column])]
+        return rows[index[None]][-1]
+
+    def session_distribution(
+        self,
+        player_type: Type[casino.players.Player],
+        init_stake: int = 100,
+        duration: int = 250,
+    ) -> SessionDistribution:
+        """Computes the distribution of the metrics of a session of
+        ``player_type``, as recorded by `Simulator.gather`.
+
+        A session continues past ``duration`` throws until the player's bets are
+        resolved, so the distribution of its duration has an unbounded tail. It
+        is computed until less than `TAIL_TOLERANCE` of the probability remains.
+
+        Args:
+            player_type: The `CrapsPlayer` subclass to evaluate.
+            init_stake: The stake each session starts with.
+            duration: The number of throws (`Player.rounds_to_go`) of a session.
+
+        Returns:
+            The `SessionDistribution` of the session metrics.
+
+        Raises:
+            KeyError: There is no `CrapsStrategyModel` for ``player_type``.
+            InvalidBet: The strategy places a bet which violates the table rules.
+        """
+        model = craps_model_for(player_type, self.limit)
+        return self.evaluate(model, init_stake, duration)
+
+    def evaluate(
+        self, model: CrapsStrategyModel, init_stake: int = 100, duration: int = 250
+    ) -> SessionDistribution:
+        """Computes the distribution of the session metrics of ``model``.
+
+        See `session_distribution`.
+        """
+        chain = CrapsChain(model, self.throws, self.point_odds)
+        return evaluate_chain(chain, init_stake, duration)
+
+    def simulator_distribution(self, sim: casino.main.Simulator) -> SessionDistribution:
+        """Computes the distribution of the session metrics gathered by ``sim``.
+
+        See `AnalyticRoulette.simulator_distribution`.
+        """
+        limit = sim.game.table.limit_for(sim.player)
+        model = craps_model_for(type(sim.player), limit)
+        return self.evaluate(model, sim.init_stake, sim.init_duration)
+
+
+TAIL_TOLERANCE = 1e-15
+NEGLIGIBLE = 1e-20
+
+
+class _Sessions:
+    """The probabilities of the sessions in one state of a `SessionChain` by
+    (stake, maximum), held in a square array covering a window of both.
+
+    Attributes:
+        first: The stake and maximum of the first row and column.
+        stop: One more than the highest stake or maximum which has been added.
+        probabilities: The array of probabilities.
+    """
+
+    __slots__ = ("first", "stop", "probabilities")
+
+    def __init__(self, first: int) -> None:
+        self.first = self.stop = first
+        self.probabilities = np.zeros((0, 0))
+
+    def add(self, stake: int, maximum: int, block: np.ndarray) -> None:
+        """Adds the probabilities of ``block``, whose first row has ``stake`` and
+        first column ``maximum``, widening the window if needed.
+        """
+        rows, columns = block.shape
+        first = min(self.first, stake, maximum)
+        self.stop = max(self.stop, stake + rows, maximum + columns)
+        if first < self.first or self.stop > self.first + len(self.probabilities):
+            size = self.stop - first + (self.stop - first) // 4
+            widened = np.zeros((size, size))
+            offset = self.first - first
+            length = len(self.probabilities)
+            widened[offset : offset + length, offset : offset + length] = (
+                self.probabilities
+            )
+            self.first, self.probabilities = first, widened
+        row, column = stake - self.first, maximum - self.first
+        self.probabilities[row : row + rows, column : column + columns] += block
+
+    def stakes(self) -> np.ndarray:
+        """Drops negligible probabilities, then returns the stakes with a nonzero
+        probability, in ascending order.
+        """
+        used = self.probabilities[: self.stop - self.first, : self.stop - self.first]
+        used[used < NEGLIGIBLE] = 0.0
+        columns = np.flatnonzero(used.any(axis=0))
+        self.stop = self.first + (int(columns[-1]) + 1 if len(columns) else 0)
+        return np.flatnonzero(used.any(axis=1)) + self.first
+
+    def rows(self, first: int, stop: int) -> np.ndarray:
+        """Returns the probabilities of stakes ``first`` to ``stop`` by maximum,
+        from a maximum of ``first``.
+        """
+        start = first - self.first
+        return self.probabilities[
+            start : stop - self.first, start : self.stop - self.first
+        ]
+
+
+def evaluate_chain(
+    chain: SessionChain, init_stake: int, duration: int
+) -> SessionDistribution:
+    """Computes the distribution of the session metrics of a `SessionChain`, as
+    recorded by `Simulator.gather`.
+
+    The sessions still in play are kept as an array of probabilities by (stake,
+    maximum) for each state of the chain, which is advanced one cycle at a time.
+    Stakes with the same `Branch`es are advanced together, and sessions which
+    end are added to the result. A session ends once the player is out of
+    rounds or stake, unless it still has bets on the table, or when it stops.
+    Sessions which have not ended after ``duration`` cycles are followed until
+    less than `TAIL_TOLERANCE` of the probability remains.
+
+    Args:
+        chain: The `SessionChain` of the player and game.
+        init_stake: The stake each session starts with.
+        duration: The number of rounds (`Player.rounds_to_go`) of a session.
+
+    Returns:
+        The `SessionDistribution` of the session metrics.
+    """
+    result = SessionDistribution()
+    if init_stake <= 0 or duration <= 0:
+        result.add(0, init_stake, init_stake, 1.0)
+        return result
+
+    durations: Dict[int, float] = {}
+    maxima = np.zeros(init_stake + chain.gain + 1)
+    end_stakes = np.zeros(len(maxima))
+    cache: Dict[Tuple[Hashable, int], Tuple[Branch, ...]] = {}
+
+    def settle(
+        cycle: int, state: Hashable, stake: int, maximum: int, block: np.ndarray
+    ) -> None:
+        """Ends the sessions of ``block`` which are no longer playing and keeps
+        the rest in `following`."""
+        nonlocal maxima, end_stakes
+        if chain.has_bets(state):
+            ended = 0
+        elif cycle >= duration or chain.stopped(state):
+            ended = len(block)
+        else:
+            ended = max(0, min(len(block), 1 - stake))
+        if ended:
+            stop = max(maximum + block.shape[1], stake + ended)
+            if stop > len(maxima):
+                maxima = _widen(maxima, stop + stop // 4)
+                end_stakes = _widen(end_stakes, len(maxima))
+            probabilities = block[:ended].sum(axis=1)
+            durations[cycle] = durations.get(cycle, 0.0) + float(probabilities.sum())
+            maxima[maximum : maximum + block.shape[1]] += block[:ended].sum(axis=0)
+            end_stakes[stake : stake + ended] += probabilities
+        if ended < len(block):
+            sessions = following.get(state)
+            if sessions is None:
+                sessions = following[state] = _Sessions(stake + ended)
+            sessions.add(stake + ended, maximum, block[ended:])
+
+    # The initial stake is not a maximum, so the first cycle sets it.
+    following: Dict[Hashable, _Sessions] = {}
+    for change, state, probability in chain.branches(chain.initial_state(), init_stake):
+        stake = init_stake + change
+        settle(1, state, stake, stake, np.full((1, 1), probability))
+    live = following
+    cycle = 1
+    while live:
+        cycle += 1
+        if cycle > duration:
+            remaining = sum(s.probabilities.sum() for s in live.values())
+            if remaining < TAIL_TOLERANCE:
+                break
+        following = {}
+        for state, sessions in live.items():
+            for first, stop, branches in _segments(chain, state, sessions, cache):
+                rows = sessions.rows(first, stop)
+                for change, next_state, probability in branches:
+                    block = rows * probability
+                    if change > 0:
+                        block = _widen(block, stop - first + change, axis=1)
+                        # Column i is the stake of row i, and no maximum is below
+                        # its stake, so the maxima of the `change` diagonals from
+                        # it rise to the new stake.
+                        index = np.arange(len(block))[:, np.newaxis]
+                        band = index + np.arange(change + 1)
+                        risen = np.take_along_axis(block, band, axis=1)
+                        risen[:, -1] = risen.sum(axis=1)
+                        risen[:, :-1] = 0.0
+                        np.put_along_axis(block, band, risen, axis=1)
+                    settle(cycle, next_state, first + change, first, block)
+        live = following
+
+    result.durations = durations
+    result.maxima = _nonzero(maxima)
+    result.end_stakes = _nonzero(end_stakes)
+    return result
+
+
+def _segments(
+    chain: SessionChain,
+    state: Hashable,
+    sessions: _Sessions,
+    cache: Dict[Tuple[Hashable, int], Tuple[Branch, ...]],
+) -> Iterator[Tuple[int, int, Tuple[Branch, ...]]]:
+    """Groups consecutive stakes of ``sessions`` for which ``chain`` has the same
+    `Branch`es in ``state``.
+
+    Args:
+        chain: The `SessionChain` of the player and game.
+        state: The state of the chain.
+        sessions: The sessions in ``state``.
+        cache: A cache of the `Branch`es of each (state, stake).
+
+    Yields:
+        Tuples of (first stake, stop stake, branches) where the branches are the
+        same for every stake in the range.
+    """
+    first = stop = -1
+    current: Optional[Tuple[Branch, ...]] = None
+    for stake in sessions.stakes().tolist():
+        branches = cache.get((state, stake))
+        if branches is None:
+            branches = cache[state, stake] = chain.branches(state, stake)
+        if stake != stop or branches != current:
+            if current is not None:
+                yield first, stop, current
+            first, current = stake, branches
+        stop = stake + 1
+    if current is not None:
+        yield first, stop, current
+
+
+def _widen(array: np.ndarray, size: int, axis: int = 0) -> np.ndarray:
+    """Returns ``array`` padded with zeros to ``size`` entries along ``axis``."""
+    if array.shape[axis] >= size:
+        return array
+    padding = [(0, 0)] * array.ndim
+    padding[axis] = (0, size - array.shape[axis])
+    return np.pad(array, padding)
+
+
+def _nonzero(array: np.ndarray) -> Dict[int, float]:
+    """Returns a `dict` of the nonzero entries of a 1D ``array`` by index."""
+    return {int(index): float(array[index]) for index in np.flatnonzero(array)}
@@ -0,0 +1,244 @@
+"""Command line interface for running `BulkSimulator` sweeps.
+
+Each player's summary row is written as soon as all its sessions are gathered,
+so a long sweep which is killed can be continued with ``--resume``, which skips
+the players already in the output file. With ``--checkpoint`` the sessions of
+every completed task are recorded as well, so a sweep resumed from its
+checkpoint only re-runs the tasks which were in progress. With a ``--seed``
+every player is seeded independently, so a resumed sweep writes the same rows
+as an uninterrupted one.
+
+E.g. ``casino-sim --game roulette --samples 10000 --workers 8 --seed 42
+--output roulette.csv``.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, TextIO, Type, Union
+
+import casino.main
+import casino.players
+
+GAMES = {
+    "roulette": (casino.main.RouletteGame, casino.main.Wheel),
+    "craps": (casino.main.CrapsGame, casino.main.Dice),
+}
+FORMATS = ("csv", "jsonl")
+
+
+def players_for(game: str) -> List[Type[casino.players.Player]]:
+    """Returns every concrete `Player` subclass which plays ``game``, by name.
+
+    Args:
+        game: A key of `GAMES`.
+    """
+    return casino.main.BulkSimulator.get_all_players(GAMES[game][0])
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Returns the `argparse.ArgumentParser` of the command line options."""
+    parser = argparse.ArgumentParser(
+        prog="casino-sim",
+        description="Simulates sessions of casino betting strategies.",
+    )
+    parser.add_argument("--game", choices=sorted(GAMES), default="roulette")
+    parser.add_argument(
+        "--players",
+        nargs="+",
+        metavar="PLAYER",
+        help="The class names of the players to simulate. Default: every player "
+        "of the game.",
+    )
+    parser.add_argument(
+        "--list-players", action="store_true", help="List the players and exit."
+    )
+    parser.add_argument("--samples", type=int, default=50, help="Sessions per player.")
+    parser.add_argument(
+        "--duration", type=int, default=250, help="Rounds to go of each session."
+    )
+    parser.add_argument(
+        "--stake", type=int, default=100, help="Initial stake of each session."
+    )
+    parser.add_argument("--limit", type=int, default=30, help="The table limit.")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--chunk-size", type=int, help="The most samples in each worker task."
+    )
+    parser.add_argument("--seed", help="Root seed. An integer, or any other string.")
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument(
+        "--output", help="The file of the summary rows. Default: standard output."
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Append to --output, skipping the players already in it. Can not be "
+        "combined with --metadata or --results.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="Record completed work in this file, and resume from it if it exists.",
+    )
+    parser.add_argument(
+        "--metadata", help="Save the settings of the run to this JSON file."
+    )
+    parser.add_argument(
+        "--results", help="Save every session's metrics to this columnar file."
+    )
+    parser.add_argument("--quiet", action="store_true", help="Do not report progress.")
+    return parser
+
+
+def parse_seed(seed: Optional[str]) -> Union[int, str, None]:
+    """Returns ``seed`` as an `int` if it is a number, so "42" and 42 seed the
+    same run."""
+    if seed is None:
+        return None
+    try:
+        return int(seed)
+    except ValueError:
+        return seed
+
+
+def completed_players(file_path: str, output_format: str) -> List[str]:
+    """Returns the players with a row in an existing output file."""
+    if not os.path.exists(file_path):
+        return []
+    with open(file_path, newline="") as output_file:
+        if output_format == "csv":
+            return [row["player"] for row in csv.DictReader(output_file)]
+        return [json.loads(line)["player"] for line in output_file if line.strip()]
+
+
+class RowWriter(casino.main.BulkProgress):
+    """Writes each player's summary row as soon as it is complete, and reports
+    progress.
+
+    Attributes:
+        output: The text file the rows are written to.
+        output_format: One of `FORMATS`.
+        log: Optional; The text file progress is reported to.
+        header: Whether a CSV header is still to be written.
+    """
+
+    def __init__(
+        self,
+        output: TextIO,
+        output_format: str,
+        log: Optional[TextIO] = None,
+        header: bool = True,
+    ) -> None:
+        self.output = output
+        self.output_format = output_format
+        self.log = log
+        self.header = header
+
+    def chunk_done(
+        self, result: casino.main.SimulationResult, done: int, total: int
+    ) -> None:
+        if self.log is not None:
+            print(
+                f"[{done}/{total}] {result.player} chunk {result.chunk}: "
+                f"{len(result.durations)} sessions",
+                file=self.log,
+                flush=True,
+            )
+
+    def player_done(self, result: casino.main.SimulationResult, row: Dict) -> None:
+        if self.output_format == "csv":
+            writer = csv.DictWriter(self.output, fieldnames=list(row))
+            if self.header:
+                writer.writeheader()
+                self.header = False
+            writer.writerow(row)
+        else:
+            self.output.write(json.dumps(row) + "\n")
+        self.output.flush()
+        if self.log is not None:
+            print(f"{result.player} done", file=self.log, flush=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the command line interface.
+
+    Args:
+        argv: Optional; The arguments, excluding the program name. Defaults to
+            `sys.argv`.
+
+    Returns:
+        The exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    available = {player.__name__: player for player in players_for(args.game)}
+    if args.list_players:
+        print("\n".join(available))
+        return 0
+    if args.resume and not args.output:
+        parser.error("--resume requires --output.")
+    if args.resume and (args.results or args.metadata):
+        # The resumed run only holds the players which were not yet done.
+        parser.error("--resume can not be combined with --results or --metadata.")
+    if args.samples < 2:
+        parser.error("--samples must be at least 2.")
+    unknown = set(args.players or ()) - set(available)
+    if unknown:
+        parser.error(f"Unknown {args.game} players: {', '.join(sorted(unknown))}")
+
+    players = [available[name] for name in args.players or available]
+    header = True
+    if args.resume:
+        done = set(completed_players(args.output, args.format))
+        players = [player for player in players if player.__name__ not in done]
+        header = not os.path.exists(args.output) or not os.path.getsize(args.output)
+
+    game_type, factory_type = GAMES[args.game]
+    table = casino.main.Table()
+    game = game_type(factory_type(), table)  # type: ignore
+    table.set_game(game)
+    try:
+        b_sim = casino.main.BulkSimulator(
+            game, parse_seed(args.seed), args.workers, args.chunk_size
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    b_sim.players = players
+    b_sim.samples = args.samples
+    b_sim.init_duration = args.duration
+    b_sim.init_stake = args.stake
+    b_sim.table_limit = args.limit
+    b_sim.checkpoint_path = args.checkpoint
+    if args.checkpoint and players:
+        try:
+            # Only opened to check it is the checkpoint of a run like this one.
+            with casino.main.BulkCheckpoint(args.checkpoint, b_sim.metadata()):
+                pass
+        except ValueError as error:
+            parser.error(str(error))
+
+    log = None if args.quiet else sys.stderr
+    output: TextIO
+    if args.output:
+        output = open(args.output, "a" if args.resume else "w", newline="")
+    else:
+        output = sys.stdout
+    try:
+        b_sim.progress = RowWriter(output, args.format, log, header)
+        if players:
+            b_sim.gather_all()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if args.metadata:
+        b_sim.save_metadata(args.metadata)
+    if args.results:
+        b_sim.save_results(args.results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,32 @@
 from __future__ import annotations
 
+import array
+import bisect
+import concurrent.futures
+import contextlib
 import csv
+import hashlib
+import inspect
+import json
 import math
+import mmap
+import os
 import random
+import sys
+import time
 import typing
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from fractions import Fraction
 from typing import (
+    ClassVar,
     Tuple,
     FrozenSet,
     Iterator,
     Iterable,
+    NamedTuple,
     Optional,
+    Sequence,
     Dict,
     List,
     Type,
@@ -22,6 +36,7 @@ from typing import (
 
 import casino.odds
 import casino.players
+import casino.results
 
 
 class Outcome:
@@ -42,13 +57,28 @@ class Outcome:
         outcome_odds: The payout odds of this outcome. Most odds are stated as 1:1 or
             17:1. Either the numerator (17) is provided and the denominator is
             assumed to be 1, or an exact `Fraction` object of the odds is provided.
+        id: A dense integer identifier assigned when this `Outcome` is registered
+            with a `RandomEventFactory`, e.g. by `Wheel.add_outcomes`. `None` until
+            registered.
+
+    Outcomes are slotted and their `name` and `odds` must not be changed once
+    set, so a single instance can be shared by every `Bet` on it. `intern`
+    returns that shared instance for a given class, name and odds.
     """
 
+    __slots__ = ("name", "odds", "id")
+
+    name: str
+    odds: Fraction
+    id: Optional[int]
+    _interned: ClassVar[Dict[Tuple[type, str, Fraction], "Outcome"]] = dict()
+
     def __init__(self, name: str, outcome_odds: Union[Fraction, int]) -> None:
         """Sets the instance `name` and `odds` from the parameters. An appropriate
         `Fraction` to represent the odds is created.
         """
         self.name = name
+        self.id = None
         if isinstance(outcome_odds, int):
             self.odds = Fraction(outcome_odds, 1)
         elif isinstance(outcome_odds, Fraction):
@@ -71,6 +101,26 @@ class Outcome:
         """
         return int(self.odds * amount)
 
+    @classmethod
+    def intern(cls, name: str, outcome_odds: Union[Fraction, int]) -> "Outcome":
+        """Returns the shared instance of this class with the given name and odds,
+        creating it on first use.
+
+        Players use this for outcomes they create themselves, e.g. the
+        "Pass Line" `Outcome` of each `Bet` placed by `CrapsPass`, rather than
+        creating a new `Outcome` per bet.
+
+        Args:
+            name: The name of the `Outcome`.
+            outcome_odds: The payout odds of the `Outcome`.
+        """
+        key = (cls, name, Fraction(outcome_odds))
+        outcome = cls._interned.get(key)
+        if outcome is None:
+            outcome = cls(name, outcome_odds)
+            cls._interned[key] = outcome
+        return outcome
+
     def __eq__(self, other: object) -> bool:
         """Compares the `name` attributes of `self` and ``other``.
 
@@ -121,10 +171,11 @@ class OutcomeField(Outcome):
         outcome_odds: The payout odds of this outcome.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, outcome_odds: Union[Fraction, int]) -> None:
-        """Sets the instance `name` and `odds` from the parameters. The odds here
-        are subject to change depending on a `RandomEvent` provided when calculating
-        `self.win_amount`.
+        """Sets the instance `name` and `odds` from the parameters. The odds used
+        depend on a `RandomEvent` provided when calculating `self.win_amount`.
         """
         super(OutcomeField, self).__init__(name, outcome_odds)
 
@@ -140,15 +191,16 @@ class OutcomeField(Outcome):
             event: An optional `Throw` instance that determines the actual odds
                 to use. If not provided, this `Outcome` objects odds are used.
         """
+        odds = self.odds
         if event:
             if event.event_id in {3, 4, 9, 10, 11}:
-                self.odds = Fraction(1, 1)
+                odds = Fraction(1, 1)
             elif event.event_id in {2, 12}:
-                self.odds = Fraction(2, 1)
+                odds = Fraction(2, 1)
             else:
                 raise ValueError(f"Throw is not a 'Field' throw: {event}")
 
-        return super(OutcomeField, self).win_amount(amount)
+        return int(odds * amount)
 
     def __str__(self) -> str:
         return f"{self.name} (1:1, 2 and 12 2:1)"
@@ -163,10 +215,11 @@ class OutcomeHorn(Outcome):
         outcome_odds: The payout odds of this outcome.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, outcome_odds: Union[Fraction, int]) -> None:
-        """Sets the instance `name` and `odds` from the parameters. The odds here
-        are subject to change depending on a `RandomEvent` provided when calculating
-        `self.win_amount`.
+        """Sets the instance `name` and `odds` from the parameters. The odds used
+        depend on a `RandomEvent` provided when calculating `self.win_amount`.
         """
         super(OutcomeHorn, self).__init__(name, outcome_odds)
 
@@ -182,15 +235,16 @@ class OutcomeHorn(Outcome):
             event: An optional `Throw` instance that determines the actual odds
                 to use. If not provided, this `Outcome` objects odds are used.
         """
+        odds = self.odds
         if event:
             if event.event_id in {2, 12}:
-                self.odds = Fraction(27, 4)
+                odds = Fraction(27, 4)
             elif event.event_id in {3, 11}:
-                self.odds = Fraction(3, 1)
+                odds = Fraction(3, 1)
             else:
                 raise ValueError(f"Throw is not a 'Horn' throw: {event}")
 
-        return super(OutcomeHorn, self).win_amount(amount)
+        return int(odds * amount)
 
     def __str__(self):
         return f"{self.name} (27:4, 3:1)"
@@ -211,6 +265,8 @@ class RandomEvent:
         event_id: An integer event identifier to be defined in subclasses.
     """
 
+    __slots__ = ("outcomes", "_event_id")
+
     outcomes: FrozenSet[Outcome]
     _event_id: Optional[int]
 
@@ -266,19 +322,51 @@ class Bin(RandomEvent):
     Attributes:
         outcomes: A collection of `Outcome` instances in this `Bin`.
         event_id: An integer event identifier (currently not used for `Bin`).
+        mask: A bitmask of the `Outcome.id` of every registered `Outcome` in this
+            `Bin`. Bit ``n`` is set if the `Outcome` with id ``n`` wins.
     """
 
+    __slots__ = ("mask",)
+
+    mask: int
+
     def __init__(self, outcomes: Iterable[Outcome] = None) -> None:
         """Creates an empty `Bin` and initialise a frozenset to store added
         `Outcomes`.
         """
+        self.mask = 0
         super(Bin, self).__init__(outcomes)
+        self._add_to_mask(self.outcomes)
 
     @property
     def event_id(self) -> Optional[int]:
         """There is no current use for a `Bin.event_id`."""
         return None
 
+    def add(self, outcomes: Iterable[Outcome]) -> None:
+        """Adds the given `Outcomes` to this `Bin` and sets the bit of each
+        registered `Outcome` in `mask`.
+
+        Args:
+            outcomes: An iterable containing one or more `Outcome` instances to
+            add to this `Bin`.
+        """
+        outcomes = frozenset(outcomes)
+        super(Bin, self).add(outcomes)
+        self._add_to_mask(outcomes)
+
+    def _add_to_mask(self, outcomes: Iterable[Outcome]) -> None:
+        for outcome in outcomes:
+            if outcome.id is not None:
+                self.mask |= 1 << outcome.id
+
+    def __contains__(self, item: Outcome) -> bool:
+        """Tests the bit of a registered ``item`` in `mask`. Outcomes without an
+        id fall back to a lookup in `outcomes`."""
+        if item.id is None:
+            return item in self.outcomes
+        return bool(self.mask >> item.id & 1)
+
 
 class Throw(RandomEvent):
     """The `Throw` class is the superclass for the various throws of the dice.
@@ -301,15 +389,33 @@ class Throw(RandomEvent):
             throws resolve hardways bets, so this may be empty.
         lose_hardway: A `set` of hardways `Outcome`s that lose this `Throw`. Not all
             throws resolve hardways bets, so this may be empty.
+        propositions: Maps the name of every one-roll and hardways `Outcome`
+            resolved by this `Throw` to `True` if it wins and `False` if it loses.
+
+    Throws are slotted and hold their groups of outcomes as immutable frozensets.
     """
 
+    __slots__ = (
+        "d1",
+        "d2",
+        "key",
+        "winners",
+        "losers",
+        "win_one_roll",
+        "lose_one_roll",
+        "win_hardway",
+        "lose_hardway",
+        "propositions",
+    )
+
     key: Tuple[int, int]
-    winners: Set[Outcome]
-    losers: Set[Outcome]
-    win_one_roll: Set[Outcome]
-    lose_one_roll: Set[Outcome]
-    win_hardway: Set[Outcome]
-    lose_hardway: Set[Outcome]
+    winners: FrozenSet[Outcome]
+    losers: FrozenSet[Outcome]
+    win_one_roll: FrozenSet[Outcome]
+    lose_one_roll: FrozenSet[Outcome]
+    win_hardway: FrozenSet[Outcome]
+    lose_hardway: FrozenSet[Outcome]
+    propositions: Dict[str, bool]
 
     def __init__(self, d1: int, d2: int, outcomes: Iterable[Outcome] = None) -> None:
         """Creates this throw, and associates the given `Outcome` instances that
@@ -319,12 +425,13 @@ class Throw(RandomEvent):
         self.d1 = d1
         self.d2 = d2
         self.key = (d1, d2)
-        self.winners = set(self.outcomes) if self.outcomes else set()
-        self.losers = set()
-        self.win_one_roll = set()
-        self.lose_one_roll = set()
-        self.win_hardway = set()
-        self.lose_hardway = set()
+        self.winners = self.outcomes
+        self.losers = frozenset()
+        self.win_one_roll = frozenset()
+        self.lose_one_roll = frozenset()
+        self.win_hardway = frozenset()
+        self.lose_hardway = frozenset()
+        self.propositions = dict()
 
     @property
     def event_id(self) -> int:
@@ -335,7 +442,8 @@ class Throw(RandomEvent):
 
     def add(self, outcomes: Iterable[Outcome]) -> None:
         """Ensures any ``outcomes`` added are also added to the `Throw.winners` set."""
-        self.winners |= set(outcomes)
+        outcomes = frozenset(outcomes)
+        self.winners |= outcomes
         super(Throw, self).add(outcomes)
 
     def add_one_roll(self, winners: Set[Outcome], losers: Set[Outcome]) -> None:
@@ -350,6 +458,7 @@ class Throw(RandomEvent):
         self.lose_one_roll |= losers
         self.winners |= winners
         self.losers |= losers
+        self._add_propositions(winners, losers)
 
     def add_hardways(self, winners: Set[Outcome], losers: Set[Outcome]) -> None:
         """Adds outcomes to the hardways winners and losers sets. Also adds those
@@ -363,6 +472,11 @@ class Throw(RandomEvent):
         self.lose_hardway |= losers
         self.winners |= winners
         self.losers |= losers
+        self._add_propositions(winners, losers)
+
+    def _add_propositions(self, winners: Set[Outcome], losers: Set[Outcome]) -> None:
+        self.propositions.update({outcome.name: False for outcome in losers})
+        self.propositions.update({outcome.name: True for outcome in winners})
 
     def is_hard(self) -> bool:
         """Helps to determine if hardways bets have been won or lost.
@@ -372,45 +486,24 @@ class Throw(RandomEvent):
         """
         return self.d1 == self.d2
 
-    def resolve_one_roll(self, bet: Bet) -> bool:
-        """Checks if the provided `Bet` is either a one-roll winner, loser or
-        unresolved.
-
-        Args:
-            bet: The bet to be resolved.
-
-        Returns:
-            `True` if the bet can be resolved (win or lose), False if unresolved
-                (neither a winner or loser).
-        """
-        if bet.outcome in self.win_one_roll:
-            bet.player.win(bet)
-            return True
-        elif bet.outcome in self.lose_one_roll:
-            bet.player.lose(bet)
-            return True
-
-        return False
-
-    def resolve_hard_ways(self, bet: Bet) -> bool:
-        """Checks if the provided `Bet` is either a hardways winner, loser or
-        unresolved.
+    def resolve_propositions(self, bet: Bet) -> bool:
+        """Resolves the provided `Bet` if it is a one-roll or hardways winner or
+        loser, with a single lookup in `propositions`.
 
         Args:
             bet: The bet to be resolved.
 
         Returns:
-            `True` if the bet can be resolved (win or lose), False if unresolved
-                (neither a winner or loser).
+            `True` if the bet was resolved (win or lose), `False` if unresolved.
         """
-        if bet.outcome in self.win_hardway:
+        won = self.propositions.get(bet.outcome.name)
+        if won is None:
+            return False
+        elif won:
             bet.player.win(bet)
-            return True
-        elif bet.outcome in self.lose_hardway:
+        else:
             bet.player.lose(bet)
-            return True
-
-        return False
+        return True
 
     def update_game(self, game: "CrapsGame") -> None:
         """Calls one of the `CrapsGame` state change methods: craps(), natural(),
@@ -435,6 +528,8 @@ class NaturalThrow(Throw):
         d2: The other of the two die values, from 1 to 6.
     """
 
+    __slots__ = ()
+
     def __init__(self, d1: int, d2: int, outcomes: Iterable[Outcome] = None) -> None:
         """Creates this `Throw` instance providing the constraint ``d1`` + ``d2`` == 7 is
         satisfied.
@@ -475,6 +570,8 @@ class CrapsThrow(Throw):
         d2: The other of the two die values, from 1 to 6.
     """
 
+    __slots__ = ()
+
     def __init__(self, d1: int, d2: int, outcomes: Iterable[Outcome] = None) -> None:
         """Creates this `Throw` instance providing the constraint ``d1`` + ``d2`` in {2, 3, 12}
         is satisfied.
@@ -518,6 +615,8 @@ class ElevenThrow(Throw):
         d2: The other of the two die values, from 1 to 6.
     """
 
+    __slots__ = ()
+
     def __init__(self, d1: int, d2: int, outcomes: Iterable[Outcome] = None) -> None:
         """Creates this `Throw` instance providing the constraint ``d1`` + ``d2`` == 11
         is satisfied.
@@ -558,6 +657,8 @@ class PointThrow(Throw):
         d2: The other of the two die values, from 1 to 6.
     """
 
+    __slots__ = ()
+
     def __init__(self, d1: int, d2: int, outcomes: Iterable[Outcome] = None) -> None:
         """Creates this `Throw` instance providing the constraint ``d1`` + ``d2`` in
         {4, 5, 6, 8, 9, 10} is satisfied."""
@@ -578,6 +679,71 @@ class PointThrow(Throw):
         game.point(self)
 
 
+@dataclass(frozen=True)
+class EventLayout:
+    """The immutable events and outcomes of a game device, built once and shared
+    by any number of `RandomEventFactory` instances.
+
+    Building a `Wheel` runs `BinBuilder` and building `Dice` runs `ThrowBuilder`.
+    The `Bin`s and `Throw`s they produce are not changed by playing, so a device
+    constructed from a layout adopts them without building anything, leaving
+    only its random number generator to be created.
+
+    Attributes:
+        events: The `RandomEvent`s of the device, in the order `choose` selects
+            from.
+        all_outcomes: Maps the lower case name of every `Outcome` to the
+            `Outcome`.
+        outcome_ids: Maps the lower case name of each registered `Outcome` to its
+            `Outcome.id`.
+        outcome_index: Every registered `Outcome`, indexed by its `Outcome.id`.
+    """
+
+    events: Tuple[RandomEvent, ...]
+    all_outcomes: Dict[str, Outcome]
+    outcome_ids: Dict[str, int]
+    outcome_index: Tuple[Outcome, ...]
+
+
+@dataclass(frozen=True)
+class SeedSequence:
+    """Derives independent, reproducible random number streams from one root
+    seed, in the spirit of NumPy's ``SeedSequence``.
+
+    A `SeedSequence` is identified by its root ``entropy`` and a ``spawn_key``
+    path of child keys. The seed of a stream is a SHA-256 digest of both, so it
+    does not depend on the process, the Python hash seed or the order in which
+    streams are created. E.g. ``root.child("RouletteMartingale", 12)`` is the
+    same stream for the 13th session of that player in any worker.
+
+    Attributes:
+        entropy: The root seed.
+        spawn_key: The keys of the children leading from the root to this
+            sequence.
+    """
+
+    entropy: Union[int, str]
+    spawn_key: Tuple[Union[int, str], ...] = ()
+
+    def child(self, *keys: Union[int, str]) -> "SeedSequence":
+        """Returns the descendant of this sequence with the given keys."""
+        return SeedSequence(self.entropy, self.spawn_key + keys)
+
+    def spawn(self, n: int, start: int = 0) -> List["SeedSequence"]:
+        """Returns ``n`` independent children with keys ``start`` to
+        ``start + n - 1``, e.g. one per worker."""
+        return [self.child(key) for key in range(start, start + n)]
+
+    def seed_int(self) -> int:
+        """Returns the 256-bit integer seed of this sequence."""
+        digest = hashlib.sha256(repr((self.entropy, self.spawn_key)).encode())
+        return int.from_bytes(digest.digest(), "big")
+
+    def random(self) -> random.Random:
+        """Returns a new `random.Random` seeded from this sequence."""
+        return random.Random(self.seed_int())
+
+
 class RandomEventFactory(ABC):
     """The superclass for game devices that store and select random events.
 
@@ -589,25 +755,149 @@ class RandomEventFactory(ABC):
     initialise this collection and subclasses provide specific methods of adding and
     retrieving `RandomEvent`s to/from it.
 
+    Events can be prefetched: with ``prefetch`` set, `choose` serves events from a
+    buffer filled ``prefetch`` events at a time by `choose_many`. The two modes
+    have the following reproducibility contract for a given seed:
+
+    - Without prefetching, each `choose` makes one `random.Random.choice` call,
+      the stream the `seeded_wheel` and `seeded_dice` test fixtures are pinned to.
+    - With prefetching, events are drawn with `random.Random.choices`, which
+      draws one `random()` per event. The sequence of events is therefore the
+      same for any block size, and the same as `choose_many`, but differs from
+      the unbuffered stream.
+
+    Prefetched events are drawn ahead of use, so after reseeding `rng` directly
+    `discard_prefetched` must be called; `seed` does both.
+
+    A device can be constructed from an `EventLayout` instead of building its
+    events. `shared_layout` builds one layout per class and caches it, so e.g.
+    ``Wheel(rng, layout=Wheel.shared_layout())`` is cheap enough to construct
+    per simulation. Devices constructed from the same layout share their events,
+    so outcomes must not be added to them.
+
     Attributes:
         all_outcomes: A dict containing all possible outcomes. Populated
         rng: A `random.Random()` instance used to select `RandomEvent`s from the
             internal collection.
+        outcome_ids: Maps the lower case name of each registered `Outcome` to its
+            dense integer `Outcome.id`.
+        outcome_index: Every registered `Outcome`, indexed by its `Outcome.id`.
+        prefetch: The number of events drawn at a time to serve `choose`. 0
+            disables prefetching.
     """
 
     all_outcomes: Dict[str, Outcome]
+    outcome_ids: Dict[str, int]
+    outcome_index: List[Outcome]
+    prefetch: int
+    _shared_layouts: ClassVar[Dict[type, EventLayout]] = dict()
 
-    def __init__(self, rng: random.Random = None) -> None:
+    def __init__(
+        self,
+        rng: random.Random = None,
+        prefetch: int = 0,
+        layout: Optional[EventLayout] = None,
+    ) -> None:
         """Saves the given random number generator (if provided) and calls
-        `self.initialise` to create a pool of result instances.
+        `self.initialise` to create a pool of result instances, or adopts the
+        events of ``layout``.
 
         Args:
             rng: Usually provided when a seeded `random.Random` instance is
                 required for testing.
+            prefetch: The number of events to draw at a time, e.g. 4096. The
+                default of 0 draws a single event per `choose` call.
+            layout: Optional; A prebuilt `EventLayout` to use instead of calling
+                `self.initialise`.
         """
-        self.all_outcomes = dict()
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative.")
         self.rng = rng if rng else random.Random()
-        self.initialise()
+        self.prefetch = prefetch
+        self._prefetched: Iterator[RandomEvent] = iter(())
+        if layout is None:
+            self.all_outcomes = dict()
+            self.outcome_ids = dict()
+            self.outcome_index = []
+            self.initialise()
+        else:
+            self.all_outcomes = dict(layout.all_outcomes)
+            self.outcome_ids = dict(layout.outcome_ids)
+            self.outcome_index = list(layout.outcome_index)
+            self.adopt_events(layout.events)
+
+    @classmethod
+    def shared_layout(cls) -> EventLayout:
+        """Returns the `EventLayout` of this class, building it on first use.
+
+        The layout is cached per class for the life of the process, so each
+        worker process builds it at most once.
+        """
+        layout = cls._shared_layouts.get(cls)
+        if layout is None:
+            layout = cls().layout()
+            cls._shared_layouts[cls] = layout
+        return layout
+
+    def layout(self) -> EventLayout:
+        """Returns an `EventLayout` of the events and outcomes of this device."""
+        return EventLayout(
+            tuple(self.events),
+            dict(self.all_outcomes),
+            dict(self.outcome_ids),
+            tuple(self.outcome_index),
+        )
+
+    @abstractmethod
+    def adopt_events(self, events: Sequence[RandomEvent]) -> None:
+        """Uses the given prebuilt events in place of building them.
+
+        Args:
+            events: The `EventLayout.events` of a device of the same class.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def events(self) -> Sequence[RandomEvent]:
+        """The sequence of `RandomEvent`s from which `choose` selects."""
+        pass
+
+    def choose_many(self, n: int) -> List[RandomEvent]:
+        """Returns ``n`` randomly selected `RandomEvent`s from a single call to
+        the random number generator.
+
+        Note that `random.Random.choices` draws from the random number stream
+        differently to `random.Random.choice`, so this does not return the same
+        events as ``n`` unbuffered calls to `choose` with the same seed.
+
+        Args:
+            n: The number of events to select.
+        """
+        return self.rng.choices(self.events, k=n)
+
+    def next_prefetched(self) -> RandomEvent:
+        """Returns the next event from the prefetch buffer, refilling it with
+        `prefetch` events from `choose_many` when it is exhausted."""
+        event = next(self._prefetched, None)
+        if event is None:
+            self._prefetched = iter(self.choose_many(self.prefetch))
+            event = next(self._prefetched)
+        return event
+
+    def discard_prefetched(self) -> None:
+        """Discards any events drawn ahead of use by prefetching."""
+        self._prefetched = iter(())
+
+    def seed(self, a: Union[int, str, SeedSequence, None] = None) -> None:
+        """Reseeds `rng` and discards any prefetched events.
+
+        Args:
+            a: The seed passed to `random.Random.seed`, or a `SeedSequence` to
+                take the seed from.
+        """
+        self.rng.seed(a.seed_int() if isinstance(a, SeedSequence) else a)
+        self.discard_prefetched()
 
     @abstractmethod
     def initialise(self) -> None:
@@ -656,33 +946,107 @@ class RandomEventFactory(ABC):
             raise KeyError(f"No Outcome with name: {name}")
         return outcome
 
+    def get_outcome_id(self, name: str) -> int:
+        """Returns the `Outcome.id` of the `Outcome` with the string ``name``.
+
+        Args:
+            name: The name of an `Outcome`
+
+        Raises:
+            KeyError: There is no `Outcome` with name: ``name``.
+        """
+        outcome_id = self.outcome_ids.get(name.lower())
+        if outcome_id is None:
+            raise KeyError(f"No Outcome with name: {name}")
+        return outcome_id
+
+    def register_outcomes(self, outcomes: Iterable[Outcome]) -> None:
+        """Assigns the next dense `Outcome.id` to each new `Outcome` name and adds
+        the ``outcomes`` to `all_outcomes`.
+
+        An `Outcome` whose name is already registered is given the existing id.
+
+        Args:
+            outcomes: An iterable containing one or more `Outcome` instances.
+
+        Raises:
+            ValueError: An `Outcome` already carries a different id, e.g. from
+                another `RandomEventFactory`.
+        """
+        for outcome in outcomes:
+            key = outcome.name.lower()
+            outcome_id = self.outcome_ids.get(key)
+            if outcome_id is None:
+                outcome_id = len(self.outcome_index)
+                self.outcome_ids[key] = outcome_id
+                self.outcome_index.append(outcome)
+            if outcome.id is None:
+                outcome.id = outcome_id
+            elif outcome.id != outcome_id:
+                raise ValueError(
+                    f"{outcome!r} already has id {outcome.id}, expected {outcome_id}."
+                )
+            self.all_outcomes[key] = outcome
+
 
 class Wheel(RandomEventFactory):
     """Wheel contains the 38 individual bins on a Roulette wheel, a random
     number generator and a collection of all possible outcomes. It can select a
     `Bin` at random, simulating a spin of the Roulette wheel.
 
+    Each `Outcome` added to the wheel is assigned a dense `Outcome.id` and each
+    `Bin` keeps a bitmask of the ids of its outcomes, so resolving a bet against
+    the winning `Bin` is an integer bit test.
+
     Attributes:
         bins: A tuple containing the 38 individual `bin` instances.
         rng: A random number generator to select a `Bin` from the `bins` collection.
         all_outcomes: A dict containing all possible outcomes.
+        outcome_ids: Maps the lower case name of each `Outcome` to its id.
+        outcome_index: Every `Outcome`, indexed by its id.
     """
 
     bins: Tuple[Bin, ...]
     all_outcomes: Dict[str, Outcome]
 
-    def __init__(self, rng: random.Random = None) -> None:
+    def __init__(
+        self,
+        rng: random.Random = None,
+        prefetch: int = 0,
+        layout: Optional[EventLayout] = None,
+    ) -> None:
         """Creates a new wheel with 38 empty `Bin` instances and then creates an
         instance of `BinBuilder`. Also creates a new random number generator
         instance and a dict to store all possible outcomes.
+
+        If ``layout`` is given the `Bin`s of the layout are used instead.
         """
-        self.bins = tuple(Bin() for _ in range(38))
-        super(Wheel, self).__init__(rng)
+        if layout is None:
+            self.bins = tuple(Bin() for _ in range(38))
+        super(Wheel, self).__init__(rng, prefetch, layout)
+
+    @property
+    def events(self) -> Tuple[Bin, ...]:
+        """The `Bin`s of this wheel."""
+        return self.bins
 
     def initialise(self) -> None:
         """Builds the bins and populates with the pool of possible `Outcome`s."""
         BinBuilder().build_bins(self)
 
+    def adopt_events(self, events: Sequence[RandomEvent]) -> None:
+        """Uses the given prebuilt `Bin`s as the bins of this wheel.
+
+        Args:
+            events: The 38 `Bin`s of another `Wheel`.
+
+        Raises:
+            ValueError: ``events`` is not 38 `Bin` instances.
+        """
+        if len(events) != 38 or not all(isinstance(e, Bin) for e in events):
+            raise ValueError("A Wheel layout must contain 38 Bin instances.")
+        self.bins = tuple(typing.cast(Sequence[Bin], events))
+
     def add_outcomes(self, number: int, outcomes: Iterable[Outcome]) -> None:
         """Adds the given `Outcomes` to the `Bin` instance with the given number
         and update the internal collection of all_outcomes.
@@ -696,10 +1060,9 @@ class Wheel(RandomEventFactory):
             IndexError: Invalid bin number.
         """
         if 0 <= number <= 37:
+            outcomes = list(outcomes)
+            self.register_outcomes(outcomes)
             self.bins[number].add(outcomes)
-            self.all_outcomes.update(
-                {outcome.name.lower(): outcome for outcome in outcomes}
-            )
         else:
             raise IndexError("'Number' must be between 0-37 inclusive.")
 
@@ -710,6 +1073,8 @@ class Wheel(RandomEventFactory):
         Returns:
             A `Bin` selected at random from the wheel.
         """
+        if self.prefetch:
+            return typing.cast(Bin, self.next_prefetched())
         return self.rng.choice(self.bins)
 
     def get_event(self, key: Union[int, tuple[int, int]]) -> Bin:
@@ -733,23 +1098,53 @@ class Dice(RandomEventFactory):
 
     Attributes:
         throws: A `dict` that maps a two-tuple (`Throw.key`) to a `Throw` instance.
+        throw_sequence: An immutable `tuple` of the `Throw` instances in `throws`,
+            in insertion order, from which `choose` selects.
         rng: A random number generator used to select a `Throw` instance from
             the `throws` collection.
         all_outcomes: A dict containing all possible outcomes.
     """
 
     throws: Dict[Tuple[int, int], Throw]
+    throw_sequence: Tuple[Throw, ...]
     all_outcomes: Dict[str, Outcome]
 
-    def __init__(self, rng: random.Random = None) -> None:
-        """Build the dictionary of `Throw` instances."""
+    def __init__(
+        self,
+        rng: random.Random = None,
+        prefetch: int = 0,
+        layout: Optional[EventLayout] = None,
+    ) -> None:
+        """Build the dictionary of `Throw` instances, or use the `Throw`s of
+        ``layout`` if given."""
         self.throws = dict()
-        super(Dice, self).__init__(rng)
+        self.throw_sequence = ()
+        super(Dice, self).__init__(rng, prefetch, layout)
+
+    @property
+    def events(self) -> Tuple[Throw, ...]:
+        """The `Throw`s in `throw_sequence`."""
+        return self.throw_sequence
 
     def initialise(self) -> None:
         """Builds `self.throws` and populates with the pool of possible `Outcome`s."""
         ThrowBuilder.build_throws(self)
 
+    def adopt_events(self, events: Sequence[RandomEvent]) -> None:
+        """Uses the given prebuilt `Throw`s as the throws of these dice.
+
+        Args:
+            events: The `throw_sequence` of another `Dice` instance.
+
+        Raises:
+            ValueError: ``events`` contains an event which is not a `Throw`.
+        """
+        if not all(isinstance(e, Throw) for e in events):
+            raise ValueError("A Dice layout must only contain Throw instances.")
+        throws = typing.cast(Sequence[Throw], events)
+        self.throws = {throw.key: throw for throw in throws}
+        self.throw_sequence = tuple(throws)
+
     def add_throw(self, throw: Throw) -> None:
         """Adds the given `Throw` to the mapping maintained by this `Dice`
         instance.
@@ -758,14 +1153,21 @@ class Dice(RandomEventFactory):
             throw: The `Throw` to add.
         """
         self.throws[throw.key] = throw
+        self.throw_sequence = tuple(self.throws.values())
         self.all_outcomes.update(
             {outcome.name.lower(): outcome for outcome in throw.outcomes}
         )
 
     def choose(self) -> Throw:
-        """Returns a randomly selected `Throw` instance."""
-        result_key = self.rng.choice(list(self.throws))
-        return self.throws[result_key]
+        """Returns a randomly selected `Throw` instance.
+
+        This consumes the random number stream exactly as selecting a key of
+        `throws` would, so seeded `Dice` return the same sequence of throws
+        unless `prefetch` is set.
+        """
+        if self.prefetch:
+            return typing.cast(Throw, self.next_prefetched())
+        return self.rng.choice(self.throw_sequence)
 
     def get_event(self, key: Union[int, tuple[int, int]]) -> Optional[RandomEvent]:
         """Takes a particular combination of dice and returns the appropriate
@@ -786,6 +1188,100 @@ class Dice(RandomEventFactory):
         return self.throws.get(key)
 
 
+class EventSequence:
+    """A sequence of random events drawn up front which every iterator replays
+    identically.
+
+    ``length`` events are drawn when the sequence is created. An iterator which
+    runs past the drawn events extends the sequence from its own random number
+    generator, so the events are the same whichever iterator draws them first.
+
+    Attributes:
+        events: The `RandomEvent`s drawn so far.
+    """
+
+    events: List[RandomEvent]
+
+    def __init__(
+        self, choices: Sequence[RandomEvent], rng: random.Random, length: int
+    ) -> None:
+        """Draws the first ``length`` events.
+
+        Args:
+            choices: The `RandomEvent`s to draw from, e.g. `Wheel.events`.
+            rng: The random number generator to draw with.
+            length: The number of events to draw at a time.
+        """
+        if length < 1:
+            raise ValueError("length must be at least 1.")
+        self._choices = choices
+        self._rng = rng
+        self._length = length
+        self.events = rng.choices(choices, k=length)
+
+    def __iter__(self) -> Iterator[RandomEvent]:
+        n = 0
+        while True:
+            if n == len(self.events):
+                self.events.extend(self._rng.choices(self._choices, k=self._length))
+            yield self.events[n]
+            n += 1
+
+
+class ReplayEventFactory(RandomEventFactory):
+    """A `RandomEventFactory` which returns the events of an `EventSequence`
+    instead of selecting them at random.
+
+    It wraps the device it stands in for and is built from the device's
+    `EventLayout`, so players get the same `Outcome` instances from it.
+
+    Attributes:
+        device: The wrapped `RandomEventFactory`, which looks up events by key.
+    """
+
+    device: RandomEventFactory
+
+    def __init__(self, device: RandomEventFactory) -> None:
+        """Wraps ``device``, e.g. ``Wheel(layout=Wheel.shared_layout())``."""
+        self.device = device
+        self._events: Tuple[RandomEvent, ...] = ()
+        self._replay: Iterator[RandomEvent] = iter(())
+        super(ReplayEventFactory, self).__init__(layout=device.layout())
+
+    @property
+    def events(self) -> Tuple[RandomEvent, ...]:
+        """The events of the layout."""
+        return self._events
+
+    def initialise(self) -> None:
+        """A `ReplayEventFactory` is always built from a layout."""
+        raise TypeError("ReplayEventFactory requires an EventLayout.")
+
+    def adopt_events(self, events: Sequence[RandomEvent]) -> None:
+        self._events = tuple(events)
+
+    def replay(self, sequence: Iterable[RandomEvent]) -> None:
+        """Starts returning the events of ``sequence`` from `choose`.
+
+        Args:
+            sequence: The events to replay, e.g. an `EventSequence`.
+        """
+        self._replay = iter(sequence)
+
+    def choose(self) -> RandomEvent:
+        """Returns the next event of the sequence being replayed.
+
+        Raises:
+            StopIteration: The sequence has no more events.
+        """
+        return next(self._replay)
+
+    def get_event(self, key: Union[int, tuple[int, int]]) -> Optional[RandomEvent]:
+        """Returns the event with the given key, as looked up by the wrapped
+        `device`: a `Bin` number for a `Wheel`, or a `Throw` key for `Dice`."""
+        return self.device.get_event(key)
+
+
 class BinBuilder:
     """`BinBuilder` creates the `Outcome` instances for all of the 38 individual
     `Bin`s on a Roulette wheel.
@@ -1056,6 +1552,8 @@ class Bet:
         player: The player who will pay a losing bet or be paid by a winning bet.
     """
 
+    __slots__ = ("amount", "outcome", "player")
+
     amount: int
     outcome: Outcome
     player: casino.players.Player
@@ -1140,39 +1638,163 @@ class InvalidBet(Exception):
     pass
 
 
+class ValidationPolicy(ABC):
+    """Decides how the `Table` is validated on each cycle of a `Game`.
+
+    `Table.place_bet` already validates every bet as it is placed, so the check
+    each cycle only guards against players which change bets on the table.
+    Policies hold no state, so one instance can be shared by many tables and
+    sent to worker processes.
+    """
+
+    @abstractmethod
+    def check(self, table: "Table", cycle: int) -> None:
+        """Validates ``table`` as required by this policy.
+
+        Args:
+            table: The `Table` to validate.
+            cycle: The number of cycles ``table`` has already been validated for.
+
+        Raises:
+            InvalidBet: The bets don't pass the `Table` limit rules.
+        """
+        pass
+
+    @abstractmethod
+    def describe(self) -> str:
+        """Returns a short description of this policy for results metadata."""
+        pass
+
+
+class FullValidation(ValidationPolicy):
+    """Calls `Table.validate` on every cycle. This is the default policy."""
+
+    def check(self, table: "Table", cycle: int) -> None:
+        table.validate()
+
+    def describe(self) -> str:
+        return "full"
+
+
+class SampledValidation(ValidationPolicy):
+    """Calls `Table.validate` on the first cycle and then every ``every`` cycles.
+
+    Attributes:
+        every: The number of cycles between validations.
+    """
+
+    def __init__(self, every: int) -> None:
+        if every < 1:
+            raise ValueError("every must be at least 1.")
+        self.every = every
+
+    def check(self, table: "Table", cycle: int) -> None:
+        if not cycle % self.every:
+            table.validate()
+
+    def describe(self) -> str:
+        return f"sampled every {self.every}"
+
+
+class DebugValidation(ValidationPolicy):
+    """Calls `Table.audit` on every cycle when Python runs with ``__debug__``
+    set, and skips validation entirely when run with ``python -O``."""
+
+    def check(self, table: "Table", cycle: int) -> None:
+        if __debug__:
+            table.audit()
+
+    def describe(self) -> str:
+        return "debug audit" if __debug__ else "none"
+
+
 class Table:
-    """`Table` contains all the `Bet` instances created by a `Player` object.
-    A table also has a betting limit, and the sum of all a player's bets must be
-    less than or equal to this limit. We assume a single `Player` object in the
-    simulation.
+    """`Table` contains all the `Bet` instances created by the `Player` objects
+    playing at it. A table also has a betting limit, and the sum of all of each
+    player's bets must be less than or equal to this limit. The limit of an
+    individual player can be changed with `set_player_limit`.
+
+    Alongside the bets, the table keeps an index of the number of bets on each
+    `Outcome` name and id, and a running total of each player's bets, all
+    updated as bets are placed, moved and removed. Bets removed while the table
+    is being iterated over are replaced by a ``None`` placeholder, which is
+    skipped, and the placeholders are dropped once iteration is complete, so
+    iteration does not need to copy the bets.
 
     Attributes:
         limit: This is the table limit. The sum of the bets from a `Player` object
             must be less than or equal to this limit.
-        bets: This is a list of the `Bet` instances currently active. These will
-            result in either wins or losses to the `Player` object.
+        player_limits: Limits of individual players which replace `limit`.
+        bets: A read-only `tuple` of the `Bet` instances currently active. These
+            will result in either wins or losses to the `Player` object.
         bets_total: A running total of all `Bet`'s amounts in play.
+        player_totals: A running total of the amounts in play of each `Player`.
         game: The game used to determine if a given bet is allowed or working
             in a particular game state.
+        validation: The `ValidationPolicy` applied by `validate_cycle`.
 
     """
 
-    bets: List[Bet]
     limit: int
+    player_limits: Dict[casino.players.Player, int]
     bets_total: int
+    player_totals: Dict[casino.players.Player, int]
     game: Optional[Game]
+    validation: ValidationPolicy
 
-    def __init__(self, *bets: Bet) -> None:
-        """Creates an empty list of bets."""
-        self.bets = []
-        self.bets_total = 0
+    def __init__(
+        self, *bets: Bet, validation: Optional[ValidationPolicy] = None
+    ) -> None:
+        """Creates an empty list of bets.
+
+        Args:
+            validation: Optional; The `ValidationPolicy` for each cycle. Defaults
+                to `FullValidation`.
+        """
         self.limit = 30
+        self.player_limits = dict()
         self.game = None
+        self.validation = validation if validation else FullValidation()
+        self._iterating = 0
+        self._cycles = 0
+        self.clear()
+
+    @property
+    def bets(self) -> Tuple[Bet, ...]:
+        """A `tuple` of the `Bet` instances currently active. Bets are added and
+        removed with `place_bet` and `remove_bet`, which keep the indexes up to
+        date."""
+        return tuple(bet for bet in self._bets if bet is not None)
+
+    @bets.setter
+    def bets(self, bets: Iterable[Bet]) -> None:
+        """Replaces the active bets with ``bets`` and rebuilds the indexes."""
+        self.clear()
+        for bet in bets:
+            self._add(bet)
 
     def set_game(self, game: Game) -> None:
         """Saves the given game instance to be used to validate bets."""
         self.game = game
 
+    def set_player_limit(self, player: casino.players.Player, limit: int) -> None:
+        """Sets the limit of the sum of the bets of ``player``, in place of the
+        table `limit`.
+
+        Args:
+            player: The `Player` the limit applies to.
+            limit: The player's limit.
+        """
+        self.player_limits[player] = limit
+
+    def limit_for(self, player: casino.players.Player) -> int:
+        """Returns the limit of the sum of the bets of ``player``."""
+        return self.player_limits.get(player, self.limit)
+
+    def has_bets(self, player: casino.players.Player) -> bool:
+        """Returns `True` if ``player`` has any bets on the table."""
+        return player in self.player_totals
+
     def place_bet(self, bet: Bet) -> None:
         """Adds this ``bet`` to the list of active `bets` after checking if placing
         this bet does not violate the `Table` bet limit rules.
@@ -1184,8 +1806,7 @@ class Table:
             InvalidBet: Placing this ``bet`` breaks the `Table` limit rules.
         """
         if self.is_valid_bet(bet):
-            self.bets.append(bet)
-            self.bets_total += bet.amount
+            self._add(bet)
             bet.player.stake -= bet.price()
         else:
             raise casino.main.InvalidBet(
@@ -1198,9 +1819,41 @@ class Table:
 
         Args:
             bet: The `Bet` instance to be removed from the table.
+
+        Raises:
+            ValueError: ``bet`` is not on the table.
         """
-        self.bets.remove(bet)
+        position = self._positions.pop(id(bet), None)
+        if position is None:
+            raise ValueError(f"Bet is not on the table: {repr(bet)}.")
+        self._bets[position] = None
+        self._holes += 1
         self.bets_total -= bet.amount
+        self._count_outcome(bet, bet.outcome, -1)
+        total = self.player_totals[bet.player] - bet.amount
+        if total:
+            self.player_totals[bet.player] = total
+        else:
+            del self.player_totals[bet.player]
+        if not self._iterating:
+            self._compact()
+
+    def move_bet(self, bet: Bet, outcome: Outcome) -> None:
+        """Moves a ``bet`` on the table to another ``outcome`` with
+        `Bet.set_outcome`, keeping the outcome index up to date.
+
+        Args:
+            bet: The `Bet` instance on the table to move.
+            outcome: The new `Outcome` for the bet.
+
+        Raises:
+            ValueError: ``bet`` is not on the table.
+        """
+        if id(bet) not in self._positions:
+            raise ValueError(f"Bet is not on the table: {repr(bet)}.")
+        self._count_outcome(bet, bet.outcome, -1)
+        bet.set_outcome(outcome)
+        self._count_outcome(bet, outcome, 1)
 
     def is_valid_bet(self, bet: Bet) -> bool:
         """Validates this bet against the `Table` and `self.game` state.
@@ -1224,7 +1877,8 @@ class Table:
             raise InvalidBet(
                 f"Player does not have enough money to place this bet: {repr(bet)}."
             )
-        if not 0 < self.bets_total + bet.amount <= self.limit:
+        total = self.player_totals.get(bet.player, 0) + bet.amount
+        if not 0 < total <= self.limit_for(bet.player):
             raise casino.main.InvalidBet(
                 "Placing this bet violates table min/limit rules."
             )
@@ -1233,47 +1887,153 @@ class Table:
 
     def validate(self) -> bool:
         """Confirms the table-limit rules have been adhered to such that the sum
-        of all bets is no greater than `self.limit`.
+        of each player's bets is no greater than their limit.
+
+        This checks the running totals kept as bets are placed and removed. Use
+        `audit` to recompute them from every bet.
+
+        Returns:
+            `True`, if `Table` state is valid.
+
+        Raises:
+            InvalidBet: The bets don't pass the `Table` limit rules.
+        """
+        for player, total in self.player_totals.items():
+            if not 0 < total <= self.limit_for(player):
+                raise InvalidBet("Active bets violate the table limit rules.")
+        return True
+
+    def validate_cycle(self) -> None:
+        """Validates the table for a cycle of play according to `validation`.
+
+        Raises:
+            InvalidBet: The bets don't pass the `Table` limit rules.
+        """
+        self._cycles += 1
+        self.validation.check(self, self._cycles - 1)
+
+    def audit(self) -> bool:
+        """Confirms the table-limit rules by summing every bet, and checks the
+        running totals and outcome index against the bets.
 
         Returns:
             `True`, if `Table` state is valid.
 
         Raises:
             InvalidBet: The bets don't pass the `Table` limit rules.
+            ValueError: A running total or index does not match the bets.
         """
         total_amount = 0
+        player_totals: Dict[casino.players.Player, int] = dict()
+        outcome_names: Dict[str, int] = dict()
         for bet in self.bets:
             total_amount += bet.amount
-            if not (0 < bet.amount <= self.limit and total_amount <= self.limit):
+            player_total = player_totals.get(bet.player, 0) + bet.amount
+            if not 0 < bet.amount <= player_total <= self.limit_for(bet.player):
                 raise InvalidBet("Active bets violate the table limit rules.")
+            player_totals[bet.player] = player_total
+            name = bet.outcome.name
+            outcome_names[name] = outcome_names.get(name, 0) + 1
         if self.bets_total != total_amount:
             raise ValueError(
                 "Mismatch between computed total value of all bets and internal "
                 "self.bets_total value tracker."
             )
+        if self.player_totals != player_totals or self._names != outcome_names:
+            raise ValueError("Mismatch between the bets and the table indexes.")
         return True
 
+    def reset(self) -> None:
+        """Clears the table and restarts the cycle count of `validation`, to be
+        called at the start of each session so every session is validated on
+        the same cycles."""
+        self.clear()
+        self._cycles = 0
+
     def clear(self) -> None:
         """Clears the table of all `Bet` instances, to be called once `Game` has resolved
         all `Bet`'s."""
-        self.bets = []
+        self._bets: List[Optional[Bet]] = []
+        self._positions: Dict[int, int] = dict()
+        self._names: Dict[str, int] = dict()
+        self._player_names: Dict[Tuple[casino.players.Player, str], int] = dict()
+        self._ids: Dict[int, int] = dict()
+        self._holes = 0
         self.bets_total = 0
+        self.player_totals = dict()
 
-    def contains_outcome(self, outcome_name) -> bool:
-        """Returns `True` if the table contains a bet with an outcome name of
-        ``outcome_name``.
+    def contains_outcome(
+        self,
+        outcome: Union[str, Outcome],
+        player: Optional[casino.players.Player] = None,
+    ) -> bool:
+        """Returns `True` if the table contains a bet on ``outcome``.
+
+        Args:
+            outcome: Either an `Outcome` name or an `Outcome`. A registered
+                `Outcome` is looked up by its id, otherwise by its name.
+            player: Optional; Only consider the bets of this `Player`.
         """
-        for bet in self.bets:
-            if bet.outcome.name == outcome_name:
-                return True
+        if player is not None:
+            name = outcome if isinstance(outcome, str) else outcome.name
+            return (player, name) in self._player_names
+        if isinstance(outcome, str):
+            return outcome in self._names
+        if outcome.id is not None:
+            return outcome.id in self._ids
+        return outcome.name in self._names
+
+    def _add(self, bet: Bet) -> None:
+        self._positions[id(bet)] = len(self._bets)
+        self._bets.append(bet)
+        self.bets_total += bet.amount
+        self._count_outcome(bet, bet.outcome, 1)
+        self.player_totals[bet.player] = (
+            self.player_totals.get(bet.player, 0) + bet.amount
+        )
 
-        return False
+    def _count_outcome(self, bet: Bet, outcome: Outcome, change: int) -> None:
+        self._count(self._names, outcome.name, change)
+        self._count(self._player_names, (bet.player, outcome.name), change)
+        if outcome.id is not None:
+            self._count(self._ids, outcome.id, change)
+
+    @staticmethod
+    def _count(index: Dict, key: typing.Hashable, change: int) -> None:
+        count = index.get(key, 0) + change
+        if count:
+            index[key] = count
+        else:
+            del index[key]
+
+    def _compact(self) -> None:
+        """Drops the placeholders of removed bets."""
+        if self._holes:
+            self._bets = [bet for bet in self._bets if bet is not None]
+            self._positions = {id(bet): n for n, bet in enumerate(self._bets)}
+            self._holes = 0
+
+    def __len__(self) -> int:
+        """Returns the number of active `Bet` instances."""
+        return len(self._positions)
 
     def __iter__(self) -> Iterator[Bet]:
-        """Returns an iterator over the available `Bet` instances."""
-        # We need to be able remove bets from the table. Consequently, we have
-        # to update the list, which requires we create a copy of the list.
-        return iter(self.bets[:])
+        """Returns an iterator over the available `Bet` instances.
+
+        Bets may be removed from the table during iteration. Bets placed during
+        iteration are not included.
+        """
+        self._iterating += 1
+        bets = self._bets
+        try:
+            for n in range(len(bets)):
+                bet = bets[n]
+                if bet is not None:
+                    yield bet
+        finally:
+            self._iterating -= 1
+            if not self._iterating:
+                self._compact()
 
     def __str__(self) -> str:
         return ", ".join(str(bet) for bet in self.bets)
@@ -1282,6 +2042,139 @@ class Table:
         return f"{self.__class__.__name__}({', '.join(repr(bet) for bet in self.bets)})"
 
 
+class CycleProfiler:
+    """Accumulates the wall time and number of calls of each phase of
+    `Game.cycle_all`, by player class and game state.
+
+    The phases are "place_bets", timed for each player, then "validate",
+    "choose", "resolve" and "update_game", timed once per cycle. A game only
+    times its phases while its `Game.profiler` is set; otherwise the phases are
+    marked on the no-op `NO_TIMER`.
+
+    Attributes:
+        timings: Maps each (phase, player, state) to a `list` of the [calls,
+            seconds] spent in it. ``player`` is the class name of the player, or
+            the comma separated class names of every active player for phases
+            shared by the table. ``state`` is the class name of the game state,
+            e.g. "CrapsGamePointOn", or of the game if it has no states.
+        clock: The function returning the current time in seconds.
+    """
+
+    PHASES: ClassVar[Tuple[str, ...]] = (
+        "place_bets",
+        "validate",
+        "choose",
+        "resolve",
+        "update_game",
+    )
+
+    timings: Dict[Tuple[str, str, str], List[float]]
+
+    def __init__(self, clock: typing.Callable[[], float] = time.perf_counter) -> None:
+        self.timings = {}
+        self.clock = clock
+
+    def add(self, phase: str, player: str, state: str, seconds: float) -> None:
+        """Records one call of ``phase`` which took ``seconds``."""
+        timing = self.timings.get((phase, player, state))
+        if timing is None:
+            self.timings[phase, player, state] = [1, seconds]
+        else:
+            timing[0] += 1
+            timing[1] += seconds
+
+    def merge(self, other: "CycleProfiler") -> None:
+        """Adds the timings of ``other``, e.g. gathered by another worker."""
+        for key, (calls, seconds) in other.timings.items():
+            timing = self.timings.setdefault(key, [0, 0.0])
+            timing[0] += calls
+            timing[1] += seconds
+
+    def report(self) -> List[Dict]:
+        """Returns a row for each (phase, player, state), ordered by `PHASES`
+        then player and state, with the calls, total seconds and mean
+        microseconds per call.
+        """
+        rows = []
+        for (phase, player, state), (calls, seconds) in sorted(
+            self.timings.items(),
+            key=lambda item: (self.PHASES.index(item[0][0]), item[0][1:]),
+        ):
+            rows.append(
+                {
+                    "phase": phase,
+                    "player": player,
+                    "state": state,
+                    "calls": int(calls),
+                    "seconds": seconds,
+                    "mean_us": seconds / calls * 1e6,
+                }
+            )
+        return rows
+
+    def save(self, file_path) -> None:
+        """Saves `self.report` to a JSON file, e.g. alongside the CSV written by
+        `BulkSimulator.save_to_csv`.
+
+        Args:
+            file_path: The path to save the JSON. E.g. "profile.json".
+        """
+        with open(file_path, "w") as json_file:
+            json.dump(self.report(), json_file, indent=2)
+
+
+class PhaseTimer:
+    """Is told as each phase of a `Game.cycle_all` ends. This base class does
+    nothing, and times the cycles of a game which is not profiled, so profiled
+    and unprofiled cycles run the same code.
+    """
+
+    def placed(self, player: casino.players.Player) -> None:
+        """Called once ``player`` has placed their bets."""
+        pass
+
+    def mark(self, phase: str) -> None:
+        """Called as ``phase``, one of `CycleProfiler.PHASES`, ends."""
+        pass
+
+
+NO_TIMER = PhaseTimer()
+
+
+class ProfiledPhaseTimer(PhaseTimer):
+    """Records the time of each phase of one cycle in a `CycleProfiler`, from
+    the end of the previous phase.
+
+    Attributes:
+        profiler: The `CycleProfiler` the timings are added to.
+        state: The name of the game state at the start of the cycle.
+        names: The comma separated class names of the active players, by which
+            the phases shared by the table are recorded.
+    """
+
+    def __init__(
+        self,
+        profiler: CycleProfiler,
+        state: str,
+        players: Sequence[casino.players.Player],
+    ) -> None:
+        self.profiler = profiler
+        self.state = state
+        self.names = ",".join(sorted({type(player).__name__ for player in players}))
+        self._last = profiler.clock()
+
+    def _lap(self) -> float:
+        now = self.profiler.clock()
+        seconds, self._last = now - self._last, now
+        return seconds
+
+    def placed(self, player: casino.players.Player) -> None:
+        self.profiler.add("place_bets", type(player).__name__, self.state, self._lap())
+
+    def mark(self, phase: str) -> None:
+        self.profiler.add(phase, self.names, self.state, self._lap())
+
+
 class Game(ABC):
     """Manages the sequence of actions that define casino games, such as Roulette
     and Craps.
@@ -1297,14 +2190,18 @@ class Game(ABC):
             `Outcome`s that win or lose.
         table: Contains a `Table` instance which holds all the `Bet` instances
             placed by the `Player` object.
+        profiler: Optional; A `CycleProfiler` which times the phases of every
+            cycle while it is set.
     """
 
+    profiler: Optional[CycleProfiler]
+
     def __init__(self, event_factory: RandomEventFactory, table: Table) -> None:
         """Constructs a new `Game`, using a given `RandomEventFactory` and `Table."""
         self.event_factory = event_factory
         self.table = table
+        self.profiler = None
 
-    @abstractmethod
     def cycle(self, player: casino.players.Player) -> None:
         """Execute a single cycle of play with a given `Player`.
 
@@ -1316,6 +2213,42 @@ class Game(ABC):
         iterator over the current `Bet` objects. The bets are resolved, calling
         the `player.win()` or `player.lose()` methods respectively.
         """
+        self.cycle_all((player,))
+
+    def cycle_all(self, players: Sequence[casino.players.Player]) -> None:
+        """Execute a single cycle of play with every given `Player` at the table.
+
+        Each player still playing places their bets, then `play_round` chooses a
+        single `RandomEvent` and resolves every bet on the table against it,
+        notifying the `Player` who placed it. While `profiler` is set, each
+        phase is timed by a `ProfiledPhaseTimer`.
+
+        Args:
+            players: The players sharing this game's `Table`.
+        """
+        active = [player for player in players if player.playing()]
+        if not active:
+            return
+        timer = NO_TIMER
+        if self.profiler is not None:
+            timer = ProfiledPhaseTimer(self.profiler, self.state_name(), active)
+        for player in active:
+            player.place_bets()
+            timer.placed(player)
+        self.play_round(active, timer)
+
+    @abstractmethod
+    def play_round(
+        self, active: Sequence[casino.players.Player], timer: PhaseTimer
+    ) -> None:
+        """Validates the table, chooses a `RandomEvent` and resolves the bets of
+        the ``active`` players, calling `PhaseTimer.mark` as each of the
+        "validate", "choose", "resolve" and "update_game" phases ends.
+
+        Args:
+            active: The players still playing, whose bets are placed.
+            timer: The `PhaseTimer` of the cycle.
+        """
         pass
 
     @abstractmethod
@@ -1332,9 +2265,15 @@ class Game(ABC):
         pass
 
     def reset(self) -> None:
-        """Tells the table to clear all bets. Can be overridden by subclasses to
-        also reset the game state."""
-        self.table.clear()
+        """Tells the table to clear all bets and restart its validation cycle
+        count. Can be overridden by subclasses to also reset the game state."""
+        self.table.reset()
+
+    def state_name(self) -> str:
+        """Returns the name of the current game state, by which a
+        `CycleProfiler` groups timings. Games without states use their class
+        name."""
+        return type(self).__name__
 
 
 class CrapsGame(Game):
@@ -1372,23 +2311,31 @@ class CrapsGame(Game):
         super(CrapsGame, self).__init__(dice, table)
         self.state = CrapsGamePointOff(self)
 
-    def cycle(self, player: casino.players.Player) -> None:
-        """This will execute a single cycle of play with a given `CrapsPlayer`.
+    def play_round(
+        self, active: Sequence[casino.players.Player], timer: PhaseTimer
+    ) -> None:
+        """Throws the `Dice` once for every `CrapsPlayer` still playing.
+
+        "resolve" covers the one roll propositions, and "update_game" the state
+        change and the game bets.
 
         Args:
-            player: The player who will place bets on this game.
+            active: The players who placed bets on this game.
+            timer: The `PhaseTimer` of the cycle.
         """
-        if player.playing():
-            player.place_bets()
-            self.table.validate()
-            win_throw = self.event_factory.choose()
-            for bet in self.table:
-                if any(
-                    [win_throw.resolve_hard_ways(bet), win_throw.resolve_one_roll(bet)]  # type: ignore
-                ):
-                    self.table.remove_bet(bet)
-            win_throw.update_game(self)  # type: ignore
+        self.table.validate_cycle()
+        timer.mark("validate")
+        win_throw = self.event_factory.choose()
+        timer.mark("choose")
+        for bet in self.table:
+            if win_throw.resolve_propositions(bet):  # type: ignore
+                self.table.remove_bet(bet)
+        timer.mark("resolve")
+        # Game bets are resolved by the current state's compiled rules.
+        win_throw.update_game(self)  # type: ignore
+        for player in active:
             player.rounds_to_go -= 1
+        timer.mark("update_game")
 
     def is_allowed(self, outcome: Outcome) -> bool:
         """Determines if the `Outcome` is allowed in the current state of the game.
@@ -1477,6 +2424,11 @@ class CrapsGame(Game):
         """
         self.state = self.state.point(throw)
 
+    def state_name(self) -> str:
+        """Returns the class name of the current `CrapsGameState`, e.g.
+        "CrapsGamePointOff"."""
+        return type(self.state).__name__
+
     def point_odds(self) -> Fraction:
         """Returns the odds for [Don't] Pass Line Odds for the current point.
         This delegates the real work to the current `CrapsGameState` object.
@@ -1498,6 +2450,136 @@ class CrapsGame(Game):
         return str(self.state)
 
 
+class BetAction(NamedTuple):
+    """The result of a `Throw` for a single `Bet` in a particular game state.
+
+    Attributes:
+        kind: One of "win", "lose", "push" or "move".
+        outcome: The `Outcome` a "move" action moves the `Bet` to, otherwise `None`.
+    """
+
+    kind: str
+    outcome: Optional[Outcome] = None
+
+
+WIN = BetAction("win")
+LOSE = BetAction("lose")
+PUSH = BetAction("push")
+
+
+class CrapsResolutionTable:
+    """A compiled table of how each throw resolves the game bets of Craps.
+
+    The rules of `CrapsGamePointOff` and `CrapsGamePointOn` are enumerated once,
+    for every point (`None` when the point is off) and throw `event_id`, into a
+    `dict` from `Outcome` name to `BetAction`. Resolving a `Bet` is then a single
+    lookup, rather than formatting names and building sets on every throw.
+    Outcomes are keyed by name because players create their own `Outcome`
+    instances for line bets, and those are never registered with the `Dice`.
+
+    Attributes:
+        rules: Maps (point, event_id) to a tuple of the default `BetAction` for
+            bets not named in the rule, and the `dict` of `BetAction` by
+            `Outcome` name.
+        moves: Maps ("Come Line" or "Don't Come Line", event_id) to the
+            pre-built come point `Outcome` such a bet is moved to.
+    """
+
+    POINTS = (4, 5, 6, 8, 9, 10)
+
+    rules: Dict[
+        Tuple[Optional[int], int], Tuple[Optional[BetAction], Dict[str, BetAction]]
+    ]
+    moves: Dict[Tuple[str, int], Outcome]
+
+    def __init__(self) -> None:
+        """Compiles the rules for every game state and throw."""
+        self.moves = {
+            (name, event_id): Outcome(
+                f"{name.rstrip('Line').rstrip()} Point {event_id}",
+                casino.odds.PASS_COME,
+            )
+            for name in ("Come Line", "Don't Come Line")
+            for event_id in self.POINTS
+        }
+        self.rules = {}
+        for point in (None,) + self.POINTS:
+            for event_id in range(2, 13):
+                if point is None:
+                    rule = self.point_off_rule(event_id)
+                else:
+                    rule = self.point_on_rule(point, event_id)
+                self.rules[(point, event_id)] = rule
+
+    def lookup(
+        self, point: Optional[int], event_id: int
+    ) -> Tuple[Optional[BetAction], Dict[str, BetAction]]:
+        """Returns the default `BetAction` and the `BetAction` by `Outcome` name
+        for a throw of ``event_id`` when the point is ``point``."""
+        return self.rules[(point, event_id)]
+
+    def point_off_rule(
+        self, event_id: int
+    ) -> Tuple[Optional[BetAction], Dict[str, BetAction]]:
+        """Compiles the rule for a throw of ``event_id`` when the point is off."""
+        if event_id in {2, 3, 12}:
+            dont_pass = PUSH if event_id == 12 else WIN
+            return None, {"Pass Line": LOSE, "Don't Pass Line": dont_pass}
+        elif event_id == 7:
+            # Every working bet loses, non-working Come Point odds are pushed.
+            actions = {f"Come Point {point} Odds": PUSH for point in self.POINTS}
+            actions.update({"Pass Line": WIN, "Don't Pass Line": LOSE})
+            return LOSE, actions
+        elif event_id == 11:
+            return None, {"Pass Line": WIN, "Don't Pass Line": LOSE}
+        else:
+            return None, {
+                f"Come Point {event_id}": PUSH,
+                f"Don't Come Point {event_id}": PUSH,
+                f"Come Point {event_id} Odds": PUSH,
+                f"Don't Come Point {event_id} Odds": PUSH,
+            }
+
+    def point_on_rule(
+        self, point: int, event_id: int
+    ) -> Tuple[Optional[BetAction], Dict[str, BetAction]]:
+        """Compiles the rule for a throw of ``event_id`` when the point is
+        ``point``."""
+        if event_id in {2, 3, 12}:
+            return None, {"Don't Come Line": WIN, "Come Line": LOSE}
+        elif event_id == 7:
+            winners = ("Don't Pass Line", "Don't Pass Odds", "Come Line")
+            losers = ("Pass Line", "Pass Odds", "Don't Come Line")
+            actions = {name: WIN for name in winners}
+            actions.update({name: LOSE for name in losers})
+            for number in self.POINTS:
+                actions[f"Don't Come Point {number}"] = WIN
+                actions[f"Don't Come Point {number} Odds"] = WIN
+                actions[f"Come Point {number}"] = LOSE
+                actions[f"Come Point {number} Odds"] = LOSE
+            return None, actions
+        elif event_id == 11:
+            return None, {"Come Line": WIN, "Don't Come Line": LOSE}
+
+        actions = {
+            name: BetAction("move", self.moves[(name, event_id)])
+            for name in ("Come Line", "Don't Come Line")
+        }
+        if event_id == point:
+            actions.update({"Pass Line": WIN, "Pass Odds": WIN})
+            actions.update({"Don't Pass Line": LOSE, "Don't Pass Odds": LOSE})
+        else:
+            actions.update(
+                {
+                    f"Come Point {event_id}": WIN,
+                    f"Come Point {event_id} Odds": WIN,
+                    f"Don't Come Point {event_id}": LOSE,
+                    f"Don't Come Point {event_id} Odds": LOSE,
+                }
+            )
+        return None, actions
+
+
 class CrapsGameState(ABC):
     """Defines the state-specific behaviour of a Craps game.
 
@@ -1510,12 +2592,40 @@ class CrapsGameState(ABC):
             From this object, the various next state-change methods can get the
             `Table` instance and an `Iterator` over the active `Bet`
             instances.
+        current_point: The point of this state, `None` when the point is off.
     """
 
+    current_point: Optional[int] = None
+
     def __init__(self, game: CrapsGame) -> None:
         """Saves the overall `CrapsGame` object to which this state applies."""
         self.game = game
 
+    def resolve_bets(self, throw: Throw) -> None:
+        """Resolves every `Bet` on the table for ``throw`` using the compiled
+        `CrapsResolutionTable` rule for the current point.
+
+        Args:
+            throw: The `Throw` which resolves the bets.
+        """
+        default, actions = CRAPS_RESOLUTION.lookup(self.current_point, throw.event_id)
+        table = self.game.table
+        for bet in table:
+            action = actions.get(bet.outcome.name, default)
+            if action is None:
+                continue
+            elif action is WIN:
+                bet.player.win(bet)
+                table.remove_bet(bet)
+            elif action is LOSE:
+                bet.player.lose(bet)
+                table.remove_bet(bet)
+            elif action is PUSH:
+                bet.player.stake += bet.amount
+                table.remove_bet(bet)
+            elif action.outcome is not None:
+                table.move_bet(bet, action.outcome)
+
     @abstractmethod
     def is_valid(self, outcome: Outcome) -> bool:
         """Returns `True` if this is a valid outcome for creating bets in the current
@@ -1584,29 +2694,6 @@ class CrapsGameState(ABC):
         """
         pass
 
-    @staticmethod
-    def move_to_throw(bet: Bet, throw: Throw) -> None:
-        """Moves a 'Come Line' or 'Don't Come Line' bet to a new `Outcome` instance
-        based on the current `Throw` instance.
-
-        Args:
-            bet: The `Bet` to update based on the current `Throw`.
-            throw: The `Throw` to which the outcome is changed.
-        """
-        if isinstance(throw, PointThrow) and bet.outcome.name in {
-            "Come Line",
-            "Don't Come Line",
-        }:
-            new_outcome = Outcome(
-                f"{bet.outcome.name.rstrip('Line').rstrip()} Point {throw.event_id}",
-                casino.odds.PASS_COME,
-            )
-            bet.set_outcome(new_outcome)
-        else:
-            raise ValueError(
-                f"Not a Point Throw or bet cannot be moved: {repr(bet)}, {repr(throw)}."
-            )
-
     @abstractmethod
     def __str__(self) -> str:
         pass
@@ -1661,18 +2748,8 @@ class CrapsGamePointOff(CrapsGameState):
         Args:
             throw: The `Throw` that is associated with craps.
         """
-        for bet in self.game.table:
-            if bet.outcome.name == "Pass Line":
-                bet.player.lose(bet)
-                self.game.table.remove_bet(bet)
-            elif bet.outcome.name == "Don't Pass Line":
-                if throw.event_id == 12:
-                    # Push (a draw; bet is cancelled and wager returned).
-                    bet.player.stake += bet.amount
-                    self.game.table.remove_bet(bet)
-                else:
-                    bet.player.win(bet)
-                    self.game.table.remove_bet(bet)
+        # Pass Line loses. Don't Pass Line wins, or is pushed on a 12.
+        self.resolve_bets(throw)
 
         return self
 
@@ -1683,20 +2760,9 @@ class CrapsGamePointOff(CrapsGameState):
         Args:
             throw: The `Throw` that is associated with a natural seven.
         """
-        for bet in self.game.table:
-            if bet.outcome.name == "Pass Line":
-                bet.player.win(bet)
-                self.game.table.remove_bet(bet)
-            elif bet.outcome.name == "Don't Pass Line":
-                bet.player.lose(bet)
-                self.game.table.remove_bet(bet)
-            elif self.is_working(bet.outcome):
-                # [Don't] Come Point bets are still working and will lose.
-                bet.player.lose(bet)
-                self.game.table.remove_bet(bet)
-            else:  # Push any non-working bets such as [Don't] Come Point Odds.
-                bet.player.stake += bet.amount
-                self.game.table.remove_bet(bet)
+        # Pass Line wins and Don't Pass Line loses. [Don't] Come Point bets are
+        # still working and lose, non-working Come Point Odds bets are pushed.
+        self.resolve_bets(throw)
 
         return self
 
@@ -1707,13 +2773,8 @@ class CrapsGamePointOff(CrapsGameState):
         Args:
             throw: The `Throw` that is associated with an eleven.
         """
-        for bet in self.game.table:
-            if bet.outcome.name == "Pass Line":
-                bet.player.win(bet)
-                self.game.table.remove_bet(bet)
-            elif bet.outcome.name == "Don't Pass Line":
-                bet.player.lose(bet)
-                self.game.table.remove_bet(bet)
+        # Pass Line wins and Don't Pass Line loses.
+        self.resolve_bets(throw)
 
         return self
 
@@ -1724,15 +2785,8 @@ class CrapsGamePointOff(CrapsGameState):
         Args:
             throw: The `Throw` that is associated a point number.
         """
-        for bet in self.game.table:
-            if bet.outcome.name in {
-                f"Come Point {throw.event_id}",
-                f"Don't Come Point {throw.event_id}",
-                f"Come Point {throw.event_id} Odds",
-                f"Don't Come Point {throw.event_id} Odds",
-            }:  # Push.
-                bet.player.stake += bet.amount
-                self.game.table.remove_bet(bet)
+        # [Don't] Come Point bets and their odds on this number are pushed.
+        self.resolve_bets(throw)
 
         return CrapsGamePointOn(throw.event_id, self.game)
 
@@ -1761,6 +2815,8 @@ class CrapsGamePointOn(CrapsGameState):
         point: The point set by the current `Throw` instance.
     """
 
+    current_point: int
+
     def __init__(self, point: int, game: CrapsGame) -> None:
         """Uses the superclass constructor to save the overall `CrapsGame` object,
         and sets the point value for this state.
@@ -1798,13 +2854,8 @@ class CrapsGamePointOn(CrapsGameState):
         Args:
             throw: The `Throw` that is associated with craps.
         """
-        for bet in self.game.table:
-            if bet.outcome.name == "Don't Come Line":
-                bet.player.win(bet)
-                self.game.table.remove_bet(bet)
-            elif bet.outcome.name == "Come Line":
-                bet.player.lose(bet)
-                self.game.table.remove_bet(bet)
+        # Don't Come Line wins and Come Line loses.
+        self.resolve_bets(throw)
 
         return self
 
@@ -1815,20 +2866,9 @@ class CrapsGamePointOn(CrapsGameState):
         Args:
             throw: The `Throw` that is associated with a natural seven.
         """
-        winners = {"Don't Pass Line", "Don't Pass Odds", "Come Line"}
-        winners |= {f"Don't Come Point {i}" for i in (4, 5, 6, 8, 9, 10)}
-        winners |= {f"Don't Come Point {i} Odds" for i in (4, 5, 6, 8, 9, 10)}
-        losers = {"Pass Line", "Pass Odds", "Don't Come Line"}
-        losers |= {f"Come Point {i}" for i in (4, 5, 6, 8, 9, 10)}
-        losers |= {f"Come Point {i} Odds" for i in (4, 5, 6, 8, 9, 10)}
-
-        for bet in self.game.table:
-            if bet.outcome.name in winners:
-                bet.player.win(bet)
-                self.game.table.remove_bet(bet)
-            elif bet.outcome.name in losers:
-                bet.player.lose(bet)
-                self.game.table.remove_bet(bet)
+        # Don't Pass, Come Line and Don't Come Point bets win. Pass, Don't Come
+        # Line and Come Point bets lose.
+        self.resolve_bets(throw)
 
         return CrapsGamePointOff(self.game)
 
@@ -1839,13 +2879,8 @@ class CrapsGamePointOn(CrapsGameState):
         Args:
             throw: The `Throw` that is associated with an eleven.
         """
-        for bet in self.game.table:
-            if bet.outcome.name == "Come Line":
-                bet.player.win(bet)
-                self.game.table.remove_bet(bet)
-            elif bet.outcome.name == "Don't Come Line":
-                bet.player.lose(bet)
-                self.game.table.remove_bet(bet)
+        # Come Line wins and Don't Come Line loses.
+        self.resolve_bets(throw)
 
         return self
 
@@ -1856,34 +2891,12 @@ class CrapsGamePointOn(CrapsGameState):
         Args:
             throw: The `Throw` that is associated a point number.
         """
+        # Making the point, Pass bets win and Don't Pass bets lose. Otherwise,
+        # Come Point bets on this number win and Don't Come Point bets lose. In
+        # both cases [Don't] Come Line bets are moved to this number.
+        self.resolve_bets(throw)
         if throw.event_id == self.current_point:
-            for bet in self.game.table:
-                if bet.outcome.name in {"Pass Line", "Pass Odds"}:
-                    bet.player.win(bet)
-                    self.game.table.remove_bet(bet)
-                elif bet.outcome.name in {"Don't Pass Line", "Don't Pass Odds"}:
-                    bet.player.lose(bet)
-                    self.game.table.remove_bet(bet)
-                elif bet.outcome.name in {"Come Line", "Don't Come Line"}:
-                    self.move_to_throw(bet, throw)
-
             return CrapsGamePointOff(self.game)
-        else:
-            for bet in self.game.table:
-                if bet.outcome.name in {
-                    f"Come Point {throw.event_id}",
-                    f"Come Point {throw.event_id} Odds",
-                }:
-                    bet.player.win(bet)
-                    self.game.table.remove_bet(bet)
-                elif bet.outcome.name in {
-                    f"Don't Come Point {throw.event_id}",
-                    f"Don't Come Point {throw.event_id} Odds",
-                }:
-                    bet.player.lose(bet)
-                    self.game.table.remove_bet(bet)
-                elif bet.outcome.name in {"Come Line", "Don't Come Line"}:
-                    self.move_to_throw(bet, throw)
 
         return self
 
@@ -1902,6 +2915,9 @@ class CrapsGamePointOn(CrapsGameState):
         return f"The Point Is {self.current_point}"
 
 
+CRAPS_RESOLUTION = CrapsResolutionTable()
+
+
 class RouletteGame(Game):
     """`RouletteGame` manages the sequence of actions that defines the game of Roulette.
 
@@ -1917,25 +2933,34 @@ class RouletteGame(Game):
     def __init__(self, wheel: Wheel, table: Table) -> None:
         super(RouletteGame, self).__init__(wheel, table)
 
-    def cycle(self, player: "casino.players.Player"):
-        """Execute a single cycle of play with a given `Player`.
+    def play_round(
+        self, active: Sequence[casino.players.Player], timer: PhaseTimer
+    ) -> None:
+        """Spins the `Wheel` once for every `Player` still playing.
+
+        Roulette has no game state to update, so "update_game" is the end of
+        the round.
 
         Args:
-            player: The individual `Player` that places bets, receives winnings
-            and pays losses.
+            active: The players that place bets, receive winnings and pay losses.
+            timer: The `PhaseTimer` of the cycle.
         """
-        if player.playing():
-            player.place_bets()
-            self.table.validate()
-            winning_bin = self.event_factory.choose()
+        self.table.validate_cycle()
+        timer.mark("validate")
+        winning_bin = self.event_factory.choose()
+        timer.mark("choose")
+        for player in active:
             player.winners(winning_bin.outcomes)
-            for bet in self.table:
-                if bet.outcome in winning_bin:
-                    player.win(bet)
-                else:
-                    player.lose(bet)
-            self.table.clear()
+        for bet in self.table:
+            if bet.outcome in winning_bin:
+                bet.player.win(bet)
+            else:
+                bet.player.lose(bet)
+        timer.mark("resolve")
+        self.table.clear()
+        for player in active:
             player.rounds_to_go -= 1
+        timer.mark("update_game")
 
     def is_allowed(self, outcome: Outcome) -> bool:
         """Determines if the `Outcome` is allowed in the current state of the game.
@@ -1945,6 +2970,270 @@ class RouletteGame(Game):
         return True
 
 
+class TrajectorySink(ABC):
+    """Receives the full stake trajectory of each session run by a `Simulator`.
+
+    `Simulator.gather` only keeps summary statistics of each session. Callers who
+    need every `Player.stake` value opt in by providing a sink.
+    """
+
+    @abstractmethod
+    def append(self, stake: int) -> None:
+        """Records the `Player.stake` after a single cycle of the current session.
+
+        Args:
+            stake: The player's stake after the cycle.
+        """
+        pass
+
+    @abstractmethod
+    def end_session(self) -> None:
+        """Marks the end of the current session."""
+        pass
+
+
+class ListTrajectorySink(TrajectorySink):
+    """Keeps every session's stake trajectory in memory as a `list`.
+
+    Attributes:
+        sessions: A `list` of stake trajectories, one per completed session.
+    """
+
+    sessions: List[List[int]]
+
+    def __init__(self) -> None:
+        self.sessions = []
+        self._current: List[int] = []
+
+    def append(self, stake: int) -> None:
+        """Appends ``stake`` to the trajectory of the current session."""
+        self._current.append(stake)
+
+    def end_session(self) -> None:
+        """Stores the current trajectory and starts a new one."""
+        self.sessions.append(self._current)
+        self._current = []
+
+
+class ArchiveTrajectorySink(TrajectorySink):
+    """Writes every session's stake trajectory to a shard of a `TrajectoryArchive`
+    directory instead of keeping it in memory.
+
+    A shard is a pair of files: ``<shard>.stakes`` holds every stake as a
+    little-endian int64, and ``<shard>.index`` holds the number of stakes
+    written at the end of each session. Stakes are buffered and written in
+    blocks. Parallel workers each write their own shard of the same directory.
+
+    Attributes:
+        directory: The directory of the archive.
+        shard: The name of this sink's shard.
+        buffer_size: The number of stakes buffered before they are written.
+    """
+
+    STAKES = ".stakes"
+    INDEX = ".index"
+
+    def __init__(self, directory, shard: str = "0", buffer_size: int = 65536) -> None:
+        """Creates ``directory`` if needed and starts an empty shard, replacing
+        any shard of the same name."""
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.shard = shard
+        self.buffer_size = buffer_size
+        base = os.path.join(directory, shard)
+        self._stakes_file = open(base + self.STAKES, "wb")
+        self._index_file = open(base + self.INDEX, "wb")
+        self._stakes = array.array("q")
+        self._written = 0
+
+    def append(self, stake: int) -> None:
+        """Buffers ``stake``, writing the buffer once it is full."""
+        self._stakes.append(stake)
+        if len(self._stakes) >= self.buffer_size:
+            self._flush_stakes()
+
+    def end_session(self) -> None:
+        """Records the end offset of the current session in the index."""
+        offset = array.array("q", [self._written + len(self._stakes)])
+        self._write(self._index_file, offset)
+
+    def close(self) -> None:
+        """Writes the buffered stakes and closes the shard's files."""
+        if self._stakes_file.closed:
+            return
+        self._flush_stakes()
+        self._stakes_file.close()
+        self._index_file.close()
+
+    def _flush_stakes(self) -> None:
+        self._write(self._stakes_file, self._stakes)
+        self._written += len(self._stakes)
+        self._stakes = array.array("q")
+
+    @staticmethod
+    def _write(file: typing.BinaryIO, values: array.array) -> None:
+        if sys.byteorder == "big":
+            values = array.array("q", values)
+            values.byteswap()
+        values.tofile(file)
+
+    def __enter__(self) -> "ArchiveTrajectorySink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class TrajectoryArchive:
+    """Reads back the stake trajectories written by `ArchiveTrajectorySink`s.
+
+    The stakes of each shard are memory-mapped, so a session's trajectory is a
+    zero-copy `memoryview` of int64 stakes which is only read from disk as it is
+    used. Sessions are numbered through the shards in name order.
+
+    Attributes:
+        directory: The directory of the archive.
+        shards: The names of the shards, in order.
+    """
+
+    shards: List[str]
+
+    def __init__(self, directory) -> None:
+        """Maps every shard in ``directory``.
+
+        Raises:
+            ValueError: The byte order of the platform is not little-endian, so
+                the stakes can not be viewed without copying.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("TrajectoryArchive requires a little-endian platform.")
+        self.directory = directory
+        self.shards = sorted(
+            name[: -len(ArchiveTrajectorySink.INDEX)]
+            for name in os.listdir(directory)
+            if name.endswith(ArchiveTrajectorySink.INDEX)
+        )
+        self._maps: List[Optional[mmap.mmap]] = []
+        self._stakes: List[memoryview] = []
+        self._offsets: List[array.array] = []
+        self._first_sessions = [0]
+        for shard in self.shards:
+            base = os.path.join(directory, shard)
+            offsets = array.array("q")
+            with open(base + ArchiveTrajectorySink.INDEX, "rb") as index_file:
+                offsets.frombytes(index_file.read())
+            with open(base + ArchiveTrajectorySink.STAKES, "rb") as stakes_file:
+                size = os.fstat(stakes_file.fileno()).st_size
+                mapped = (
+                    mmap.mmap(stakes_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    if size
+                    else None
+                )
+            self._maps.append(mapped)
+            self._stakes.append(
+                memoryview(mapped if mapped is not None else b"").cast("q")
+            )
+            self._offsets.append(offsets)
+            self._first_sessions.append(self._first_sessions[-1] + len(offsets))
+
+    def __len__(self) -> int:
+        return self._first_sessions[-1]
+
+    def __getitem__(self, index: int) -> memoryview:
+        """Returns the stakes of the session with the given index across every
+        shard."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Session index out of range.")
+        shard = bisect.bisect_right(self._first_sessions, index) - 1
+        return self._session(shard, index - self._first_sessions[shard])
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for shard, offsets in enumerate(self._offsets):
+            for index in range(len(offsets)):
+                yield self._session(shard, index)
+
+    def shard_sessions(self, shard: str) -> List[memoryview]:
+        """Returns the stakes of every session of one shard.
+
+        Raises:
+            ValueError: There is no shard named ``shard``.
+        """
+        position = self.shards.index(shard)
+        return [
+            self._session(position, index)
+            for index in range(len(self._offsets[position]))
+        ]
+
+    def _session(self, shard: int, index: int) -> memoryview:
+        offsets = self._offsets[shard]
+        start = offsets[index - 1] if index else 0
+        return self._stakes[shard][start : offsets[index]]
+
+    def close(self) -> None:
+        """Releases the mapped files.
+
+        Raises:
+            BufferError: A session returned by the archive is still referenced.
+        """
+        for stakes in self._stakes:
+            stakes.release()
+        for mapped in self._maps:
+            if mapped is not None:
+                mapped.close()
+        self._stakes, self._maps = [], []
+
+    def __enter__(self) -> "TrajectoryArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@dataclass
+class SessionSummary:
+    """Streaming statistics of a single game session.
+
+    Attributes:
+        duration: The number of cycles the `Player` remained in the game.
+        maximum: The highest stake after any cycle of the session.
+        minimum: The lowest stake after any cycle of the session.
+        end_stake: The stake at the end of the session.
+        trajectory: The stake after every n-th cycle, if requested with
+            `Simulator.trajectory_every`.
+    """
+
+    duration: int
+    maximum: int
+    minimum: int
+    end_stake: int
+    trajectory: Optional[List[int]] = None
+
+
+@dataclass
+class GatherReport:
+    """The outcome of `Simulator.gather_until`.
+
+    Attributes:
+        samples: The number of sessions run.
+        widths: The width of the confidence interval of the mean of each metric
+            when gathering stopped.
+        stopped_by: Why gathering stopped. "width" once every interval was
+            narrow enough, otherwise "samples" or "time" when that budget ran
+            out.
+    """
+
+    samples: int
+    widths: Dict[str, float]
+    stopped_by: str
+
+    @property
+    def converged(self) -> bool:
+        """`True` if every confidence interval reached the requested width."""
+        return self.stopped_by == "width"
+
+
 class Simulator:
     """`Simulator` exercises the Roulette simulation with a given `Player` placing
     bets. It reports raw statistics on a number of sessions of play.
@@ -1961,12 +3250,26 @@ class Simulator:
             the game. Each session produces a duration metric.
         maxima: A `list` of maximum stakes for the `Player` object from each game
             session. The highest stake value reached for each session.
+        minima: A `list` of minimum stakes for the `Player` object from each game
+            session.
         end_stakes: A `list` of the player's stake at the end of their session.
         player: The `Player` instance. This encapsulates the betting strategy we
             are simulating.
         game: The casino game we are simulating. This is an instance of the `Game`
             class, which embodies the various rules, the `Table` object and the
             `Wheel` instance.
+        trajectory_sink: Optional; A `TrajectorySink` which receives every stake
+            value of every session run by `gather`.
+        trajectory_every: If greater than zero, each `SessionSummary` keeps the
+            stake after every ``trajectory_every``-th cycle.
+        seed_sequence: Optional; If set, `gather` reseeds the game's
+            `RandomEventFactory` and the player from the child of this sequence
+            for each session's index, so a session's result only depends on
+            this sequence and its index.
+        first_sample: The index of the first session run by `gather`. Set when
+            a run's sessions are split between several simulators.
+        profiler: Optional; A `CycleProfiler` which `gather` sets as the
+            game's `Game.profiler`, to time the phases of every cycle.
     """
 
     init_duration: int
@@ -1974,22 +3277,50 @@ class Simulator:
     samples: int
     durations: "IntegerStatistics"
     maxima: "IntegerStatistics"
+    minima: "IntegerStatistics"
     end_stakes: "IntegerStatistics"
+    trajectory_sink: Optional[TrajectorySink]
+    trajectory_every: int
+    seed_sequence: Optional[SeedSequence]
+    first_sample: int
+    profiler: Optional[CycleProfiler]
 
     def __init__(
-        self, game: Union[RouletteGame, CrapsGame], player: casino.players.Player
+        self,
+        game: Union[RouletteGame, CrapsGame],
+        player: casino.players.Player,
+        seed_sequence: Optional[SeedSequence] = None,
     ) -> None:
         self.init_duration = 250
         self.init_stake = 100
         self.samples = 50
         self.durations = IntegerStatistics()
         self.maxima = IntegerStatistics()
+        self.minima = IntegerStatistics()
         self.end_stakes = IntegerStatistics()
         self.player = player
         self.game = game
+        self.trajectory_sink = None
+        self.trajectory_every = 0
+        self.seed_sequence = seed_sequence
+        self.first_sample = 0
+        self.profiler = None
+
+    def seed_session(self, index: int) -> None:
+        """Reseeds the game's `RandomEventFactory` and the player for the session
+        with the given index, from the children of `seed_sequence`.
+
+        Args:
+            index: The index of the session within the whole run.
+        """
+        if self.seed_sequence is None:
+            raise ValueError("Simulator.seed_sequence is not set.")
+        session = self.seed_sequence.child(index)
+        self.game.event_factory.seed(session.child("events"))
+        self.player.seed(session.child("player"))
 
     def session(self) -> List[int]:
-        """Executes a single game session.
+        """Executes a single game session and keeps its full stake trajectory.
 
         The `Player` initial `stake` and `cycles_to_go` are set/reset and a full
         game session is completed accordingly by calling the `game.cycle` method
@@ -1999,87 +3330,1299 @@ class Simulator:
         Returns:
             A list of individual `Player.stake` values after each cycle.
         """
-        self.player.reset(self.init_duration, self.init_stake)
-        stake_values = []
-        while self.player.playing():
-            self.game.cycle(self.player)
-            stake_values.append(self.player.stake)
-        self.game.reset()
+        sink = ListTrajectorySink()
+        self.stream_session(sink)
+
+        return sink.sessions[0]
 
-        return stake_values
+    def stream_session(self, sink: Optional[TrajectorySink] = None) -> SessionSummary:
+        """Executes a single game session, tracking its statistics as it goes
+        rather than building a `list` of every stake value.
+
+        Args:
+            sink: Optional; A `TrajectorySink` to receive every stake value.
+
+        Returns:
+            The `SessionSummary` of the session. A session in which the player
+            never plays has a duration of zero and the initial stake for every
+            other metric.
+        """
+        player = self.player
+        game = self.game
+        every = self.trajectory_every
+        trajectory: Optional[List[int]] = [] if every > 0 else None
+        player.reset(self.init_duration, self.init_stake)
+        duration = 0
+        maximum = minimum = stake = player.stake
+        if player.playing():
+            game.cycle(player)
+            duration = 1
+            maximum = minimum = stake = player.stake
+            if sink is not None:
+                sink.append(stake)
+            if trajectory is not None and every == 1:
+                trajectory.append(stake)
+            while player.playing():
+                game.cycle(player)
+                duration += 1
+                stake = player.stake
+                if stake > maximum:
+                    maximum = stake
+                elif stake < minimum:
+                    minimum = stake
+                if sink is not None:
+                    sink.append(stake)
+                if trajectory is not None and duration % every == 0:
+                    trajectory.append(stake)
+        if sink is not None:
+            sink.end_session()
+        game.reset()
+
+        return SessionSummary(duration, maximum, minimum, stake, trajectory)
 
     def gather(self) -> None:
         """Executes the number of games in `samples` and records statistics.
 
-        Each game session returns a `list` of stake values which are used to
-        calculate the duration and maxima metrics for that session.
+        Each game session is streamed into a `SessionSummary` which provides the
+        duration, maxima, minima and end stake metrics for that session.
+        Each session is first reseeded with `seed_session` if `seed_sequence` is
+        set.
+        """
+        self._gather_sessions(0, self.samples)
+
+    def gather_until(
+        self,
+        width: float,
+        metrics: Sequence[str] = ("end_stakes", "durations"),
+        level: float = 0.95,
+        batch_size: int = 50,
+        max_samples: int = 100_000,
+        max_seconds: Optional[float] = None,
+    ) -> GatherReport:
+        """Executes game sessions in batches of ``batch_size`` until the
+        confidence interval of the mean of every metric in ``metrics`` is
+        narrower than ``width``, or a budget runs out. The sample budget is
+        always finite, so a strategy whose intervals never get narrow enough
+        stops after ``max_samples`` sessions.
+
+        High variance strategies, e.g. `RouletteMartingale`, are run for more
+        sessions than steady ones. Sessions are numbered on from those already
+        gathered, so with a `seed_sequence` the result is the same as a `gather`
+        of the same number of samples. `samples` is set to the number of
+        sessions gathered.
+
+        Args:
+            width: The largest acceptable width (upper - lower bound) of each
+                confidence interval.
+            metrics: The names of the `IntegerStatistics` attributes to check,
+                e.g. "end_stakes", "durations", "maxima" or "minima".
+            level: The confidence level of the intervals.
+            batch_size: The number of sessions run between checks.
+            max_samples: Stop once this many sessions have been run.
+            max_seconds: Optional; Stop after the first batch which ends this
+                many seconds after starting.
+
+        Returns:
+            A `GatherReport` of the number of samples and the final widths.
+
+        Raises:
+            ValueError: ``width``, ``batch_size`` or ``max_samples`` is not
+                positive, or a metric is unknown.
+        """
+        if width <= 0 or batch_size <= 0 or max_samples <= 0:
+            raise ValueError("width, batch_size and max_samples must be positive.")
+        statistics = {}
+        for metric in metrics:
+            values = getattr(self, metric, None)
+            if not isinstance(values, IntegerStatistics):
+                raise ValueError(f"Unknown metric: {metric}")
+            statistics[metric] = values
+
+        started = time.monotonic()
+        while True:
+            gathered = len(self.durations)
+            batch = min(batch_size, max_samples - gathered)
+            if batch > 0:
+                self._gather_sessions(gathered, batch)
+            self.samples = len(self.durations)
+            widths = {
+                metric: self._interval_width(values, level)
+                for metric, values in statistics.items()
+            }
+            if all(w < width for w in widths.values()):
+                stopped_by = "width"
+            elif self.samples >= max_samples:
+                stopped_by = "samples"
+            elif max_seconds is not None and time.monotonic() - started >= max_seconds:
+                stopped_by = "time"
+            else:
+                continue
+            return GatherReport(self.samples, widths, stopped_by)
+
+    @staticmethod
+    def _interval_width(values: IntegerStatistics, level: float) -> float:
+        """Returns the width of the normal confidence interval of the mean of
+        ``values``, which is infinite with fewer than two values."""
+        if len(values) < 2:
+            return math.inf
+        low, high = values.confidence_interval(level)
+        return high - low
+
+    def _gather_sessions(self, start: int, count: int) -> None:
+        """Executes ``count`` game sessions, numbered from ``start`` after
+        `first_sample`, and records their statistics. `profiler` is attached
+        to the game only while they run."""
+        previous = self.game.profiler
+        if self.profiler is not None:
+            self.game.profiler = self.profiler
+        try:
+            for n in range(start, start + count):
+                if self.seed_sequence is not None:
+                    self.seed_session(self.first_sample + n)
+                summary = self.stream_session(self.trajectory_sink)
+                self.durations.append(summary.duration)
+                self.maxima.append(summary.maximum)
+                self.minima.append(summary.minimum)
+                self.end_stakes.append(summary.end_stake)
+        finally:
+            self.game.profiler = previous
+
+
+class MultiPlayerSimulator:
+    """`MultiPlayerSimulator` exercises a game with several `Player` instances
+    sharing its `Table`, so every player's bets are resolved against the same
+    stream of random events. It reports raw statistics for each player.
+
+    A single event is chosen per cycle for all players, so simulating many
+    strategies together costs little more than simulating one.
+
+    Attributes:
+        init_duration: The duration (`Player.rounds_to_go`) value to use when
+            initialising each `Player` instance for a session.
+        init_stake: The stake value to use when initialising each `Player`
+            instance for a session.
+        samples: The number of game session cycles to simulate.
+        players: The `Player` instances sharing the game's `Table`.
+        durations: The session durations of each player, in the order of
+            `players`. A player's duration is the number of cycles they played.
+        maxima: The maximum stake of each session of each player.
+        minima: The minimum stake of each session of each player.
+        end_stakes: The stake at the end of each session of each player.
+        game: The casino game we are simulating.
+    """
+
+    init_duration: int
+    init_stake: int
+    samples: int
+    players: List[casino.players.Player]
+    durations: List["IntegerStatistics"]
+    maxima: List["IntegerStatistics"]
+    minima: List["IntegerStatistics"]
+    end_stakes: List["IntegerStatistics"]
+
+    def __init__(
+        self,
+        game: Union[RouletteGame, CrapsGame],
+        players: Iterable[casino.players.Player],
+    ) -> None:
+        self.init_duration = 250
+        self.init_stake = 100
+        self.samples = 50
+        self.game = game
+        self.players = list(players)
+        self.durations = [IntegerStatistics() for _ in self.players]
+        self.maxima = [IntegerStatistics() for _ in self.players]
+        self.minima = [IntegerStatistics() for _ in self.players]
+        self.end_stakes = [IntegerStatistics() for _ in self.players]
+
+    def stream_session(self) -> List[SessionSummary]:
+        """Executes a single game session, cycling the game until no player is
+        still playing.
+
+        Returns:
+            The `SessionSummary` of each player, in the order of `players`.
         """
+        players = self.players
+        for player in players:
+            player.reset(self.init_duration, self.init_stake)
+        durations = [0] * len(players)
+        maxima = [player.stake for player in players]
+        minima = list(maxima)
+        active = [n for n, player in enumerate(players) if player.playing()]
+        while active:
+            self.game.cycle_all([players[n] for n in active])
+            for n in active:
+                stake = players[n].stake
+                durations[n] += 1
+                if durations[n] == 1:
+                    maxima[n] = minima[n] = stake
+                elif stake > maxima[n]:
+                    maxima[n] = stake
+                elif stake < minima[n]:
+                    minima[n] = stake
+            active = [n for n in active if players[n].playing()]
+        self.game.reset()
+
+        return [
+            SessionSummary(durations[n], maxima[n], minima[n], player.stake)
+            for n, player in enumerate(players)
+        ]
+
+    def gather(self) -> None:
+        """Executes the number of games in `samples` and records the statistics
+        of each player."""
         for _ in range(self.samples):
-            stake_values = self.session()
-            self.durations.append(len(stake_values))
-            self.maxima.append(max(stake_values))
-            self.end_stakes.append(stake_values[-1])
+            for n, summary in enumerate(self.stream_session()):
+                self.durations[n].append(summary.duration)
+                self.maxima[n].append(summary.maximum)
+                self.minima[n].append(summary.minimum)
+                self.end_stakes[n].append(summary.end_stake)
+
+    def results(self) -> List["SimulationResult"]:
+        """Returns the gathered statistics as one `SimulationResult` per player,
+        in the order of `players`."""
+        return [
+            SimulationResult(
+                player.__class__.__name__,
+                0,
+                self.durations[n],
+                self.maxima[n],
+                self.end_stakes[n],
+                minima=self.minima[n],
+            )
+            for n, player in enumerate(self.players)
+        ]
 
 
-class IntegerStatistics(typing.List[int]):
-    """Computes several simple descriptive statistics of `int` values in a `list`.
+def normal_quantile(p: float) -> float:
+    """Returns the value below which a standard normal variable falls with
+    probability ``p``, found by bisection on `math.erf`.
 
-    This extends `list` with some additional methods.
+    Args:
+        p: A probability strictly between 0 and 1.
     """
+    if not 0 < p < 1:
+        raise ValueError("p must be between 0 and 1 exclusive.")
+    low, high = -10.0, 10.0
+    for _ in range(100):
+        mid = (low + high) / 2
+        if (1 + math.erf(mid / math.sqrt(2))) / 2 < p:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+class IntegerStatistics(typing.Sequence[int]):
+    """Computes several descriptive statistics of `int` values in a single pass.
+
+    Values are kept in a compact `array` of 64-bit integers while the count, mean,
+    sum of squared deviations, minimum and maximum are updated with Welford's
+    algorithm as each value is added. Two instances, e.g. gathered by separate
+    workers, can be combined with `merge`.
+
+    This behaves as a read-only sequence of the values added with `append` and
+    `extend`.
+    """
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        """Creates the statistics, adding any initial ``values``."""
+        self._values = array.array("q")
+        self._sorted: Optional[List[int]] = None
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min: Optional[int] = None
+        self._max: Optional[int] = None
+        self.extend(values)
+
+    def append(self, value: int) -> None:
+        """Adds a single ``value`` and updates the running statistics."""
+        self._values.append(value)
+        self._sorted = None
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def extend(self, values: Iterable[int]) -> None:
+        """Adds each of the given ``values``."""
+        for value in values:
+            self.append(value)
+
+    def merge(self, other: "IntegerStatistics") -> None:
+        """Combines the values and running statistics of ``other`` into this
+        instance, as if its values had been appended in order.
+
+        Args:
+            other: The statistics to merge in. It is not modified.
+        """
+        if not other._count:
+            return
+        count = self._count + other._count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta ** 2 * self._count * other._count / count
+        self._mean += delta * other._count / count
+        self._count = count
+        self._values.extend(other._values)
+        self._sorted = None
+        self._min = other._min if self._min is None else min(self._min, other.min())
+        self._max = other._max if self._max is None else max(self._max, other.max())
 
     def mean(self) -> float:
-        """Computes the mean of the `List` of values."""
-        return round(sum(self) / len(self), 2)
+        """Computes the mean of the values, rounded to 2 decimal places."""
+        return round(self.exact_mean(), 2)
 
     def stdev(self) -> float:
-        """Computes the standard deviation of the `List` of values."""
-        m = self.mean()
-        return round(math.sqrt(sum((x - m) ** 2 for x in self) / (len(self) - 1)), 2)
+        """Computes the standard deviation of the values, rounded to 2 decimal
+        places."""
+        return round(math.sqrt(self.variance()), 2)
+
+    def exact_mean(self) -> float:
+        """Returns the unrounded mean of the values.
+
+        Raises:
+            ZeroDivisionError: There are no values.
+        """
+        if not self._count:
+            raise ZeroDivisionError("Mean requires at least one value.")
+        return self._mean
+
+    def variance(self) -> float:
+        """Returns the unrounded sample variance of the values.
+
+        Raises:
+            ZeroDivisionError: There are fewer than two values.
+        """
+        if self._count < 2:
+            raise ZeroDivisionError("Variance requires at least two values.")
+        return self._m2 / (self._count - 1)
+
+    def min(self) -> int:
+        """Returns the smallest value.
+
+        Raises:
+            ValueError: There are no values.
+        """
+        if self._min is None:
+            raise ValueError("min() of empty IntegerStatistics.")
+        return self._min
+
+    def max(self) -> int:
+        """Returns the largest value.
+
+        Raises:
+            ValueError: There are no values.
+        """
+        if self._max is None:
+            raise ValueError("max() of empty IntegerStatistics.")
+        return self._max
+
+    def quantile(self, q: float) -> float:
+        """Returns the ``q`` quantile of the values, linearly interpolating
+        between the two nearest values.
+
+        Args:
+            q: The quantile to compute, between 0 and 1 inclusive. E.g. 0.5 for
+                the median.
+
+        Raises:
+            ValueError: There are no values or ``q`` is out of range.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1 inclusive.")
+        if not self._count:
+            raise ValueError("quantile() of empty IntegerStatistics.")
+        if self._sorted is None:
+            self._sorted = sorted(self._values)
+        position = q * (self._count - 1)
+        lower = int(position)
+        upper = min(lower + 1, self._count - 1)
+        fraction = position - lower
+        low, high = self._sorted[lower], self._sorted[upper]
+        return low + (high - low) * fraction
+
+    def median(self) -> float:
+        """Returns the median of the values."""
+        return self.quantile(0.5)
+
+    def confidence_interval(
+        self,
+        level: float = 0.95,
+        method: str = "normal",
+        resamples: int = 1000,
+        rng: Optional[random.Random] = None,
+    ) -> Tuple[float, float]:
+        """Returns a confidence interval for the mean of the values.
+
+        Args:
+            level: The confidence level, e.g. 0.95.
+            method: Either "normal", using the standard error of the mean, or
+                "bootstrap", using the percentiles of the means of ``resamples``
+                resamples of the values.
+            resamples: The number of bootstrap resamples.
+            rng: Optional; The `random.Random` used to draw bootstrap resamples.
+
+        Returns:
+            A tuple of the (lower, upper) bounds of the interval.
+
+        Raises:
+            ValueError: Unknown ``method``.
+        """
+        if method == "normal":
+            half_width = normal_quantile((1 + level) / 2) * self.standard_error()
+            return self._mean - half_width, self._mean + half_width
+        elif method == "bootstrap":
+            rng = rng if rng else random.Random()
+            means = IntegerStatistics()
+            for _ in range(resamples):
+                means.append(sum(rng.choices(self._values, k=self._count)))
+            alpha = (1 - level) / 2
+            return (
+                means.quantile(alpha) / self._count,
+                means.quantile(1 - alpha) / self._count,
+            )
+        else:
+            raise ValueError(f"Unknown confidence interval method: {method}")
+
+    def standard_error(self) -> float:
+        """Returns the standard error of the mean of the values."""
+        return math.sqrt(self.variance() / self._count)
+
+    def describe(self) -> Dict[str, float]:
+        """Returns every descriptive statistic of the values in a single `dict`.
+
+        Returns:
+            A `dict` with the count, mean, stdev, min, max, median, p5, p95 and
+            the lower and upper bounds of the normal 95% confidence interval of
+            the mean. The mean and stdev are rounded as in `mean` and `stdev`.
+        """
+        ci_low, ci_high = self.confidence_interval()
+        return {
+            "count": self._count,
+            "mean": self.mean(),
+            "stdev": self.stdev(),
+            "min": self.min(),
+            "max": self.max(),
+            "median": self.median(),
+            "p5": self.quantile(0.05),
+            "p95": self.quantile(0.95),
+            "ci_low": ci_low,
+            "ci_high": ci_high,
+        }
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._values)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> int:
+        ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> List[int]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, List[int]]:
+        if isinstance(index, slice):
+            return self._values[index].tolist()
+        return self._values[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IntegerStatistics):
+            return self._values == other._values
+        if isinstance(other, list):
+            return self._values.tolist() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._values.tolist()!r})"
+
+
+@dataclass(frozen=True)
+class SimulationTask:
+    """A self-contained unit of `BulkSimulator` work which can be shipped to a
+    worker process.
+
+    Each task carries the classes needed to build its own `RandomEventFactory`,
+    `Table` and `Game`, so no state is shared between tasks.
+
+    Attributes:
+        game_type: The `Game` subclass to simulate, e.g. `RouletteGame`.
+        event_factory_type: The `RandomEventFactory` subclass used by the game,
+            e.g. `Wheel`.
+        player_type: The `Player` subclass to simulate.
+        samples: The number of sessions to run for this task.
+        chunk: The index of this task amongst the tasks of the same player.
+        first_sample: The index of the task's first session amongst all the
+            sessions of the player.
+        seed_sequence: Optional; The `SeedSequence` of the player, from which
+            each session is seeded by its index. If `None` an unseeded
+            `random.Random` is used.
+        validation: Optional; The `ValidationPolicy` of the task's `Table`. If
+            `None` the `Table` default is used.
+        init_stake: The stake each session starts with.
+        init_duration: The duration (`Player.rounds_to_go`) of each session.
+        trajectory_directory: Optional; The directory of a `TrajectoryArchive`
+            to which the task writes its own shard, named by `shard_name`.
+        profile: If `True` the phases of every cycle are timed by a
+            `CycleProfiler`, returned with the result.
+        table_limit: The `Table.limit` of the task's `Table`.
+        prefetch: The `RandomEventFactory.prefetch` of the task's device, which
+            changes the stream of events drawn for a seed.
+    """
+
+    game_type: Type[Game]
+    event_factory_type: Type[RandomEventFactory]
+    player_type: Type[casino.players.Player]
+    samples: int
+    chunk: int = 0
+    first_sample: int = 0
+    seed_sequence: Optional[SeedSequence] = None
+    validation: Optional[ValidationPolicy] = None
+    init_stake: int = 100
+    init_duration: int = 250
+    trajectory_directory: Optional[str] = None
+    profile: bool = False
+    table_limit: int = 30
+    prefetch: int = 0
+
+    @property
+    def shard_name(self) -> str:
+        """The name of the task's `TrajectoryArchive` shard, which sorts by
+        player and then by chunk."""
+        return shard_name(self.player_type.__name__, self.chunk)
+
+
+def shard_name(player_name: str, chunk: int = 0) -> str:
+    """Returns the `TrajectoryArchive` shard name of a chunk of a player's
+    sessions."""
+    return f"{player_name}-{chunk:05d}"
+
+
+@dataclass
+class SimulationResult:
+    """The raw per-session metrics produced by running a `SimulationTask`.
+
+    Attributes:
+        player: The class name of the simulated `Player`.
+        chunk: The chunk index of the task which produced this result.
+        durations: The duration of each session.
+        maxima: The maximum stake of each session.
+        end_stakes: The stake at the end of each session.
+        profiler: Optional; The `CycleProfiler` of a task run with ``profile``.
+        minima: The minimum stake of each session.
+    """
+
+    player: str
+    chunk: int
+    durations: IntegerStatistics
+    maxima: IntegerStatistics
+    end_stakes: IntegerStatistics
+    profiler: Optional[CycleProfiler] = None
+    minima: IntegerStatistics = field(default_factory=IntegerStatistics)
+
+
+def run_simulation_task(task: SimulationTask) -> SimulationResult:
+    """Builds a fresh game for ``task`` and gathers its statistics.
+
+    This is a module level function so that it can be pickled and run by the
+    worker processes of a `concurrent.futures.ProcessPoolExecutor`.
+
+    Args:
+        task: The `SimulationTask` to execute.
+
+    Returns:
+        A `SimulationResult` holding the raw session metrics.
+    """
+    table = Table(validation=task.validation)
+    table.limit = task.table_limit
+    game: Union[RouletteGame, CrapsGame]
+    layout = task.event_factory_type.shared_layout()
+    event_factory = task.event_factory_type(prefetch=task.prefetch, layout=layout)
+    game = task.game_type(event_factory, table)  # type: ignore
+    table.set_game(game)
+    player = task.player_type(table)
+    sim = Simulator(game, player, task.seed_sequence)
+    sim.samples = task.samples
+    sim.first_sample = task.first_sample
+    sim.init_stake, sim.init_duration = task.init_stake, task.init_duration
+    if task.profile:
+        sim.profiler = CycleProfiler()
+    if task.trajectory_directory is None:
+        sim.gather()
+    else:
+        with ArchiveTrajectorySink(task.trajectory_directory, task.shard_name) as sink:
+            sim.trajectory_sink = sink
+            sim.gather()
+
+    return SimulationResult(
+        player.__class__.__name__,
+        task.chunk,
+        sim.durations,
+        sim.maxima,
+        sim.end_stakes,
+        sim.profiler,
+        sim.minima,
+    )
+
+
+class BulkProgress:
+    """Receives the progress of `BulkSimulator.gather_all` as it happens, e.g. to
+    report it or to write each player's results as soon as they are complete.
+
+    Every method does nothing by default, so subclasses only override the
+    events they need.
+    """
+
+    def chunk_done(self, result: SimulationResult, done: int, total: int) -> None:
+        """Called as each `SimulationTask` completes, in task order.
+
+        Args:
+            result: The result of the task.
+            done: The number of tasks completed so far.
+            total: The number of tasks of the run.
+        """
+        pass
+
+    def player_done(self, result: SimulationResult, row: Dict) -> None:
+        """Called once all the sessions of a player are gathered, in the order
+        of `BulkSimulator.players`.
+
+        Args:
+            result: The merged result of every session of the player.
+            row: The player's `BulkSimulator.player_stats` row.
+        """
+        pass
+
+
+class BulkCheckpoint:
+    """A log of the work completed by `BulkSimulator.gather_all`, from which an
+    interrupted run resumes.
+
+    The file is JSON lines. The first line holds the `BulkSimulator.metadata`
+    of the run, and each further line holds the sessions of one completed
+    `SimulationTask`, or of one player of an unseeded single process run along
+    with the state of the shared game's RNG after it. Each line is flushed and
+    synced to disk as it is written, so a run killed at any point only loses
+    the work in progress. A partly written last line is dropped when the file
+    is opened again.
+
+    Attributes:
+        file_path: The path of the checkpoint file.
+        metadata: The settings of the run.
+        completed: Maps the (player, chunk) of each completed task to its
+            `SimulationResult`.
+        rng_state: The `random.Random.getstate` recorded with the last
+            completed player of an unseeded run, or `None`.
+    """
+
+    # The number of workers does not change the results of a run.
+    IGNORED_SETTINGS = ("workers",)
+
+    completed: Dict[Tuple[str, int], SimulationResult]
+    rng_state: Optional[Tuple]
+
+    def __init__(self, file_path, metadata: Dict) -> None:
+        """Loads the work completed so far from ``file_path``, or starts a new
+        checkpoint file if it does not exist.
+
+        Raises:
+            ValueError: The file is the checkpoint of a run with other settings.
+        """
+        self.file_path = file_path
+        self.metadata = metadata
+        self.completed = {}
+        self.rng_state = None
+        valid = self._load() if os.path.exists(file_path) else 0
+        if valid:
+            os.truncate(file_path, valid)
+            self._file = open(file_path, "ab")
+        else:
+            self._file = open(file_path, "wb")
+            self._write({"metadata": metadata})
+
+    def _load(self) -> int:
+        """Reads the checkpoint file, returning the length of its complete
+        lines."""
+        valid = 0
+        with open(self.file_path, "rb") as checkpoint_file:
+            for line in checkpoint_file:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not valid:
+                    self._check(record["metadata"])
+                else:
+                    result = SimulationResult(
+                        record["player"],
+                        record["chunk"],
+                        IntegerStatistics(record["durations"]),
+                        IntegerStatistics(record["maxima"]),
+                        IntegerStatistics(record["end_stakes"]),
+                        minima=IntegerStatistics(record["minima"]),
+                    )
+                    self.completed[(result.player, result.chunk)] = result
+                    if record.get("rng_state") is not None:
+                        version, state, gauss = record["rng_state"]
+                        self.rng_state = (version, tuple(state), gauss)
+                valid += len(line)
+        return valid
+
+    def _check(self, metadata: Dict) -> None:
+        for key in set(metadata) | set(self.metadata):
+            if key in self.IGNORED_SETTINGS:
+                continue
+            if metadata.get(key) != self.metadata.get(key):
+                raise ValueError(
+                    f"{self.file_path} is the checkpoint of a run with {key}="
+                    f"{metadata.get(key)!r}, not {self.metadata.get(key)!r}."
+                )
+
+    def record(
+        self, result: SimulationResult, rng_state: Optional[Tuple] = None
+    ) -> None:
+        """Appends the sessions of a completed task to the checkpoint file.
+
+        Args:
+            result: The result of the task.
+            rng_state: Optional; The state of the shared game's RNG after the
+                task, for an unseeded run.
+        """
+        self.completed[(result.player, result.chunk)] = result
+        if rng_state is not None:
+            self.rng_state = rng_state
+        self._write(
+            {
+                "player": result.player,
+                "chunk": result.chunk,
+                "durations": list(result.durations),
+                "maxima": list(result.maxima),
+                "end_stakes": list(result.end_stakes),
+                "minima": list(result.minima),
+                "rng_state": rng_state,
+            }
+        )
+
+    def _write(self, record: Dict) -> None:
+        self._file.write(json.dumps(record).encode() + b"\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Closes the checkpoint file."""
+        self._file.close()
+
+    def __enter__(self) -> "BulkCheckpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 class BulkSimulator:
     """Executes a `Simulator` instance for each `Player` subclass and writes metrics
     to a CSV file.
 
+    Without a ``seed`` and with a single worker every player is simulated in turn
+    on the shared ``game``. Otherwise, the work is split into `SimulationTask`s,
+    one per ``chunk_size`` samples of each player, which are run in-process or
+    fanned out to a pool of ``workers`` processes. Each task builds its own
+    `RandomEventFactory`, `Table` and `Game` seeded from ``seed``, the player
+    name and the session index through a `SeedSequence`, so for a given ``seed``
+    the gathered `player_stats` are identical regardless of the number of
+    workers and of ``chunk_size``.
+    Task devices are constructed from the `RandomEventFactory.shared_layout` of
+    their class, which each process builds only once.
+
+    With ``common_random_numbers`` every player replays the same `EventSequence`
+    for each sample instead, so differences between players are not masked by
+    each seeing different events. The sequence of a sample is drawn once and
+    shared by all players, and `paired_differences` compares the players
+    sample by sample. This mode runs in a single process.
+
     Attributes:
         game: The casino game we are simulating. This is an instance of the `Game`
             class, which embodies the various rules, the `Table` object and the
             `Wheel` instance.
-        players: A `List` of all `Player` subclasses.
+        players: The `Player` subclasses to simulate. Defaults to every concrete
+            player of ``game``, from `get_all_players`.
         player_stats: A `list` of `dict`'s containing the stats for each player's
             `Simulator` run.
+        samples: The number of sessions to simulate for each player.
+        init_stake: The stake each session starts with.
+        init_duration: The duration (`Player.rounds_to_go`) of each session.
+        seed: Optional; The root seed, or root `SeedSequence`, from which the
+            seed of each session is derived.
+        workers: The number of worker processes. 1 runs every task in-process.
+        chunk_size: Optional; The maximum number of samples in each task. If
+            `None` each player is run as a single task.
+        validation: The `ValidationPolicy` applied to every `Table`, reported
+            by `metadata`.
+        common_random_numbers: If `True`, every player replays the same events
+            for each sample.
+        results: The raw metrics of each session of each player, in the order
+            of `players`. See `results_store`.
+        trajectory_directory: Optional; If set, the stake trajectory of every
+            session is written to a `TrajectoryArchive` in this directory, with
+            a shard per task.
+        profiler: Optional; If set, the phases of every cycle of every player
+            are timed and merged into this `CycleProfiler`. See `save_profile`.
+        progress: Optional; A `BulkProgress` told of each completed task and
+            player.
+        table_limit: The `Table.limit` of every player's table.
+        checkpoint_path: Optional; If set, completed work is recorded in a
+            `BulkCheckpoint` at this path, and `gather_all` resumes from it.
     """
 
     players: List[Type[casino.players.Player]]
     player_stats: List[Dict]
+    validation: ValidationPolicy
+    results: List[SimulationResult]
+    trajectory_directory: Optional[str]
+    profiler: Optional[CycleProfiler]
+    progress: Optional[BulkProgress]
+    checkpoint_path: Optional[str]
 
-    def __init__(self, game: RouletteGame) -> None:
+    def __init__(
+        self,
+        game: Union[RouletteGame, CrapsGame],
+        seed: Union[int, str, SeedSequence, None] = None,
+        workers: int = 1,
+        chunk_size: Optional[int] = None,
+        validation: Optional[ValidationPolicy] = None,
+        common_random_numbers: bool = False,
+    ) -> None:
         """Initialise `BulkSimulator` with the `game` we are simulating and gather
         all the player objects into self.players."""
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if common_random_numbers and workers != 1:
+            raise ValueError("common_random_numbers runs in a single process.")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
         self.game = game
-        self.players = self.get_all_players()
+        self.players = self.get_all_players(type(game))
         self.player_stats = []
+        self.samples = 50
+        self.init_stake = 100
+        self.init_duration = 250
+        self.seed = seed
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.validation = validation if validation else FullValidation()
+        self.common_random_numbers = common_random_numbers
+        self.results = []
+        self.trajectory_directory = None
+        self.profiler = None
+        self.progress = None
+        self.table_limit = 30
+        self.checkpoint_path = None
+        self._paired = False
+
+    @property
+    def seed_sequence(self) -> Optional[SeedSequence]:
+        """The root `SeedSequence` of a seeded run, or `None` if unseeded."""
+        if self.seed is None or isinstance(self.seed, SeedSequence):
+            return self.seed
+        return SeedSequence(self.seed)
 
     def gather_all(self) -> None:
         """Behaves similarly to `Simulator.gather` but gathers statistics for every
         `Player` subclass and adds them as a `dict` to `self.player_stats`.
+
+        Rows are always appended in the order of `self.players`, and the samples
+        of a chunked player are merged in chunk order. The raw metrics of every
+        session are kept in `self.results`.
+
+        With `self.checkpoint_path` set, each completed task is recorded in a
+        `BulkCheckpoint`, and the tasks already recorded there by an earlier,
+        interrupted run with the same `metadata` are not run again. Seeded
+        sessions do not depend on the order they are run in, so a resumed
+        seeded run gathers the same `player_stats` as an uninterrupted one.
+
+        Raises:
+            ValueError: A checkpoint is set for a `common_random_numbers` run,
+                or the checkpoint file is of a run with other settings.
         """
+        if self.common_random_numbers:
+            if self.checkpoint_path is not None:
+                raise ValueError("common_random_numbers runs can not be resumed.")
+            self.gather_common()
+            return
+        self._paired = False
+        with contextlib.ExitStack() as stack:
+            checkpoint = None
+            if self.checkpoint_path is not None:
+                checkpoint = stack.enter_context(
+                    BulkCheckpoint(self.checkpoint_path, self.metadata())
+                )
+            if self.seed is None and self.workers == 1:
+                self._gather_shared(checkpoint)
+            else:
+                self._gather_tasks(checkpoint, stack)
+
+    def _gather_shared(self, checkpoint: Optional[BulkCheckpoint]) -> None:
+        """Simulates every player in turn on the shared, unseeded `self.game`.
+
+        The shared RNG is restored from ``checkpoint`` before the first player
+        which is not complete, so it continues where the interrupted run was.
+        """
+        self.game.table.validation = self.validation
+        self.game.table.limit = self.table_limit
+        completed = checkpoint.completed if checkpoint is not None else {}
+        rng = self.game.event_factory.rng
+        if checkpoint is not None and checkpoint.rng_state is not None:
+            rng.setstate(checkpoint.rng_state)
+            self.game.event_factory.discard_prefetched()
         for player in self.players:
-            p = player(self.game.table)
-            p_sim = Simulator(self.game, p)
-            p_sim.gather()
-            self.player_stats.append(
-                {
-                    "player": p.__class__.__name__,
-                    "duration_mean": p_sim.durations.mean(),
-                    "duration_stdev": p_sim.durations.stdev(),
-                    "maxima_mean": p_sim.maxima.mean(),
-                    "maxima_stdev": p_sim.maxima.stdev(),
-                    "end_stake_mean": p_sim.end_stakes.mean(),
-                    "end_stake_stdev": p_sim.end_stakes.stdev(),
-                }
+            result = completed.get((player.__name__, 0))
+            if result is None:
+                p = player(self.game.table)
+                p_sim = Simulator(self.game, p)
+                p_sim.samples = self.samples
+                p_sim.init_stake = self.init_stake
+                p_sim.init_duration = self.init_duration
+                p_sim.profiler = self.profiler
+                self._gather_with_archive(p_sim, shard_name(player.__name__))
+                result = SimulationResult(
+                    p.__class__.__name__,
+                    0,
+                    p_sim.durations,
+                    p_sim.maxima,
+                    p_sim.end_stakes,
+                    minima=p_sim.minima,
+                )
+                if checkpoint is not None:
+                    # Unused prefetched events can not be restored with the RNG.
+                    self.game.event_factory.discard_prefetched()
+                    checkpoint.record(result, rng.getstate())
+            self._add_player(result)
+
+    def _gather_tasks(
+        self, checkpoint: Optional[BulkCheckpoint], stack: contextlib.ExitStack
+    ) -> None:
+        """Runs the `SimulationTask`s of every player which are not complete in
+        ``checkpoint``, in-process or in a pool of `self.workers` processes
+        entered on ``stack``."""
+        tasks = self.tasks()
+        completed = checkpoint.completed if checkpoint is not None else {}
+        pending = [
+            task
+            for task in tasks
+            if (task.player_type.__name__, task.chunk) not in completed
+        ]
+        remaining = {player.__name__: 0 for player in self.players}
+        for task in tasks:
+            remaining[task.player_type.__name__] += 1
+        results: Iterator[SimulationResult]
+        if self.workers == 1:
+            results = map(run_simulation_task, pending)
+        else:
+            executor = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(self.workers)
+            )
+            results = executor.map(run_simulation_task, pending)
+
+        # Results arrive in task order, so each player is merged as soon as its
+        # last chunk is done.
+        merged: Optional[SimulationResult] = None
+        for done, task in enumerate(tasks, 1):
+            result = completed.get((task.player_type.__name__, task.chunk))
+            if result is None:
+                result = next(results)
+                if checkpoint is not None:
+                    checkpoint.record(result)
+                if self.profiler is not None and result.profiler is not None:
+                    self.profiler.merge(result.profiler)
+            if self.progress is not None:
+                self.progress.chunk_done(result, done, len(tasks))
+            if merged is None:
+                merged = SimulationResult(
+                    result.player,
+                    0,
+                    IntegerStatistics(),
+                    IntegerStatistics(),
+                    IntegerStatistics(),
+                )
+            merged.durations.merge(result.durations)
+            merged.maxima.merge(result.maxima)
+            merged.end_stakes.merge(result.end_stakes)
+            merged.minima.merge(result.minima)
+            remaining[result.player] -= 1
+            if not remaining[result.player]:
+                self._add_player(merged)
+                merged = None
+
+    def _add_player(self, result: SimulationResult) -> None:
+        """Records the merged ``result`` of a player in `self.results` and
+        `self.player_stats`, and tells `self.progress`."""
+        self.results.append(result)
+        row = self.player_summary(
+            result.player, result.durations, result.maxima, result.end_stakes
+        )
+        self.player_stats.append(row)
+        if self.progress is not None:
+            self.progress.player_done(result, row)
+
+    def _gather_with_archive(self, sim: Simulator, shard: str) -> None:
+        """Runs `Simulator.gather`, writing the trajectories to ``shard`` of
+        `self.trajectory_directory` if it is set."""
+        if self.trajectory_directory is None:
+            sim.gather()
+            return
+        with ArchiveTrajectorySink(self.trajectory_directory, shard) as sink:
+            sim.trajectory_sink = sink
+            sim.gather()
+
+    def gather_common(self) -> None:
+        """Gathers statistics for every `Player` subclass with common random
+        numbers, adding them to `self.results` and `self.player_stats`.
+
+        Each player gets its own `Table` and `Game`, with a `ReplayEventFactory`
+        built from the layout of the shared ``game``'s device. For each sample,
+        one `EventSequence` is drawn, seeded from ``seed`` and the sample index,
+        and every player plays a session on it.
+        """
+        # Only results which all replayed the same events can be paired.
+        self._paired = not self.results
+        root = self.seed_sequence
+        device_type = type(self.game.event_factory)
+        prefetch = self.game.event_factory.prefetch
+        layout = device_type.shared_layout()
+        sims = []
+        # Every shard is closed, even if a session raises.
+        with contextlib.ExitStack() as stack:
+            for player_type in self.players:
+                table = Table(validation=self.validation)
+                table.limit = self.table_limit
+                game: Union[RouletteGame, CrapsGame]
+                replay = ReplayEventFactory(
+                    device_type(prefetch=prefetch, layout=layout)
+                )
+                game = type(self.game)(replay, table)  # type: ignore
+                table.set_game(game)
+                player_seed = None if root is None else root.child(player_type.__name__)
+                sim = Simulator(game, player_type(table), player_seed)
+                sim.init_stake, sim.init_duration = self.init_stake, self.init_duration
+                game.profiler = self.profiler
+                if self.trajectory_directory is not None:
+                    sim.trajectory_sink = stack.enter_context(
+                        ArchiveTrajectorySink(
+                            self.trajectory_directory, shard_name(player_type.__name__)
+                        )
+                    )
+                sims.append(sim)
+            for sample in range(self.samples):
+                sequence = EventSequence(
+                    layout.events,
+                    random.Random() if root is None else root.child(sample).random(),
+                    self.init_duration,
+                )
+                for sim in sims:
+                    sim.game.event_factory.replay(sequence)  # type: ignore
+                    if root is not None:
+                        sim.seed_session(sample)
+                    summary = sim.stream_session(sim.trajectory_sink)
+                    sim.durations.append(summary.duration)
+                    sim.maxima.append(summary.maximum)
+                    sim.minima.append(summary.minimum)
+                    sim.end_stakes.append(summary.end_stake)
+
+        for sim in sims:
+            name = sim.player.__class__.__name__
+            self._add_player(
+                SimulationResult(
+                    name,
+                    0,
+                    sim.durations,
+                    sim.maxima,
+                    sim.end_stakes,
+                    minima=sim.minima,
+                )
             )
 
+    def paired_differences(self, metric: str = "end_stakes") -> List[Dict]:
+        """Compares every pair of players gathered with common random numbers by
+        the per-sample differences of a metric.
+
+        As both players of a pair played the same events in each sample, the
+        differences have a much smaller variance than the metric itself, so a
+        difference between strategies is resolved with fewer samples.
+
+        Args:
+            metric: The `SimulationResult` metric to compare: "durations",
+                "maxima" or "end_stakes".
+
+        Returns:
+            A `list` of `dict`'s, one per pair of players, with the mean, stdev
+            and normal 95% confidence interval of the ``player`` metric minus
+            the ``baseline`` metric.
+
+        Raises:
+            ValueError: `self.results` were not all gathered with
+                `common_random_numbers`, so their samples are not paired.
+        """
+        if not self._paired:
+            raise ValueError(
+                "paired_differences needs results gathered with common_random_numbers."
+            )
+        rows = []
+        for n, baseline in enumerate(self.results):
+            for result in self.results[n + 1 :]:
+                differences = IntegerStatistics(
+                    a - b
+                    for a, b in zip(getattr(result, metric), getattr(baseline, metric))
+                )
+                summary = differences.describe()
+                rows.append(
+                    {
+                        "player": result.player,
+                        "baseline": baseline.player,
+                        "metric": metric,
+                        "difference_mean": summary["mean"],
+                        "difference_stdev": summary["stdev"],
+                        "ci_low": summary["ci_low"],
+                        "ci_high": summary["ci_high"],
+                    }
+                )
+        return rows
+
+    def tasks(self) -> List[SimulationTask]:
+        """Splits the samples of every player into `SimulationTask`s.
+
+        Returns:
+            A `list` of tasks, ordered by player and then by chunk.
+        """
+        root = self.seed_sequence
+        chunk_size = self.chunk_size or self.samples
+        tasks = []
+        for player in self.players:
+            for chunk, start in enumerate(range(0, self.samples, chunk_size)):
+                tasks.append(
+                    SimulationTask(
+                        type(self.game),
+                        type(self.game.event_factory),
+                        player,
+                        min(chunk_size, self.samples - start),
+                        chunk,
+                        start,
+                        None if root is None else root.child(player.__name__),
+                        self.validation,
+                        self.init_stake,
+                        self.init_duration,
+                        self.trajectory_directory,
+                        self.profiler is not None,
+                        self.table_limit,
+                        self.game.event_factory.prefetch,
+                    )
+                )
+        return tasks
+
+    @staticmethod
+    def player_summary(
+        player_name: str,
+        durations: IntegerStatistics,
+        maxima: IntegerStatistics,
+        end_stakes: IntegerStatistics,
+    ) -> Dict:
+        """Builds the `player_stats` row for a single player.
+
+        Args:
+            player_name: The class name of the player.
+            durations: The duration of each session.
+            maxima: The maximum stake of each session.
+            end_stakes: The stake at the end of each session.
+
+        Returns:
+            A `dict` of summary statistics, in CSV column order.
+        """
+        duration, maximum, end_stake = (
+            durations.describe(),
+            maxima.describe(),
+            end_stakes.describe(),
+        )
+        return {
+            "player": player_name,
+            "duration_mean": duration["mean"],
+            "duration_stdev": duration["stdev"],
+            "maxima_mean": maximum["mean"],
+            "maxima_stdev": maximum["stdev"],
+            "end_stake_mean": end_stake["mean"],
+            "end_stake_stdev": end_stake["stdev"],
+        }
+
+    def metadata(self) -> Dict:
+        """Returns the settings of this run which affect its results, including
+        the `ValidationPolicy` so it is known which guarantees the run had.
+        """
+        root = self.seed_sequence
+        return {
+            "game": type(self.game).__name__,
+            "samples": self.samples,
+            "init_stake": self.init_stake,
+            "init_duration": self.init_duration,
+            "table_limit": self.table_limit,
+            "prefetch": self.game.event_factory.prefetch,
+            "seed": None if root is None else root.entropy,
+            "seed_spawn_key": [] if root is None else list(root.spawn_key),
+            "workers": self.workers,
+            "chunk_size": self.chunk_size,
+            "validation": self.validation.describe(),
+            "common_random_numbers": self.common_random_numbers,
+        }
+
+    def save_metadata(self, file_path) -> None:
+        """Saves `self.metadata` to a JSON file, e.g. alongside the CSV written by
+        `self.save_to_csv`.
+
+        Args:
+            file_path: The path to save the JSON. E.g. "stats.json".
+        """
+        with open(file_path, "w") as json_file:
+            json.dump(self.metadata(), json_file, indent=2)
+
+    def results_store(self) -> "casino.results.ResultsStore":
+        """Returns a `ResultsStore` of the metrics of every session gathered with
+        `self.gather_all`, with `self.metadata`.
+        """
+        store = casino.results.ResultsStore(self.metadata())
+        for result in self.results:
+            store.add(result)
+        return store
+
+    def save_results(self, file_path) -> None:
+        """Saves the metrics of every session gathered with `self.gather_all` to
+        a columnar file, which `ResultsStore.load` maps back for analysis.
+
+        Args:
+            file_path: The path to save to. E.g. "sessions.cols".
+        """
+        self.results_store().save(file_path)
+
+    def save_profile(self, file_path) -> None:
+        """Saves the `CycleProfiler.report` of the run to a JSON file, e.g.
+        alongside the CSV written by `self.save_to_csv`.
+
+        Args:
+            file_path: The path to save the JSON. E.g. "profile.json".
+
+        Raises:
+            ValueError: The run was not profiled.
+        """
+        if self.profiler is None:
+            raise ValueError("BulkSimulator.profiler is not set.")
+        self.profiler.save(file_path)
+
     def save_to_csv(self, file_path) -> None:
         """Saves stats gathered with `self.gather_all` to a CSV file located in
         the current working directory.
@@ -2095,24 +4638,37 @@ class BulkSimulator:
             writer.writerows(self.player_stats)
 
     @staticmethod
-    def get_all_players() -> List[Type[casino.players.Player]]:
-        """Recursively gathers the subclasses of ``cls``.
+    def get_all_players(
+        game_type: Optional[type] = None,
+    ) -> List[Type[casino.players.Player]]:
+        """Recursively gathers the concrete subclasses of `Player`, at any depth.
+
+        Args:
+            game_type: Optional; Only gather the players of this `Game`
+                subclass: the `CrapsPlayer`s of a `CrapsGame`, or every other
+                player otherwise.
 
         Returns:
-            A `list` containing each subclass object of ``cls`` and any subclasses
-                of their subclasses.
+            A `list` of each concrete `Player` subclass, ordered by class name.
         """
         all_players = set()
-        for sub_cls in casino.players.Player.__subclasses__():
-            all_players.add(sub_cls)
-            for sub_cls_sub in sub_cls.__subclasses__():
-                all_players.add(sub_cls_sub)
+        pending: List[type] = [casino.players.Player]
+        while pending:
+            player = pending.pop()
+            pending.extend(player.__subclasses__())
+            if not inspect.isabstract(player):
+                all_players.add(player)
+        if game_type is not None:
+            craps = issubclass(game_type, CrapsGame)
+            all_players = {
+                player
+                for player in all_players
+                if issubclass(player, casino.players.CrapsPlayer) == craps
+            }
 
         # Ensure players are always in the same order for csv row order
         #  consistency and ease of testing.
-        all_players_list = list(all_players)
-        all_players_list.sort(key=lambda x: x.__name__)
-        return all_players_list
+        return sorted(all_players, key=lambda player: player.__name__)
 
 
 def print_sim_results(sim: Simulator) -> None:
@@ -2146,33 +4702,17 @@ def print_sim_results(sim: Simulator) -> None:
     print(f"Player: {sim.player.__class__.__name__}")
 
 
-def main():
-    # # # # Craps # # # #
-    table = Table()
-    dice = Dice()
-    game = CrapsGame(dice, table)
-    table.set_game(game)
-    player = casino.players.CrapsMartingale(table)
-    sim = Simulator(game, player)
-    sim.gather()
-    print_sim_results(sim)
-    # # # # # # # # # # #
-
-    # # # # Roulette # # # #
-    # table = Table()
-    # game = RouletteGame(table, table.wheel)
-    # table.set_game(game)
-    # # # To run a simulation for just one player and print the results:
-    # player = casino.players.PlayerFibonacci(table)
-    # sim = Simulator(game, player)
-    # sim.gather()
-    # print_sim_results(sim)
-    # # # # # # # # # # # #
-
-    # bulk_sim = BulkSimulator(game)
-    # bulk_sim.gather_all()
-    # bulk_sim.save_to_csv("sim_stats.csv")
+def main() -> int:
+    """Runs the command line interface of `casino.cli`.
+
+    Returns:
+        The exit status.
+    """
+    # Imported here as casino.cli builds on this module.
+    import casino.cli
+
+    return casino.cli.main()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
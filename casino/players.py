@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import random
 from abc import ABC, abstractmethod
-from typing import FrozenSet, Type, List
+from typing import FrozenSet, Type, List, Optional
 
 import casino.main
 import casino.odds
@@ -61,7 +61,7 @@ class Player(ABC):
 
         A player is still active when they have a stake greater than 0
         """
-        return self.rounds_to_go > 0 and self.stake > 0 or bool(self.table.bets)
+        return self.rounds_to_go > 0 and self.stake > 0 or self.table.has_bets(self)
 
     def win(self, bet: casino.main.Bet) -> None:
         """Notification from the `Game` object that the `Bet` instance was a
@@ -89,6 +89,17 @@ class Player(ABC):
         """
         pass
 
+    def seed(self, seed_sequence: casino.main.SeedSequence) -> None:
+        """Reseeds any random number generator used by this player's strategy.
+        Called by `Simulator` before each session of a seeded run.
+
+        Does nothing by default, players which make random choices override this.
+
+        Args:
+            seed_sequence: The `SeedSequence` of this player for the session.
+        """
+        pass
+
     def __str__(self):
         return (
             f"{self.__class__.__name__} has {self.rounds_to_go} rounds to"
@@ -132,6 +143,30 @@ class RoulettePlayer(Player):
         pass
 
 
+class RoulettePassenger57(RoulettePlayer):
+    """`Passenger57` is a `Player` subclass who places bets in Roulette. This
+    player always places the same flat bet on black.
+
+    Attributes:
+        table: The `Table` that is used to place individual `Bet` instances.
+        bet_amount: The fixed amount bet on every spin.
+    """
+
+    bet_amount: int = 1
+
+    def place_bets(self) -> None:
+        """Updates the `Table` object with a bet of `bet_amount` on 'black'. If
+        `bet_amount` exceeds `self.stake`, bet the entire remaining stake.
+        """
+        assert self.table.game is not None, "table.game not set"
+        current_bet = casino.main.Bet(
+            min(self.bet_amount, self.stake),
+            self.table.game.event_factory.get_outcome("black"),
+            self,
+        )
+        self.table.place_bet(current_bet)
+
+
 class RouletteMartingale(RoulettePlayer):
     """`Martingale` is a `Player` subclass who places bets in Roulette. This player
     doubles their bet on every loss and resets their bet to a base amount on each win.
@@ -260,10 +295,16 @@ class RouletteRandom(Player):
             access to the `wheel.all_outcomes` structure to pick from.
     """
 
-    def __init__(self, table: casino.main.Table) -> None:
+    def __init__(
+        self, table: casino.main.Table, rng: Optional[random.Random] = None
+    ) -> None:
         """Invokes superclass constructor and and initialise the rng."""
         super().__init__(table)
-        self.rng = random.Random()
+        self.rng = rng if rng else random.Random()
+
+    def seed(self, seed_sequence: casino.main.SeedSequence) -> None:
+        """Reseeds `rng` from ``seed_sequence``."""
+        self.rng.seed(seed_sequence.seed_int())
 
     def place_bets(self) -> None:
         """Updates the `Table` object with a randomly placed `Bet` instance."""
@@ -300,6 +341,17 @@ class Roulette1326(RoulettePlayer):
         self.outcome = self.table.game.event_factory.get_outcome("Black")
         self.state = Roulette1326NoWins(self)
 
+    def reset(self, duration: int, stake: int) -> None:
+        """Calls parent class reset method and also returns to the no wins state
+        for a new session.
+
+        Args:
+            duration: The number of `rounds_to_go` for the next session.
+            stake: The initial stake to begin the next session with.
+        """
+        super(Roulette1326, self).reset(duration, stake)
+        self.state = Roulette1326NoWins(self)
+
     def place_bets(self) -> None:
         """Updates the `Table` with a bet created by the current state. Delegates
         `Bet` creation to the `self.state.current_bet` method.
@@ -605,10 +657,12 @@ class CrapsPass(CrapsPlayer):
     def place_bets(self) -> None:
         """Places a Pass Line bet on the `Table` if no Pass Line bet is present."""
         if self.rounds_to_go > 0:
-            if not self.table.contains_outcome("Pass Line"):
+            if not self.table.contains_outcome("Pass Line", self):
                 self.table.place_bet(
                     casino.main.Bet(
-                        1, casino.main.Outcome("Pass Line", casino.odds.PASS_COME), self
+                        1,
+                        casino.main.Outcome.intern("Pass Line", casino.odds.PASS_COME),
+                        self,
                     )
                 )
 
@@ -633,6 +687,18 @@ class CrapsMartingale(CrapsPlayer):
         self.loss_count = 0
         self.bet_multiple = 1
 
+    def reset(self, duration: int, stake: int) -> None:
+        """Calls parent class reset method and also resets `Martingale` specific
+        attributes for a new session.
+
+        Args:
+            duration: The number of `rounds_to_go` for the next session.
+            stake: The initial stake to begin the next session with.
+        """
+        super(CrapsMartingale, self).reset(duration, stake)
+        self.bet_multiple = 1
+        self.loss_count = 0
+
     def place_bets(self) -> None:
         """If no Pass Line bet is present, this will update the `Table` with
         a bet on the Pass Line at the base bet amount.
@@ -641,24 +707,28 @@ class CrapsMartingale(CrapsPlayer):
         a Pass Line Odds bet. The amount is the base amount times `self.bet_multiple`.
         """
         if self.stake > 0 and self.table.game is not None:
-            if not self.table.contains_outcome("Pass Line"):
+            if not self.table.contains_outcome("Pass Line", self):
                 self.table.place_bet(
                     casino.main.Bet(
-                        1, casino.main.Outcome("Pass Line", casino.odds.PASS_COME), self
+                        1,
+                        casino.main.Outcome.intern("Pass Line", casino.odds.PASS_COME),
+                        self,
                     )
                 )
-            elif not self.table.contains_outcome("Pass Odds"):
+            elif not self.table.contains_outcome("Pass Odds", self):
                 bet_amount = 2 ** self.loss_count
                 if bet_amount > self.stake:
                     bet_amount = self.stake
-                if bet_amount >= self.table.limit:
+                if bet_amount >= self.table.limit_for(self):
                     bet_amount = (
-                        self.table.limit - 1
+                        self.table.limit_for(self) - 1
                     )  # -1 to account for initial Pass Bet.
                 self.table.place_bet(
                     casino.main.Bet(
                         bet_amount,
-                        casino.main.Outcome("Pass Odds", self.table.game.point_odds()),  # type: ignore
+                        casino.main.Outcome.intern(
+                            "Pass Odds", self.table.game.point_odds()  # type: ignore
+                        ),
                         self,
                     )
                 )
@@ -0,0 +1,217 @@
+"""Columnar storage of the metrics of every session of a run.
+
+`BulkSimulator.save_to_csv` keeps one summary row per player. A `ResultsStore`
+keeps the duration, maximum, minimum and end stake of every session instead, one
+column per metric, alongside the metadata of the run, so results can be analysed again
+without re-running the simulation.
+
+The file format is a small JSON header followed by one little-endian int64
+column per metric::
+
+    MAGIC | header length (uint64) | JSON header | padding | columns...
+
+Every column starts at a multiple of 8 bytes, so a loaded store maps the file
+with `mmap` and each column is a zero-copy `memoryview` of 64-bit integers,
+which `numpy.asarray` also wraps without copying.
+"""
+
+from __future__ import annotations
+
+import array
+import json
+import mmap
+import struct
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import casino.main
+
+MAGIC = b"CASINOCOLS\x00\x01"
+VERSION = 1
+_LENGTH = struct.Struct("<Q")
+
+
+class ResultsStore:
+    """The per-session metrics of several players, held column by column.
+
+    The sessions of each player are contiguous rows. A store is either built in
+    memory with `add`, in which case its columns are `array`s, or read back
+    from a file with `load`, in which case they are read-only views of the
+    memory-mapped file until `close` is called.
+
+    Attributes:
+        metadata: The settings of the run, e.g. `BulkSimulator.metadata`,
+            including the seed, game, init_stake and init_duration.
+        players: Maps each player's class name to the (start, stop) rows of its
+            sessions.
+        columns: Maps each name in `COLUMNS` to the values of every session.
+    """
+
+    COLUMNS = ("durations", "maxima", "minima", "end_stakes")
+
+    metadata: Dict
+    players: Dict[str, Tuple[int, int]]
+    columns: Dict[str, Sequence[int]]
+
+    def __init__(self, metadata: Optional[Dict] = None) -> None:
+        self.metadata = dict(metadata) if metadata else {}
+        self.players = {}
+        self.columns = {name: array.array("q") for name in self.COLUMNS}
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        return len(self.columns[self.COLUMNS[0]])
+
+    def add(self, result: casino.main.SimulationResult) -> None:
+        """Appends the sessions of ``result``. The chunks of a player must be
+        added one after another, in order.
+
+        Raises:
+            ValueError: The store was loaded from a file, rows of
+                ``result.player`` were added before those of another player, or
+                the metrics of ``result`` are not all of the same length.
+        """
+        if self._mmap is not None:
+            raise ValueError("A loaded ResultsStore is read-only.")
+        if len({len(getattr(result, name)) for name in self.COLUMNS}) != 1:
+            raise ValueError(f"The metrics of {result.player} differ in length.")
+        start, stop = self.players.get(result.player, (len(self), len(self)))
+        if stop != len(self):
+            raise ValueError(f"The rows of {result.player} must be contiguous.")
+        for name in self.COLUMNS:
+            self.columns[name].extend(getattr(result, name))  # type: ignore
+        self.players[result.player] = (start, len(self))
+
+    def column(self, name: str, player: Optional[str] = None) -> Sequence[int]:
+        """Returns the values of a metric, for every session or for the
+        sessions of one player.
+
+        Args:
+            name: The name of a column, e.g. "end_stakes".
+            player: Optional; The class name of a player.
+
+        Raises:
+            KeyError: Unknown column or player.
+        """
+        values = self.columns[name]
+        if player is None:
+            return values
+        start, stop = self.players[player]
+        return values[start:stop]
+
+    def statistics(self, name: str, player: str) -> casino.main.IntegerStatistics:
+        """Returns the `IntegerStatistics` of a metric of one player."""
+        return casino.main.IntegerStatistics(self.column(name, player))
+
+    def result(self, player: str) -> casino.main.SimulationResult:
+        """Returns the sessions of ``player`` as a `SimulationResult`."""
+        durations, maxima, minima, end_stakes = (
+            self.statistics(name, player) for name in self.COLUMNS
+        )
+        return casino.main.SimulationResult(
+            player, 0, durations, maxima, end_stakes, minima=minima
+        )
+
+    def summary(self) -> List[Dict]:
+        """Returns a `BulkSimulator.player_stats` row for each player, for
+        export with e.g. `csv.DictWriter`."""
+        return [
+            casino.main.BulkSimulator.player_summary(
+                player,
+                self.statistics("durations", player),
+                self.statistics("maxima", player),
+                self.statistics("end_stakes", player),
+            )
+            for player in self.players
+        ]
+
+    def save(self, file_path) -> None:
+        """Writes the store to a columnar binary file.
+
+        Args:
+            file_path: The path to save to. E.g. "sessions.cols".
+        """
+        rows = len(self)
+        header = {
+            "version": VERSION,
+            "rows": rows,
+            "columns": list(self.COLUMNS),
+            "players": {name: list(span) for name, span in self.players.items()},
+            "metadata": self.metadata,
+        }
+        encoded = json.dumps(header).encode()
+        offset = len(MAGIC) + _LENGTH.size + len(encoded)
+        padding = -offset % 8
+        with open(file_path, "wb") as results_file:
+            results_file.write(MAGIC)
+            results_file.write(_LENGTH.pack(len(encoded) + padding))
+            results_file.write(encoded + b" " * padding)
+            for name in self.COLUMNS:
+                values = array.array("q", self.columns[name])
+                if sys.byteorder == "big":
+                    values.byteswap()
+                results_file.write(values.tobytes())
+
+    @classmethod
+    def load(cls, file_path) -> "ResultsStore":
+        """Memory-maps a file written by `save`. Columns are only read from disk
+        as they are used.
+
+        Args:
+            file_path: The path of the file.
+
+        Returns:
+            A read-only `ResultsStore`. Call `close`, or use it as a context
+            manager, to release the file.
+
+        Raises:
+            ValueError: The file is not a results file of a known version.
+        """
+        with open(file_path, "rb") as results_file:
+            mapped = mmap.mmap(results_file.fileno(), 0, access=mmap.ACCESS_READ)
+        start = len(MAGIC) + _LENGTH.size
+        if mapped[: len(MAGIC)] != MAGIC:
+            mapped.close()
+            raise ValueError(f"Not a results file: {file_path}")
+        (length,) = _LENGTH.unpack(mapped[len(MAGIC) : start])
+        header = json.loads(mapped[start : start + length])
+        if header["version"] != VERSION:
+            mapped.close()
+            raise ValueError(f"Unknown results file version: {header['version']}")
+
+        store = cls(header["metadata"])
+        store.players = {
+            name: (first, stop) for name, (first, stop) in header["players"].items()
+        }
+        rows = header["rows"]
+        offset = start + length
+        view = memoryview(mapped)
+        for name in header["columns"]:
+            data = view[offset : offset + 8 * rows]
+            if sys.byteorder == "big":
+                values = array.array("q", data.tobytes())
+                values.byteswap()
+                store.columns[name] = values
+            else:
+                store.columns[name] = data.cast("q")
+            offset += 8 * rows
+        view.release()
+        store._mmap = mapped
+        return store
+
+    def close(self) -> None:
+        """Releases the file of a store returned by `load`. Its columns can not
+        be used afterwards."""
+        if self._mmap is None:
+            return
+        for values in self.columns.values():
+            if isinstance(values, memoryview):
+                values.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
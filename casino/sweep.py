@@ -0,0 +1,267 @@
+"""Sweeps of players over a grid of session parameters.
+
+`BulkSimulator` runs every player with one stake, duration and table limit. A
+`GridSweep` runs every combination of several values of each, a `GridCell`, and
+collects one tidy row per cell, with the parameters of the cell as its first
+columns, e.g. to see how the end stake of a strategy changes with the table
+limit::
+
+    sweep = GridSweep(RouletteGame, Wheel, [RouletteMartingale, Roulette1326])
+    sweep.stakes, sweep.limits = [50, 100, 200], [10, 30, 100]
+    sweep.run()
+    sweep.save_to_csv("sweep.csv")
+"""
+
+import concurrent.futures
+import contextlib
+import csv
+import itertools
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+import casino.main
+import casino.players
+
+PARAMETERS = ("player", "init_stake", "init_duration", "table_limit")
+
+
+@dataclass(frozen=True)
+class GridCell:
+    """One combination of the parameters of a `GridSweep`.
+
+    Attributes:
+        player_type: The `Player` subclass to simulate.
+        init_stake: The stake each session starts with.
+        init_duration: The duration (`Player.rounds_to_go`) of each session.
+        table_limit: The `Table.limit` of the player's table.
+    """
+
+    player_type: Type[casino.players.Player]
+    init_stake: int
+    init_duration: int
+    table_limit: int
+
+    def parameters(self) -> Dict:
+        """Returns the parameters of the cell, keyed by `PARAMETERS`."""
+        return {
+            "player": self.player_type.__name__,
+            "init_stake": self.init_stake,
+            "init_duration": self.init_duration,
+            "table_limit": self.table_limit,
+        }
+
+
+class GridSweep:
+    """Simulates every player over the grid of ``stakes``, ``durations`` and
+    ``limits``.
+
+    The cells are split into `SimulationTask`s of at most ``chunk_size``
+    samples, and the tasks of every cell are scheduled together, in-process or
+    on one pool of ``workers`` processes, the most rounds first so that the
+    longest tasks do not finish last. Each process builds the
+    `RandomEventFactory.shared_layout` of the device only once, for all its
+    tasks.
+
+    With a ``seed`` the sessions of a player are seeded as in a `BulkSimulator`
+    with the same seed, by the player name and the session index only. So every
+    cell of a player plays the same random events, and differences between
+    cells come from the parameters rather than from the draws.
+
+    Attributes:
+        game_type: The `Game` subclass to simulate, e.g. `RouletteGame`.
+        event_factory_type: The `RandomEventFactory` subclass of the game,
+            e.g. `Wheel`.
+        players: The `Player` subclasses to simulate.
+        stakes: The values of `Simulator.init_stake` to sweep.
+        durations: The values of `Simulator.init_duration` to sweep.
+        limits: The values of `Table.limit` to sweep.
+        samples: The number of sessions of each cell.
+        seed: Optional; The root seed, or root `SeedSequence`, from which the
+            seed of each session is derived.
+        workers: The number of worker processes. 1 runs every task in-process.
+        chunk_size: Optional; The maximum number of samples in each task. If
+            `None` each cell is run as a single task.
+        validation: The `ValidationPolicy` applied to every `Table`.
+        results: Maps each `GridCell` to the raw metrics of its sessions, in
+            the order of `cells`, once `run` has been called.
+        rows: One `dict` per cell, in the order of `cells`: the parameters of
+            the cell followed by its `BulkSimulator.player_summary`.
+    """
+
+    players: List[Type[casino.players.Player]]
+    stakes: Sequence[int]
+    durations: Sequence[int]
+    limits: Sequence[int]
+    results: Dict[GridCell, casino.main.SimulationResult]
+    rows: List[Dict]
+
+    def __init__(
+        self,
+        game_type: Type[casino.main.Game],
+        event_factory_type: Type[casino.main.RandomEventFactory],
+        players: Optional[Sequence[Type[casino.players.Player]]] = None,
+        seed: Union[int, str, casino.main.SeedSequence, None] = None,
+        workers: int = 1,
+        chunk_size: Optional[int] = None,
+        validation: Optional[casino.main.ValidationPolicy] = None,
+    ) -> None:
+        """Initialises a sweep of ``players`` over the `BulkSimulator`
+        defaults, a single cell per player, until the ranges are set. Without
+        ``players`` every concrete player of ``game_type`` is swept, from
+        `BulkSimulator.get_all_players`."""
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        self.game_type = game_type
+        self.event_factory_type = event_factory_type
+        if players is None:
+            players = casino.main.BulkSimulator.get_all_players(game_type)
+        self.players = list(players)
+        self.stakes = [100]
+        self.durations = [250]
+        self.limits = [30]
+        self.samples = 50
+        self.seed = seed
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.validation = validation if validation else casino.main.FullValidation()
+        self.results = {}
+        self.rows = []
+
+    @property
+    def seed_sequence(self) -> Optional[casino.main.SeedSequence]:
+        """The root `SeedSequence` of a seeded sweep, or `None` if unseeded."""
+        if self.seed is None or isinstance(self.seed, casino.main.SeedSequence):
+            return self.seed
+        return casino.main.SeedSequence(self.seed)
+
+    def cells(self) -> List[GridCell]:
+        """Returns every cell of the grid, ordered by player, stake, duration
+        and then limit.
+
+        Raises:
+            ValueError: A range of the grid is empty.
+        """
+        ranges = (self.players, self.stakes, self.durations, self.limits)
+        for name, values in zip(PARAMETERS, ranges):
+            if not values:
+                raise ValueError(f"The {name} range of the sweep is empty.")
+        return [GridCell(*values) for values in itertools.product(*ranges)]
+
+    def tasks(self) -> List[Tuple[GridCell, casino.main.SimulationTask]]:
+        """Splits the samples of every cell into `SimulationTask`s.
+
+        Returns:
+            A `list` of (cell, task) pairs, ordered by cell and then by chunk.
+        """
+        root = self.seed_sequence
+        chunk_size = self.chunk_size or self.samples
+        tasks = []
+        for cell in self.cells():
+            for chunk, start in enumerate(range(0, self.samples, chunk_size)):
+                task = casino.main.SimulationTask(
+                    self.game_type,
+                    self.event_factory_type,
+                    cell.player_type,
+                    min(chunk_size, self.samples - start),
+                    chunk,
+                    start,
+                    None if root is None else root.child(cell.player_type.__name__),
+                    self.validation,
+                    cell.init_stake,
+                    cell.init_duration,
+                    table_limit=cell.table_limit,
+                )
+                tasks.append((cell, task))
+        return tasks
+
+    def run(self) -> List[Dict]:
+        """Simulates every cell, replacing `self.results` and `self.rows`.
+
+        Returns:
+            `self.rows`.
+        """
+        tasks = self.tasks()
+        # The most rounds first, so a pool is not left waiting on a long task.
+        order = sorted(
+            range(len(tasks)),
+            key=lambda n: tasks[n][1].samples * tasks[n][1].init_duration,
+            reverse=True,
+        )
+        scheduled = [tasks[n][1] for n in order]
+        outcomes: Dict[int, casino.main.SimulationResult] = {}
+        results: Iterator[casino.main.SimulationResult]
+        with contextlib.ExitStack() as stack:
+            if self.workers == 1:
+                results = map(casino.main.run_simulation_task, scheduled)
+            else:
+                executor = stack.enter_context(
+                    concurrent.futures.ProcessPoolExecutor(self.workers)
+                )
+                results = executor.map(casino.main.run_simulation_task, scheduled)
+            for n, result in zip(order, results):
+                outcomes[n] = result
+
+        self.results = {}
+        for n, (cell, _) in enumerate(tasks):
+            result = outcomes[n]
+            merged = self.results.get(cell)
+            if merged is None:
+                self.results[cell] = result
+            else:
+                merged.durations.merge(result.durations)
+                merged.maxima.merge(result.maxima)
+                merged.end_stakes.merge(result.end_stakes)
+                merged.minima.merge(result.minima)
+        self.rows = [self.row(cell, result) for cell, result in self.results.items()]
+        return self.rows
+
+    @staticmethod
+    def row(cell: GridCell, result: casino.main.SimulationResult) -> Dict:
+        """Builds the `rows` entry of a cell: its parameters followed by the
+        summary statistics of its sessions."""
+        summary = casino.main.BulkSimulator.player_summary(
+            result.player, result.durations, result.maxima, result.end_stakes
+        )
+        del summary["player"]
+        return {**cell.parameters(), **summary}
+
+    def metadata(self) -> Dict:
+        """Returns the settings of this sweep which affect its results."""
+        root = self.seed_sequence
+        return {
+            "game": self.game_type.__name__,
+            "players": [player.__name__ for player in self.players],
+            "stakes": list(self.stakes),
+            "durations": list(self.durations),
+            "limits": list(self.limits),
+            "samples": self.samples,
+            "seed": None if root is None else root.entropy,
+            "seed_spawn_key": [] if root is None else list(root.spawn_key),
+            "workers": self.workers,
+            "chunk_size": self.chunk_size,
+            "validation": self.validation.describe(),
+        }
+
+    def save_metadata(self, file_path) -> None:
+        """Saves `self.metadata` to a JSON file, e.g. alongside the CSV written
+        by `self.save_to_csv`.
+
+        Args:
+            file_path: The path to save the JSON. E.g. "sweep.json".
+        """
+        with open(file_path, "w") as json_file:
+            json.dump(self.metadata(), json_file, indent=2)
+
+    def save_to_csv(self, file_path) -> None:
+        """Saves `self.rows` to a CSV file, one row per cell.
+
+        Args:
+            file_path: The path to save the csv. E.g. "sweep.csv".
+        """
+        with open(file_path, "w", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=list(self.rows[0]))
+            writer.writeheader()
+            writer.writerows(self.rows)
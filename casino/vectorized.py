@@ -0,0 +1,142 @@
+"""Batch Roulette engine which resolves many sessions at once with NumPy.
+
+`RouletteGame.cycle` resolves one spin of one session at a time. For strategies
+which place the same bet on every spin (see `RoulettePassenger57`) the whole
+stake trajectory of a session is a cumulative sum of per-spin wins and losses,
+so every session can be computed with array operations instead.
+
+This module requires the optional ``numpy`` dependency.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import casino.main
+
+
+class VectorizedRoulette:
+    """Computes the session metrics of fixed-bet Roulette strategies for many
+    sessions at once.
+
+    A bin-by-outcome matrix of net payouts is built once from the `Bin`s of a
+    `Wheel` populated by `BinBuilder`. Spins are held as an integer array of bin
+    numbers with one row per session, so a session's stake trajectory is the
+    cumulative sum of the payout column of the bet outcome indexed by its spins.
+
+    Attributes:
+        outcomes: Every `Outcome` on the wheel, indexed by `Outcome.id`. The id of
+            an `Outcome` is its column in `net_payouts`.
+        outcome_columns: Maps a lower case `Outcome` name to its column.
+        net_payouts: A (38, len(outcomes)) `int64` array. Each entry is the net
+            change in stake for a bet of 1 on the outcome when the bin is spun:
+            the odds if the bin contains the outcome, -1 otherwise.
+        limit: The table limit a single bet must not exceed.
+    """
+
+    outcomes: List[casino.main.Outcome]
+    outcome_columns: Dict[str, int]
+    net_payouts: np.ndarray
+
+    def __init__(self, wheel: casino.main.Wheel, limit: int = 30) -> None:
+        """Builds the payout matrix from the bins of ``wheel``.
+
+        Raises:
+            ValueError: An outcome on the wheel does not pay whole number odds.
+        """
+        self.outcomes = list(wheel.outcome_index)
+        self.outcome_columns = dict(wheel.outcome_ids)
+        self.net_payouts = np.full((len(wheel.bins), len(self.outcomes)), -1, np.int64)
+        for bin_num, bin_ in enumerate(wheel.bins):
+            for outcome in bin_:
+                if outcome.odds.denominator != 1:
+                    raise ValueError(f"Outcome odds must be whole numbers: {outcome}")
+                self.net_payouts[bin_num, outcome.id] = outcome.odds.numerator
+        self.limit = limit
+
+    @staticmethod
+    def spin(
+        sessions: int, duration: int, rng: Optional[np.random.Generator] = None
+    ) -> np.ndarray:
+        """Draws ``duration`` spins for each of ``sessions`` sessions.
+
+        Args:
+            sessions: The number of sessions (rows).
+            duration: The number of spins per session (columns).
+            rng: Optional; A NumPy `Generator`. A new unseeded one is used if not
+                provided.
+
+        Returns:
+            A (sessions, duration) array of bin numbers in the range 0-37.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        return rng.integers(0, 38, size=(sessions, duration), dtype=np.int64)
+
+    @staticmethod
+    def spins_from_random(
+        rng: random.Random, sessions: int, duration: int
+    ) -> np.ndarray:
+        """Draws spins from a `random.Random` stream exactly as `Wheel.choose`
+        would, one row of ``duration`` spins per session.
+
+        Args:
+            rng: The `random.Random` instance to draw from.
+            sessions: The number of sessions (rows).
+            duration: The number of spins per session (columns).
+
+        Returns:
+            A (sessions, duration) array of bin numbers in the range 0-37.
+        """
+        spins = [rng.randrange(38) for _ in range(sessions * duration)]
+        return np.array(spins, dtype=np.int64).reshape(sessions, duration)
+
+    def flat_bet(
+        self, spins: np.ndarray, outcome_name: str, amount: int, init_stake: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Plays a flat bet of ``amount`` on one outcome for every row of ``spins``.
+
+        A session ends when the stake reaches zero or the spins of its row run
+        out. As with `Simulator.session`, the stake is recorded after each spin,
+        so the maximum does not include ``init_stake``.
+
+        Args:
+            spins: A (sessions, duration) array of bin numbers.
+            outcome_name: The name of the `Outcome` to bet on. E.g. "Black".
+            amount: The amount bet on each spin.
+            init_stake: The stake each session starts with. This must be a
+                multiple of ``amount`` so a bet never has to be reduced to the
+                remaining stake.
+
+        Returns:
+            A tuple of (durations, maxima, end_stakes) arrays, one entry per
+            session, matching `Simulator.durations`, `Simulator.maxima` and
+            `Simulator.end_stakes`.
+
+        Raises:
+            InvalidBet: ``amount`` violates the table limit rules.
+            KeyError: There is no `Outcome` with name ``outcome_name``.
+            ValueError: ``init_stake`` is not a positive multiple of ``amount``.
+        """
+        if not 0 < amount <= self.limit:
+            raise casino.main.InvalidBet(
+                "Placing this bet violates table min/limit rules."
+            )
+        if init_stake <= 0 or init_stake % amount:
+            raise ValueError("init_stake must be a positive multiple of amount.")
+        column = self.outcome_columns.get(outcome_name.lower())
+        if column is None:
+            raise KeyError(f"No Outcome with name: {outcome_name}")
+
+        sessions, duration = spins.shape
+        net = self.net_payouts[spins, column] * amount
+        stakes = init_stake + np.cumsum(net, axis=1)
+        ruined = stakes <= 0
+        durations = np.where(ruined.any(axis=1), ruined.argmax(axis=1) + 1, duration)
+        played = np.arange(duration) < durations[:, np.newaxis]
+        maxima = np.where(played, stakes, np.iinfo(np.int64).min).max(axis=1)
+        end_stakes = stakes[np.arange(sessions), durations - 1]
+
+        return durations, maxima, end_stakes
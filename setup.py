@@ -4,4 +4,6 @@ setup(
     name="casino",
     version="0.0.1",
     packages=find_packages(include=["casino", "casino.*"]),
+    extras_require={"numpy": ["numpy"]},
+    entry_points={"console_scripts": ["casino-sim=casino.cli:main"]},
 )
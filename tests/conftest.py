@@ -114,6 +114,7 @@ def built_dice(monkey_module):
 class MockOutcome:
     def __init__(self, name, odds):
         self.name = name
+        self.id = None
         if isinstance(odds, int):
             self.odds = Fraction(odds, 1)
         elif isinstance(odds, Fraction):
@@ -121,6 +122,10 @@ class MockOutcome:
         else:
             raise TypeError("outcome_odds must be either an int or Fraction.")
 
+    @classmethod
+    def intern(cls, name, odds):
+        return cls(name, odds)
+
     def __hash__(self):
         return hash(self.name)
 
@@ -275,13 +280,22 @@ class MockTable:
     def remove_bet(self, bet):
         self.bets.remove(bet)
 
-    def contains_outcome(self, outcome_name):
+    def move_bet(self, bet, outcome):
+        bet.set_outcome(outcome)
+
+    def contains_outcome(self, outcome_name, player=None):
         for bet in self.bets:
             if bet.outcome.name == outcome_name:
                 return True
 
         return False
 
+    def has_bets(self, player):
+        return any(bet.player is player for bet in self.bets)
+
+    def limit_for(self, player):
+        return self.limit
+
     def __iter__(self):
         return iter(self.bets[:])
 
@@ -409,3 +423,6 @@ class MockIntegerStatistics:
 
     def stdev(self):
         return 1.1
+
+    def describe(self):
+        return {"mean": self.mean(), "stdev": self.stdev()}
@@ -0,0 +1,79 @@
+import random
+
+# noinspection PyUnresolvedReferences
+import pytest
+
+import casino.main
+import casino.players
+
+ROULETTE_PLAYERS = [
+    casino.players.RouletteMartingale,
+    casino.players.RoulettePassenger57,
+    casino.players.RouletteFibonacci,
+    casino.players.Roulette1326,
+]
+
+
+def _roulette_game(seed):
+    table = casino.main.Table()
+    wheel = casino.main.Wheel(
+        random.Random(seed), layout=casino.main.Wheel.shared_layout()
+    )
+    game = casino.main.RouletteGame(wheel, table)
+    table.set_game(game)
+    return game
+
+
+def test_multi_player_matches_single_player():
+    game = _roulette_game(7)
+    players = [player(game.table) for player in ROULETTE_PLAYERS]
+    sim = casino.main.MultiPlayerSimulator(game, players)
+    sim.init_duration = 50
+    sim.samples = 1
+    sim.gather()
+
+    # Each player sees the same spins as it would playing alone.
+    for n, player_type in enumerate(ROULETTE_PLAYERS):
+        solo_game = _roulette_game(7)
+        solo = casino.main.Simulator(solo_game, player_type(solo_game.table))
+        solo.init_duration = 50
+        solo.samples = 1
+        solo.gather()
+        assert sim.durations[n] == solo.durations
+        assert sim.maxima[n] == solo.maxima
+        assert sim.minima[n] == solo.minima
+        assert sim.end_stakes[n] == solo.end_stakes
+
+
+def test_multi_player_results():
+    game = _roulette_game(1)
+    sim = casino.main.MultiPlayerSimulator(
+        game, [player(game.table) for player in ROULETTE_PLAYERS]
+    )
+    sim.init_duration = 20
+    sim.samples = 5
+    sim.gather()
+
+    results = sim.results()
+    assert [result.player for result in results] == [
+        player.__name__ for player in ROULETTE_PLAYERS
+    ]
+    for result in results:
+        assert len(result.durations) == 5
+        assert max(result.durations) <= 20
+    assert game.table.bets == ()
+
+
+def test_multi_player_craps():
+    table = casino.main.Table()
+    game = casino.main.CrapsGame(casino.main.Dice(random.Random(3)), table)
+    table.set_game(game)
+    players = [casino.players.CrapsPass(table), casino.players.CrapsMartingale(table)]
+    sim = casino.main.MultiPlayerSimulator(game, players)
+    sim.init_duration = 30
+    sim.samples = 4
+    sim.gather()
+
+    for durations in sim.durations:
+        assert len(durations) == 4
+        assert min(durations) >= 30
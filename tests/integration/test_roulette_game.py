@@ -24,4 +24,4 @@ def test_game(seeded_wheel):
 
     assert player.rounds_to_go == 0
     assert player.stake == 108
-    assert game.table.bets == []  # Check table has been cleared.
+    assert game.table.bets == ()  # Check table has been cleared.
@@ -24,3 +24,131 @@ def test_simulator(seeded_wheel):
     assert sum(sim.durations) // sim.samples == 19
     assert sum(sim.maxima) // sim.samples == 103
     assert sum(sim.end_stakes) // sim.samples == 96
+
+
+def test_simulator_streaming_session(seeded_wheel):
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(seeded_wheel, table)
+    table.set_game(game)
+    player = casino.players.RouletteMartingale(table)
+    sim = casino.main.Simulator(game, player)
+    sim.init_duration = 20
+
+    stakes = sim.session()
+    assert len(stakes) == 20
+    assert stakes[-1] == 108  # Same bins as the `RouletteGame` integration test.
+
+    seeded_wheel.rng.seed(1)
+    sink = casino.main.ListTrajectorySink()
+    sim.trajectory_every = 5
+    summary = sim.stream_session(sink)
+
+    assert sink.sessions == [stakes]
+    assert summary.duration == len(stakes)
+    assert summary.maximum == max(stakes)
+    assert summary.minimum == min(stakes)
+    assert summary.end_stake == stakes[-1]
+    assert summary.trajectory == stakes[4::5]
+
+
+def test_simulator_trajectory_sink(seeded_wheel):
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(seeded_wheel, table)
+    table.set_game(game)
+    sim = casino.main.Simulator(game, casino.players.RouletteFibonacci(table))
+    sim.init_duration = 10
+    sim.samples = 3
+    sim.trajectory_sink = casino.main.ListTrajectorySink()
+    sim.gather()
+
+    assert len(sim.trajectory_sink.sessions) == 3
+    for stakes, duration, maximum, minimum, end in zip(
+        sim.trajectory_sink.sessions,
+        sim.durations,
+        sim.maxima,
+        sim.minima,
+        sim.end_stakes,
+    ):
+        assert (len(stakes), max(stakes), min(stakes), stakes[-1]) == (
+            duration,
+            maximum,
+            minimum,
+            end,
+        )
+
+
+def make_seeded_simulator(player_type, seed=5):
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(casino.main.Wheel(), table)
+    table.set_game(game)
+    sim = casino.main.Simulator(
+        game, player_type(table), casino.main.SeedSequence(seed)
+    )
+    sim.init_duration = 50
+    return sim
+
+
+def test_simulator_gather_until_width():
+    steady = make_seeded_simulator(casino.players.RoulettePassenger57)
+    report = steady.gather_until(width=4, batch_size=20)
+
+    assert report.converged
+    assert report.samples == steady.samples == len(steady.end_stakes)
+    assert report.samples % 20 == 0
+    assert all(width < 4 for width in report.widths.values())
+
+    volatile = make_seeded_simulator(casino.players.RouletteMartingale)
+    assert volatile.gather_until(width=4, batch_size=20).samples > report.samples
+
+    # The same sessions as a fixed size run with the same seed.
+    fixed = make_seeded_simulator(casino.players.RoulettePassenger57)
+    fixed.samples = report.samples
+    fixed.gather()
+    assert fixed.end_stakes == steady.end_stakes
+
+
+def test_simulator_gather_until_budgets():
+    sim = make_seeded_simulator(casino.players.RouletteMartingale)
+    report = sim.gather_until(width=0.01, batch_size=30, max_samples=70)
+    assert (report.samples, report.stopped_by) == (70, "samples")
+    assert not report.converged
+
+    report = sim.gather_until(width=0.01, batch_size=10, max_seconds=0)
+    assert (report.samples, report.stopped_by) == (80, "time")
+
+    with pytest.raises(ValueError):
+        sim.gather_until(width=1, metrics=["samples"])
+    with pytest.raises(ValueError):
+        sim.gather_until(width=0)
+    with pytest.raises(ValueError):
+        sim.gather_until(width=1, max_samples=0)
+
+
+
+def test_simulator_archive_trajectory_sink(seeded_wheel, tmpdir):
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(seeded_wheel, table)
+    table.set_game(game)
+    sim = casino.main.Simulator(game, casino.players.RouletteFibonacci(table))
+    sim.init_duration = 10
+    sim.samples = 4
+    sim.trajectory_sink = casino.main.ListTrajectorySink()
+    sim.gather()
+    expected = sim.trajectory_sink.sessions
+
+    seeded_wheel.rng.seed(1)
+    with casino.main.ArchiveTrajectorySink(tmpdir, "a", buffer_size=7) as sink:
+        sim.trajectory_sink = sink
+        sim.gather()
+    # An empty shard is read back without sessions.
+    casino.main.ArchiveTrajectorySink(tmpdir, "b").close()
+
+    with casino.main.TrajectoryArchive(tmpdir) as archive:
+        assert archive.shards == ["a", "b"]
+        assert len(archive) == 4
+        assert [list(stakes) for stakes in archive] == expected
+        assert list(archive[-1]) == expected[3]
+        assert [list(s) for s in archive.shard_sessions("a")] == expected
+        assert archive.shard_sessions("b") == []
+        with pytest.raises(IndexError):
+            archive[4]
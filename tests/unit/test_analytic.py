@@ -0,0 +1,182 @@
+import itertools
+import random
+from fractions import Fraction
+
+import pytest
+
+import casino.main
+import casino.players
+
+np = pytest.importorskip("numpy")
+import casino.analytic  # noqa: E402
+
+BLACK_BIN, RED_BIN = 2, 1
+
+
+class ReplayRandom(random.Random):
+    """Returns the given bin numbers from `choice` instead of random ones."""
+
+    def __init__(self, bin_numbers):
+        super().__init__()
+        self.bin_numbers = iter(bin_numbers)
+
+    def choice(self, seq):
+        return seq[next(self.bin_numbers)]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return casino.analytic.AnalyticRoulette(casino.main.Wheel())
+
+
+def make_simulator(player_type, init_stake, duration):
+    wheel = casino.main.Wheel()
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(wheel, table)
+    table.set_game(game)
+    sim = casino.main.Simulator(game, player_type(table))
+    sim.init_stake, sim.init_duration = init_stake, duration
+    return sim
+
+
+@pytest.mark.parametrize(
+    "player_type, init_stake, limit",
+    [
+        (casino.players.RoulettePassenger57, 3, 30),
+        (casino.players.RouletteMartingale, 9, 4),
+        (casino.players.RouletteFibonacci, 6, 30),
+        (casino.players.RouletteFibonacci, 12, 2),
+        (casino.players.Roulette1326, 7, 30),
+    ],
+)
+def test_distribution_matches_every_session(player_type, init_stake, limit):
+    """Plays every sequence of wins and losses with the `Simulator` and weights
+    each session by the probability of its sequence.
+    """
+    duration = 7
+    sim = make_simulator(player_type, init_stake, duration)
+    sim.game.table.limit = limit
+    won = 18 / 38
+    expected = casino.analytic.SessionDistribution()
+    for wins in itertools.product((True, False), repeat=duration):
+        sim.game.event_factory.rng = ReplayRandom(
+            BLACK_BIN if win else RED_BIN for win in wins
+        )
+        summary = sim.stream_session()
+        probability = won ** sum(wins) * (1 - won) ** (duration - sum(wins))
+        expected.add(summary.duration, summary.maximum, summary.end_stake, probability)
+
+    distribution = casino.analytic.AnalyticRoulette(
+        casino.main.Wheel(), limit
+    ).session_distribution(player_type, init_stake, duration)
+
+    for metric in ("durations", "maxima", "end_stakes"):
+        actual = getattr(distribution, metric)
+        assert actual.keys() == getattr(expected, metric).keys()
+        for value, probability in getattr(expected, metric).items():
+            assert actual[value] == pytest.approx(probability)
+
+
+def test_distribution_agrees_with_gather(engine):
+    sim = make_simulator(casino.players.RouletteMartingale, 30, 40)
+    sim.seed_sequence = casino.main.SeedSequence(2024)
+    sim.samples = 400
+    sim.gather()
+
+    distribution = engine.simulator_distribution(sim)
+
+    for metric in ("durations", "maxima", "end_stakes"):
+        assert sum(getattr(distribution, metric).values()) == pytest.approx(1)
+    assert all(abs(z) < 4 for z in distribution.z_scores(sim).values())
+
+
+def test_session_distribution_statistics(engine):
+    distribution = engine.session_distribution(
+        casino.players.RoulettePassenger57, init_stake=10, duration=1
+    )
+    assert distribution.durations == {1: 1.0}
+    assert distribution.end_stakes == pytest.approx({11: 18 / 38, 9: 20 / 38})
+    assert distribution.mean("end_stakes") == pytest.approx(10 - 2 / 38)
+    assert distribution.stdev("durations") == 0
+
+    never_played = engine.session_distribution(
+        casino.players.RoulettePassenger57, init_stake=0
+    )
+    assert never_played.durations == {0: 1.0}
+    assert never_played.maxima == never_played.end_stakes == {0: 1.0}
+
+
+def test_model_for():
+    model = casino.analytic.model_for(casino.players.RouletteMartingale, limit=8)
+    assert isinstance(model, casino.analytic.MartingaleModel)
+    assert model.play(3, 100) == casino.analytic.Move(8, 0, 4)
+    assert model.play(4, 100) == casino.analytic.Move(1, 0, 1)
+    assert model.play(3, 5) == casino.analytic.Move(5, 0, 4)
+
+    # A subclass may change the strategy, so is not modelled.
+    with pytest.raises(KeyError):
+        casino.analytic.model_for(casino.players.RouletteSevenReds)
+
+
+@pytest.fixture(scope="module")
+def craps_engine():
+    return casino.analytic.AnalyticCraps(casino.main.Dice())
+
+
+def make_craps_simulator(player_type, init_stake, duration):
+    table = casino.main.Table()
+    game = casino.main.CrapsGame(casino.main.Dice(), table)
+    table.set_game(game)
+    sim = casino.main.Simulator(game, player_type(table))
+    sim.init_stake, sim.init_duration = init_stake, duration
+    return sim
+
+
+def test_line_bets(craps_engine):
+    assert craps_engine.house_edge() == Fraction(7, 495)
+    assert craps_engine.house_edge("Don't Pass Line") == Fraction(3, 220)
+    assert craps_engine.expected_throws() == Fraction(557, 165)
+    assert craps_engine.expected_throws("Don't Pass Line") == Fraction(557, 165)
+    assert craps_engine.point_odds[4] == Fraction(2, 1)
+    assert craps_engine.point_odds[6] == Fraction(6, 5)
+
+
+@pytest.mark.parametrize(
+    "player_type", [casino.players.CrapsPass, casino.players.CrapsMartingale]
+)
+def test_craps_distribution_agrees_with_gather(craps_engine, player_type):
+    sim = make_craps_simulator(player_type, 100, 20)
+    sim.seed_sequence = casino.main.SeedSequence(7)
+    sim.samples = 400
+    sim.gather()
+
+    distribution = craps_engine.simulator_distribution(sim)
+
+    for metric in ("durations", "maxima", "end_stakes"):
+        assert sum(getattr(distribution, metric).values()) == pytest.approx(1)
+    assert all(abs(z) < 4 for z in distribution.z_scores(sim).values())
+
+
+def test_craps_martingale_odds_honour_player_limit(craps_engine):
+    sim = make_craps_simulator(casino.players.CrapsMartingale, 100, 20)
+    sim.game.table.set_player_limit(sim.player, 10)
+    sim.seed_sequence = casino.main.SeedSequence(7)
+    sim.samples = 400
+    sim.gather()
+
+    distribution = craps_engine.simulator_distribution(sim)
+    assert all(abs(z) < 4 for z in distribution.z_scores(sim).values())
+
+
+def test_craps_session_distribution(craps_engine):
+    distribution = craps_engine.session_distribution(
+        casino.players.CrapsPass, init_stake=10, duration=1
+    )
+    # The line bet stays on the table until it is resolved.
+    assert distribution.durations[1] == pytest.approx(12 / 36)
+    assert distribution.mean("durations") == pytest.approx(557 / 165)
+    assert distribution.mean("end_stakes") == pytest.approx(10 - 7 / 495)
+    assert distribution.end_stakes.keys() == {9, 11}
+
+    with pytest.raises(KeyError):
+        casino.analytic.craps_model_for(casino.players.CrapsPlayer)
@@ -0,0 +1,69 @@
+import json
+
+# noinspection PyUnresolvedReferences
+import pytest
+
+import casino.main
+import casino.players
+from benchmarks import __main__ as benchmarks_main
+from benchmarks import suite
+
+
+def test_scenarios_cover_every_player():
+    names = {scenario.name for scenario in suite.scenarios()}
+    assert len(names) == len(suite.scenarios())
+    assert "roulette.cycle.RouletteSevenReds" in names
+    assert "roulette.cycle.RouletteRandom" in names
+    assert "craps.cycle.CrapsMartingale" in names
+    assert "craps.cycle.CrapsPlayer" not in names
+    assert casino.players.RoulettePlayer not in suite.players_of(
+        casino.main.RouletteGame
+    )
+
+
+def test_scenarios_are_reproducible():
+    runs = [
+        scenario.setup()()
+        for scenario in suite.scenarios(scale=0.001) * 2
+        if scenario.name.startswith("simulator.gather")
+    ]
+    assert runs[:3] == runs[3:]
+
+
+def test_run_and_compare():
+    measurements = suite.run(["wheel.choose", "craps.cycle."], scale=0.001, repeat=1)
+    assert [m.name for m in measurements] == [
+        "wheel.choose",
+        "craps.cycle.CrapsMartingale",
+        "craps.cycle.CrapsPass",
+    ]
+    assert measurements[0].operations == 200
+    assert all(m.operations_per_second > 0 for m in measurements)
+
+    current = suite.report(measurements)
+    baseline = json.loads(json.dumps(current))
+    baseline["scenarios"]["wheel.choose"]["operations_per_second"] *= 2
+    del baseline["scenarios"]["craps.cycle.CrapsPass"]
+    rows = suite.compare(current, baseline, tolerance=0.2)
+    assert [(row["name"], row["regressed"]) for row in rows] == [
+        ("wheel.choose", True),
+        ("craps.cycle.CrapsMartingale", False),
+    ]
+    assert rows[0]["ratio"] == pytest.approx(0.5)
+
+
+def test_main_exit_status(tmpdir, capsys):
+    output = str(tmpdir.join("current.json"))
+    arguments = ["dice.choose", "--scale", "0.001", "--repeat", "1"]
+    assert benchmarks_main.main(arguments + ["--output", output]) == 0
+
+    baseline = suite.load_report(output)
+    baseline["scenarios"]["dice.choose"]["operations_per_second"] *= 1000
+    suite.save_report(baseline, str(tmpdir.join("baseline.json")))
+    assert (
+        benchmarks_main.main(
+            arguments + ["--baseline", str(tmpdir.join("baseline.json"))]
+        )
+        == 1
+    )
+    assert "REGRESSED" in capsys.readouterr().out
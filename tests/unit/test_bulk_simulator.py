@@ -1,9 +1,12 @@
+import json
+import random
 from pathlib import Path
 
 # noinspection PyUnresolvedReferences
 import pytest
 
 import casino.main
+import casino.players
 
 
 @pytest.mark.skip  # New Player added so won't match for the moment.
@@ -30,3 +33,312 @@ def test_bulk_simulator(monkeypatch, tmpdir, mock_game, mock_simulator):
         Path(__file__).parent.resolve().joinpath("test_stats.csv")
     ) as f2:
         assert f1.read() == f2.read()
+
+
+@pytest.fixture
+def roulette_game():
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(casino.main.Wheel(), table)
+    table.set_game(game)
+    return game
+
+
+def _seeded_bulk_sim(game, workers, chunk_size=None):
+    b_sim = casino.main.BulkSimulator(
+        game, seed=1234, workers=workers, chunk_size=chunk_size
+    )
+    b_sim.players = [
+        casino.players.RouletteMartingale,
+        casino.players.RouletteFibonacci,
+        casino.players.Roulette1326,
+    ]
+    b_sim.samples = 6
+    return b_sim
+
+
+def test_bulk_simulator_tasks(roulette_game):
+    b_sim = _seeded_bulk_sim(roulette_game, workers=1, chunk_size=4)
+    tasks = b_sim.tasks()
+
+    assert len(tasks) == 6
+    assert [task.samples for task in tasks[:2]] == [4, 2]
+    assert [task.chunk for task in tasks[:2]] == [0, 1]
+    assert tasks[0].player_type is casino.players.RouletteMartingale
+    assert tasks[0].event_factory_type is casino.main.Wheel
+    assert [task.first_sample for task in tasks[:2]] == [0, 4]
+    assert tasks[0].seed_sequence == casino.main.SeedSequence(
+        1234, ("RouletteMartingale",)
+    )
+    assert tasks[1].seed_sequence == tasks[0].seed_sequence
+
+
+def test_bulk_simulator_chunking_does_not_change_results(roulette_game):
+    unchunked = _seeded_bulk_sim(roulette_game, workers=1)
+    unchunked.players.append(casino.players.RouletteRandom)
+    unchunked.gather_all()
+    chunked = _seeded_bulk_sim(roulette_game, workers=1, chunk_size=4)
+    chunked.players.append(casino.players.RouletteRandom)
+    chunked.gather_all()
+    assert unchunked.player_stats == chunked.player_stats
+
+
+def test_bulk_simulator_parallel_matches_serial(tmpdir, roulette_game):
+    serial = _seeded_bulk_sim(roulette_game, workers=1, chunk_size=4)
+    serial.gather_all()
+    parallel = _seeded_bulk_sim(roulette_game, workers=2, chunk_size=4)
+    parallel.gather_all()
+
+    assert [row["player"] for row in serial.player_stats] == [
+        "RouletteMartingale",
+        "RouletteFibonacci",
+        "Roulette1326",
+    ]
+    assert serial.player_stats == parallel.player_stats
+
+    serial.save_to_csv(tmpdir.join("serial.csv"))
+    parallel.save_to_csv(tmpdir.join("parallel.csv"))
+    with open(tmpdir.join("serial.csv")) as f1, open(
+        tmpdir.join("parallel.csv")
+    ) as f2:
+        assert f1.read() == f2.read()
+
+
+def test_bulk_simulator_tasks_keep_prefetch():
+    def prefetching_game(prefetch):
+        table = casino.main.Table()
+        game = casino.main.RouletteGame(casino.main.Wheel(prefetch=prefetch), table)
+        table.set_game(game)
+        return game
+
+    # A seeded Simulator on the prefetching wheel itself, run serially.
+    game = prefetching_game(64)
+    serial = casino.main.Simulator(
+        game,
+        casino.players.RouletteMartingale(game.table),
+        casino.main.SeedSequence(1234).child("RouletteMartingale"),
+    )
+    serial.samples = 6
+    serial.gather()
+
+    for workers in (1, 2):
+        b_sim = _seeded_bulk_sim(prefetching_game(64), workers, chunk_size=4)
+        b_sim.players = [casino.players.RouletteMartingale]
+        assert all(task.prefetch == 64 for task in b_sim.tasks())
+        b_sim.gather_all()
+        assert list(b_sim.results[0].durations) == list(serial.durations)
+        assert list(b_sim.results[0].end_stakes) == list(serial.end_stakes)
+
+    unbuffered = _seeded_bulk_sim(prefetching_game(0), workers=1)
+    unbuffered.players = [casino.players.RouletteMartingale]
+    unbuffered.gather_all()
+    assert list(unbuffered.results[0].end_stakes) != list(serial.end_stakes)
+    assert unbuffered.metadata()["prefetch"] == 0
+
+
+def test_bulk_simulator_metadata(roulette_game, tmpdir):
+    b_sim = casino.main.BulkSimulator(
+        roulette_game, seed=1234, validation=casino.main.SampledValidation(10)
+    )
+    b_sim.players = [casino.players.RouletteMartingale]
+    b_sim.samples = 2
+    b_sim.gather_all()
+    assert all(task.validation is b_sim.validation for task in b_sim.tasks())
+
+    b_sim.save_metadata(tmpdir.join("stats.json"))
+    with open(tmpdir.join("stats.json")) as f:
+        metadata = json.load(f)
+    assert metadata["validation"] == "sampled every 10"
+    assert metadata["seed"] == 1234
+    assert metadata["game"] == "RouletteGame"
+
+    assert casino.main.BulkSimulator(roulette_game).metadata()["validation"] == "full"
+
+
+def test_bulk_simulator_common_random_numbers(roulette_game):
+    players = [
+        casino.players.RouletteMartingale,
+        casino.players.RoulettePassenger57,
+        casino.players.RouletteFibonacci,
+    ]
+    b_sim = casino.main.BulkSimulator(
+        roulette_game, seed=1234, common_random_numbers=True
+    )
+    b_sim.players = players
+    b_sim.samples = 4
+    b_sim.gather_all()
+    assert [result.player for result in b_sim.results] == [
+        player.__name__ for player in players
+    ]
+
+    # Every player replays the same events in the first sample.
+    layout = casino.main.Wheel.shared_layout()
+    for player, result in zip(players, b_sim.results):
+        sequence = casino.main.EventSequence(
+            layout.events, casino.main.SeedSequence(1234).child(0).random(), 250
+        )
+        table = casino.main.Table()
+        replay = casino.main.ReplayEventFactory(casino.main.Wheel(layout=layout))
+        game = casino.main.RouletteGame(replay, table)
+        table.set_game(game)
+        game.event_factory.replay(sequence)
+        summary = casino.main.Simulator(game, player(table)).stream_session()
+        assert summary.duration == result.durations[0]
+        assert summary.end_stake == result.end_stakes[0]
+
+    rows = b_sim.paired_differences()
+    assert [(row["player"], row["baseline"]) for row in rows] == [
+        ("RoulettePassenger57", "RouletteMartingale"),
+        ("RouletteFibonacci", "RouletteMartingale"),
+        ("RouletteFibonacci", "RoulettePassenger57"),
+    ]
+    end_stakes = [result.end_stakes for result in b_sim.results]
+    assert rows[0]["difference_mean"] == round(
+        sum(a - b for a, b in zip(end_stakes[1], end_stakes[0])) / 4, 2
+    )
+    assert b_sim.metadata()["common_random_numbers"]
+
+    # The sessions of an ordinary run are not paired.
+    b_sim = _seeded_bulk_sim(roulette_game, workers=1)
+    b_sim.gather_all()
+    with pytest.raises(ValueError):
+        b_sim.paired_differences()
+
+    with pytest.raises(ValueError):
+        casino.main.BulkSimulator(roulette_game, workers=2, common_random_numbers=True)
+
+
+def test_event_sequence():
+    events = casino.main.Wheel.shared_layout().events
+    sequence = casino.main.EventSequence(events, random.Random(1), 5)
+    first, second = iter(sequence), iter(sequence)
+    drawn = [next(first) for _ in range(12)]
+    assert len(sequence.events) == 15
+    assert [next(second) for _ in range(12)] == drawn
+    assert drawn == random.Random(1).choices(events, k=5) + sequence.events[5:12]
+
+
+def test_bulk_simulator_trajectory_archive(roulette_game, tmpdir):
+    serial = _seeded_bulk_sim(roulette_game, workers=1, chunk_size=4)
+    serial.trajectory_directory = str(tmpdir.join("serial"))
+    serial.gather_all()
+    parallel = _seeded_bulk_sim(roulette_game, workers=2, chunk_size=4)
+    parallel.trajectory_directory = str(tmpdir.join("parallel"))
+    parallel.gather_all()
+
+    with casino.main.TrajectoryArchive(serial.trajectory_directory) as archive:
+        # One shard per task, named by player and chunk.
+        assert archive.shards == sorted(task.shard_name for task in serial.tasks())
+        assert len(archive) == 18
+        martingale = archive.shard_sessions("RouletteMartingale-00000")
+        martingale += archive.shard_sessions("RouletteMartingale-00001")
+        result = serial.results[0]
+        assert [len(stakes) for stakes in martingale] == list(result.durations)
+        assert [stakes[-1] for stakes in martingale] == list(result.end_stakes)
+        sessions = [list(stakes) for stakes in archive]
+        del martingale  # The archive can not be closed while sessions are used.
+    with casino.main.TrajectoryArchive(parallel.trajectory_directory) as archive:
+        assert [list(stakes) for stakes in archive] == sessions
+
+
+def test_common_random_numbers_closes_shards(roulette_game, tmpdir, monkeypatch):
+    closed = []
+    close = casino.main.ArchiveTrajectorySink.close
+
+    def record_close(sink):
+        closed.append(sink)
+        close(sink)
+
+    def interrupt(sim, sink=None):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(casino.main.ArchiveTrajectorySink, "close", record_close)
+    monkeypatch.setattr(casino.main.Simulator, "stream_session", interrupt)
+    b_sim = casino.main.BulkSimulator(roulette_game, common_random_numbers=True)
+    b_sim.players = [casino.players.RouletteMartingale, casino.players.Roulette1326]
+    b_sim.trajectory_directory = str(tmpdir.join("archive"))
+    with pytest.raises(KeyboardInterrupt):
+        b_sim.gather_all()
+    assert len(closed) == 2
+
+
+def test_bulk_simulator_checkpoint_resume(roulette_game, tmpdir, monkeypatch):
+    uninterrupted = _seeded_bulk_sim(roulette_game, workers=1, chunk_size=4)
+    uninterrupted.gather_all()
+
+    path = tmpdir.join("run.checkpoint")
+    b_sim = _seeded_bulk_sim(roulette_game, workers=1, chunk_size=4)
+    b_sim.checkpoint_path = str(path)
+    b_sim.gather_all()
+    assert b_sim.player_stats == uninterrupted.player_stats
+    lines = path.read().splitlines()
+    assert json.loads(lines[0])["metadata"] == b_sim.metadata()
+    assert len(lines) == 1 + len(b_sim.tasks())
+
+    # A run killed while recording its fourth task only runs the tasks after
+    # the third again.
+    path.write("\n".join(lines[:4]) + "\n" + lines[4][:20])
+    ran = []
+    run_simulation_task = casino.main.run_simulation_task
+
+    def counting_run(task):
+        ran.append((task.player_type.__name__, task.chunk))
+        return run_simulation_task(task)
+
+    monkeypatch.setattr(casino.main, "run_simulation_task", counting_run)
+    resumed = _seeded_bulk_sim(roulette_game, workers=1, chunk_size=4)
+    resumed.checkpoint_path = str(path)
+    resumed.gather_all()
+    assert ran == [
+        ("RouletteFibonacci", 1),
+        ("Roulette1326", 0),
+        ("Roulette1326", 1),
+    ]
+    assert resumed.player_stats == uninterrupted.player_stats
+    assert path.read().splitlines() == lines
+
+    other = _seeded_bulk_sim(roulette_game, workers=1, chunk_size=4)
+    other.samples = 8
+    other.checkpoint_path = str(path)
+    with pytest.raises(ValueError):
+        other.gather_all()
+
+
+def test_bulk_simulator_checkpoint_unseeded(roulette_game, tmpdir):
+    def bulk_sim():
+        roulette_game.event_factory.seed(99)
+        b_sim = casino.main.BulkSimulator(roulette_game)
+        b_sim.players = [
+            casino.players.RouletteMartingale,
+            casino.players.RoulettePassenger57,
+        ]
+        b_sim.samples = 5
+        b_sim.checkpoint_path = str(tmpdir.join("run.checkpoint"))
+        return b_sim
+
+    b_sim = bulk_sim()
+    b_sim.gather_all()
+    lines = tmpdir.join("run.checkpoint").read().splitlines()
+    assert len(lines) == 3
+
+    # The shared RNG continues from the state recorded after the first player.
+    tmpdir.join("run.checkpoint").write("\n".join(lines[:2]) + "\n")
+    resumed = bulk_sim()
+    roulette_game.event_factory.seed(0)
+    resumed.gather_all()
+    assert resumed.player_stats == b_sim.player_stats
+
+    b_sim.common_random_numbers = True
+    with pytest.raises(ValueError):
+        b_sim.gather_all()
+
+
+def test_bulk_simulator_get_all_players(roulette_game):
+    craps = casino.main.BulkSimulator.get_all_players(casino.main.CrapsGame)
+    assert craps == [casino.players.CrapsMartingale, casino.players.CrapsPass]
+    roulette = casino.main.BulkSimulator(roulette_game).players
+    assert casino.players.RouletteSevenReds in roulette
+    assert casino.players.RoulettePlayer not in roulette
+    assert not set(craps) & set(roulette)
+    assert casino.main.BulkSimulator.get_all_players() == sorted(
+        roulette + craps, key=lambda player: player.__name__
+    )
@@ -0,0 +1,92 @@
+import json
+
+# noinspection PyUnresolvedReferences
+import pytest
+
+import casino.cli
+import casino.main
+import casino.results
+
+ARGS = ["--samples", "4", "--duration", "10", "--seed", "42", "--quiet"]
+
+
+def test_players_for():
+    assert [p.__name__ for p in casino.cli.players_for("craps")] == [
+        "CrapsMartingale",
+        "CrapsPass",
+    ]
+    roulette = [p.__name__ for p in casino.cli.players_for("roulette")]
+    assert "RouletteSevenReds" in roulette
+    assert "RoulettePlayer" not in roulette
+
+
+def test_cli_csv_output_and_resume(tmpdir):
+    players = ["--players", "RouletteMartingale", "RouletteFibonacci", "Roulette1326"]
+    full = str(tmpdir.join("full.csv"))
+    assert (
+        casino.cli.main(ARGS + players + ["--output", full, "--chunk-size", "3"]) == 0
+    )
+    with open(full) as f:
+        lines = f.read().splitlines()
+    assert lines[0].startswith("player,duration_mean")
+    assert [line.split(",")[0] for line in lines[1:]] == players[1:]
+
+    # A sweep killed after its first player is finished by --resume.
+    partial = tmpdir.join("partial.csv")
+    partial.write("\n".join(lines[:2]) + "\n")
+    arguments = ARGS + players + ["--output", str(partial), "--resume"]
+    assert casino.cli.main(arguments) == 0
+    assert partial.read().splitlines() == lines
+
+
+def test_cli_jsonl_metadata_and_results(tmpdir, capsys):
+    arguments = ARGS + ["--game", "craps", "--format", "jsonl", "--limit", "20"]
+    metadata, results = tmpdir.join("run.json"), tmpdir.join("run.cols")
+    arguments += ["--metadata", str(metadata), "--results", str(results)]
+    assert casino.cli.main(arguments) == 0
+
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["player"] for row in rows] == ["CrapsMartingale", "CrapsPass"]
+    settings = json.loads(metadata.read())
+    assert (settings["game"], settings["seed"]) == ("CrapsGame", 42)
+    assert (settings["init_duration"], settings["table_limit"]) == (10, 20)
+    with casino.results.ResultsStore.load(str(results)) as store:
+        assert store.summary() == rows
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        ["--players", "CrapsPass"],
+        ["--resume"],
+        ["--output", "stats.csv", "--resume", "--results", "stats.cols"],
+        ["--output", "stats.csv", "--resume", "--metadata", "stats.json"],
+        ["--samples", "1"],
+        ["--workers", "0"],
+    ],
+)
+def test_cli_rejects_bad_arguments(arguments):
+    with pytest.raises(SystemExit):
+        casino.cli.main(arguments)
+
+
+def test_cli_checkpoint(tmpdir):
+    checkpoint = str(tmpdir.join("run.checkpoint"))
+    arguments = ARGS + ["--players", "RouletteMartingale", "--checkpoint", checkpoint]
+    first, second = tmpdir.join("first.csv"), tmpdir.join("second.csv")
+    assert casino.cli.main(arguments + ["--output", str(first)]) == 0
+    # Every task is in the checkpoint, so the second run only reads it back.
+    assert casino.cli.main(arguments + ["--output", str(second)]) == 0
+    assert first.read() == second.read()
+
+    with pytest.raises(SystemExit):
+        casino.cli.main(arguments + ["--samples", "5"])
+
+
+def test_cli_run_errors_propagate(monkeypatch):
+    def gather_all(self):
+        raise ValueError("A bug in the run.")
+
+    monkeypatch.setattr(casino.main.BulkSimulator, "gather_all", gather_all)
+    with pytest.raises(ValueError, match="A bug in the run."):
+        casino.cli.main(ARGS + ["--players", "RouletteMartingale"])
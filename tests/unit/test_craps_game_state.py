@@ -1,51 +1,7 @@
-from fractions import Fraction
-
 import pytest
 
 import casino.main
-import casino.odds
-import tests.conftest
-
-
-def test_craps_game_state(
-    monkeypatch,
-    mock_craps_game,
-    mock_bet,
-    mock_outcome,
-    mock_player,
-    override_craps_game_state_abs_methods,
-):
-    monkeypatch.setattr(casino.main, "Outcome", mock_outcome)
-    monkeypatch.setattr(casino.main, "CrapsGame", mock_craps_game)
-    monkeypatch.setattr(casino.main, "Bet", mock_bet)
-
-    game = casino.main.CrapsGame("dice", "table")  # type: ignore
-    assert isinstance(game, tests.conftest.MockCrapsGame)
-    player = mock_player()
-    craps_game_state = casino.main.CrapsGameState(game)  # type: ignore
-
-    come_bet = casino.main.Bet(10, casino.main.Outcome("Come Line", 1), player)
-    dont_come_bet = casino.main.Bet(
-        20, casino.main.Outcome("Don't Come Line", 1), player
-    )
-    pass_bet = casino.main.Bet(30, casino.main.Outcome("Pass Line", 1), player)
-    non_point_throw = casino.main.CrapsThrow(1, 2)
-    point_throw = casino.main.PointThrow(5, 3)
-
-    with pytest.raises(ValueError):
-        craps_game_state.move_to_throw(come_bet, non_point_throw)
-    with pytest.raises(ValueError):
-        craps_game_state.move_to_throw(dont_come_bet, non_point_throw)
-    with pytest.raises(ValueError):
-        craps_game_state.move_to_throw(pass_bet, point_throw)
-
-    craps_game_state.move_to_throw(come_bet, point_throw)
-    assert come_bet.outcome.name == "Come Point 8"
-    assert come_bet.outcome.odds == Fraction(1, 1)
-
-    craps_game_state.move_to_throw(dont_come_bet, point_throw)
-    assert dont_come_bet.outcome.name == "Don't Come Point 8"
-    assert dont_come_bet.outcome.odds == Fraction(1, 1)
+import casino.players
 
 
 def test_craps_game_state_abstract_methods_reverted(monkeypatch, mock_craps_game):
@@ -53,3 +9,31 @@ def test_craps_game_state_abstract_methods_reverted(monkeypatch, mock_craps_game
     game = casino.main.CrapsGame("dice", "table")  # type: ignore
     with pytest.raises(TypeError):
         craps_game_state = casino.main.CrapsGameState(game)
+
+
+def test_craps_game_state_moves_come_bets(built_dice):
+    table = casino.main.Table()
+    game = casino.main.CrapsGame(built_dice, table)
+    table.set_game(game)
+    game.state = casino.main.CrapsGamePointOn(6, game)
+    player = casino.players.CrapsPass(table)
+    player.reset(duration=10, stake=100)
+    come = casino.main.Bet(10, casino.main.Outcome("Come Line", 1), player)
+    dont_come = casino.main.Bet(20, casino.main.Outcome("Don't Come Line", 1), player)
+    table.place_bet(come)
+    table.place_bet(dont_come)
+
+    game.state.resolve_bets(built_dice.get_event((3, 5)))
+    assert table.bets == (come, dont_come)
+    assert come.outcome.name == "Come Point 8"
+    assert dont_come.outcome.name == "Don't Come Point 8"
+    assert table.contains_outcome("Come Point 8", player)
+    assert table.contains_outcome("Don't Come Point 8", player)
+    assert not table.contains_outcome("Come Line", player)
+    assert not table.contains_outcome("Don't Come Line", player)
+    assert player.stake == 70
+
+    # The moved bets are resolved on their new point.
+    game.state.resolve_bets(built_dice.get_event((4, 4)))
+    assert table.bets == ()
+    assert player.stake == 90
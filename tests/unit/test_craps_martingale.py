@@ -64,3 +64,10 @@ def test_craps_martingale(
     assert player.loss_count == 0
     assert player.bet_multiple == 1
     assert player.stake == 1003
+
+    for bet in table.bets:
+        player.lose(bet)
+    assert player.loss_count == 1
+    player.reset(duration=100, stake=1000)
+    assert player.loss_count == 0
+    assert player.bet_multiple == 1
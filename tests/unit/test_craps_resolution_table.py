@@ -0,0 +1,55 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+import casino.main
+
+
+def test_craps_resolution_table():
+    table = casino.main.CrapsResolutionTable()
+
+    assert len(table.rules) == 7 * 11
+
+    default, actions = table.lookup(None, 12)
+    assert default is None
+    assert actions["Pass Line"] is casino.main.LOSE
+    assert actions["Don't Pass Line"] is casino.main.PUSH
+    assert table.lookup(None, 3)[1]["Don't Pass Line"] is casino.main.WIN
+
+    default, actions = table.lookup(None, 7)
+    assert default is casino.main.LOSE
+    assert actions["Come Point 4 Odds"] is casino.main.PUSH
+    assert "Don't Come Point 4 Odds" not in actions
+
+    default, actions = table.lookup(6, 6)
+    assert default is None
+    assert actions["Pass Odds"] is casino.main.WIN
+    assert actions["Don't Pass Line"] is casino.main.LOSE
+    assert "Come Point 6" not in actions
+    move = actions["Come Line"]
+    assert move.kind == "move"
+    assert move.outcome is table.moves[("Come Line", 6)]
+    assert move.outcome.name == "Come Point 6"
+
+    default, actions = table.lookup(6, 8)
+    assert actions["Come Point 8 Odds"] is casino.main.WIN
+    assert actions["Don't Come Point 8"] is casino.main.LOSE
+    assert actions["Don't Come Line"].outcome.name == "Don't Come Point 8"
+    assert "Pass Line" not in actions
+
+
+def test_throw_resolve_propositions(built_dice, mock_player):
+    player = mock_player()
+    hard_six = built_dice.get_event((3, 3))
+    easy_six = built_dice.get_event((2, 4))
+    hardways_6 = casino.main.Outcome("Hardways 6", 9)
+    field = casino.main.Outcome("Field", 1)
+
+    bet = casino.main.Bet(1, hardways_6, player)
+    assert hard_six.resolve_propositions(bet)
+    assert player.stake == 110
+    assert easy_six.resolve_propositions(bet)
+    assert player.stake == 110
+    assert easy_six.resolve_propositions(casino.main.Bet(1, field, player))
+    assert not easy_six.resolve_propositions(
+        casino.main.Bet(1, casino.main.Outcome("Pass Line", 1), player)
+    )
@@ -0,0 +1,93 @@
+import itertools
+import json
+
+# noinspection PyUnresolvedReferences
+import pytest
+
+import casino.main
+import casino.players
+
+
+def test_cycle_profiler_report(tmpdir):
+    profiler = casino.main.CycleProfiler()
+    profiler.add("resolve", "RoulettePassenger57", "RouletteGame", 0.5)
+    profiler.add("place_bets", "RoulettePassenger57", "RouletteGame", 0.25)
+    profiler.add("place_bets", "RoulettePassenger57", "RouletteGame", 0.75)
+
+    other = casino.main.CycleProfiler()
+    other.add("resolve", "RoulettePassenger57", "RouletteGame", 1.5)
+    other.add("choose", "RouletteMartingale", "RouletteGame", 2)
+    profiler.merge(other)
+
+    report = profiler.report()
+    assert [(row["phase"], row["player"]) for row in report] == [
+        ("place_bets", "RoulettePassenger57"),
+        ("choose", "RouletteMartingale"),
+        ("resolve", "RoulettePassenger57"),
+    ]
+    assert report[0]["calls"] == 2
+    assert report[0]["seconds"] == 1.0
+    assert report[2]["mean_us"] == 1e6
+
+    profiler.save(tmpdir.join("profile.json"))
+    with open(tmpdir.join("profile.json")) as f:
+        assert json.load(f) == report
+
+
+def test_craps_game_profiled_by_state(seeded_dice):
+    table = casino.main.Table()
+    game = casino.main.CrapsGame(seeded_dice, table)
+    table.set_game(game)
+    sim = casino.main.Simulator(game, casino.players.CrapsPass(table))
+    sim.init_duration, sim.samples = 20, 5
+    # Every reading of the clock is one second later.
+    sim.profiler = casino.main.CycleProfiler(itertools.count().__next__)
+    sim.gather()
+
+    cycles = sum(sim.durations)
+    timings = sim.profiler.timings
+    assert {state for _, _, state in timings} == {
+        "CrapsGamePointOff",
+        "CrapsGamePointOn",
+    }
+    for phase in casino.main.CycleProfiler.PHASES:
+        calls = [calls for (p, _, _), (calls, _) in timings.items() if p == phase]
+        assert sum(calls) == cycles
+    assert all(player == "CrapsPass" for _, player, _ in timings)
+    assert all(seconds == calls for calls, seconds in timings.values())
+
+
+def test_bulk_simulator_profile(tmpdir):
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(casino.main.Wheel(), table)
+    table.set_game(game)
+    b_sim = casino.main.BulkSimulator(game, seed=3, workers=2, chunk_size=2)
+    b_sim.players = [casino.players.RouletteMartingale]
+    b_sim.samples = 4
+    b_sim.init_duration = 10
+
+    with pytest.raises(ValueError):
+        b_sim.save_profile(tmpdir.join("profile.json"))
+
+    b_sim.profiler = casino.main.CycleProfiler()
+    b_sim.gather_all()
+    b_sim.save_profile(tmpdir.join("profile.json"))
+    with open(tmpdir.join("profile.json")) as f:
+        report = json.load(f)
+    assert [row["phase"] for row in report] == list(casino.main.CycleProfiler.PHASES)
+    assert all(row["state"] == "RouletteGame" for row in report)
+    cycles = sum(b_sim.results[0].durations)
+    assert all(row["calls"] == cycles for row in report)
+
+
+def test_shared_game_profiler_is_detached():
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(casino.main.Wheel(), table)
+    table.set_game(game)
+    b_sim = casino.main.BulkSimulator(game)
+    b_sim.players = [casino.players.RouletteMartingale]
+    b_sim.samples, b_sim.init_duration = 2, 5
+    b_sim.profiler = casino.main.CycleProfiler()
+    b_sim.gather_all()
+    assert b_sim.profiler.timings
+    assert game.profiler is None
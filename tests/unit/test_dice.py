@@ -35,3 +35,43 @@ class TestDice:
         assert dice.get_event((2, 6)) == self.mock_throws[0]
         assert dice.get_event((5, 5)) == self.mock_throws[1]
         assert dice.get_event((1, 3)) == self.mock_throws[2]
+
+    def test_choose_many(self):
+        dice = casino.main.Dice(random.Random(1))
+        for throw in self.mock_throws:
+            dice.add_throw(throw)
+
+        assert dice.throw_sequence == tuple(self.mock_throws)
+        throws = dice.choose_many(50)
+        assert len(throws) == 50
+        assert set(throws) == set(self.mock_throws)
+
+        dice.rng.seed(1)
+        assert dice.choose_many(50) == throws
+
+    def test_choose_prefetched(self):
+        dice = casino.main.Dice(random.Random(1), prefetch=8)
+        for throw in self.mock_throws:
+            dice.add_throw(throw)
+
+        throws = [dice.choose() for _ in range(50)]
+        dice.seed(1)
+        assert dice.choose_many(50) == throws
+
+        for prefetch in (1, 7, 64):
+            dice.prefetch = prefetch
+            dice.seed(1)
+            assert [dice.choose() for _ in range(50)] == throws
+
+    def test_prefetch_disabled_matches_choice(self):
+        dice = casino.main.Dice(random.Random(1))
+        for throw in self.mock_throws:
+            dice.add_throw(throw)
+
+        throws = [dice.choose() for _ in range(20)]
+        rng = random.Random(1)
+        assert throws == [rng.choice(self.mock_throws) for _ in range(20)]
+
+    def test_negative_prefetch(self):
+        with pytest.raises(ValueError):
+            casino.main.Dice(prefetch=-1)
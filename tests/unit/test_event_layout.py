@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+import casino.main
+
+
+@pytest.mark.parametrize("factory", [casino.main.Wheel, casino.main.Dice])
+def test_shared_layout(factory):
+    layout = factory.shared_layout()
+    assert factory.shared_layout() is layout
+
+    built = factory(random.Random(1))
+    shared = factory(random.Random(1), layout=layout)
+
+    assert [e.outcomes for e in shared.events] == [e.outcomes for e in built.events]
+    assert shared.all_outcomes.keys() == built.all_outcomes.keys()
+    assert shared.outcome_ids == built.outcome_ids
+    assert [shared.choose().outcomes for _ in range(20)] == [
+        built.choose().outcomes for _ in range(20)
+    ]
+
+
+def test_layout_devices_are_independent():
+    layout = casino.main.Wheel.shared_layout()
+    wheel_1 = casino.main.Wheel(random.Random(1), layout=layout)
+    wheel_2 = casino.main.Wheel(random.Random(2), layout=layout)
+
+    assert wheel_1.bins is wheel_2.bins
+    assert wheel_1.all_outcomes is not wheel_2.all_outcomes
+    assert [wheel_1.choose() for _ in range(20)] != [
+        wheel_2.choose() for _ in range(20)
+    ]
+    assert wheel_1.get_outcome("Black") is wheel_2.get_outcome("Black")
+
+
+def test_dice_layout_throws():
+    dice = casino.main.Dice(layout=casino.main.Dice.shared_layout())
+    assert len(dice.throws) == 36
+    assert dice.get_event((3, 4)) is dice.throws[(3, 4)]
+
+    # A replay of the dice looks throws up by key, like the dice themselves.
+    replay = casino.main.ReplayEventFactory(dice)
+    assert replay.get_event((3, 4)) is dice.throws[(3, 4)]
+    with pytest.raises(ValueError):
+        replay.get_event(3)
+
+
+def test_invalid_layout():
+    layout = casino.main.Dice.shared_layout()
+    with pytest.raises(ValueError):
+        casino.main.Wheel(layout=layout)
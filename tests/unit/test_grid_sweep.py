@@ -0,0 +1,84 @@
+import csv
+
+# noinspection PyUnresolvedReferences
+import pytest
+
+import casino.main
+import casino.players
+import casino.sweep
+
+PLAYERS = [casino.players.RouletteMartingale, casino.players.Roulette1326]
+
+
+def make_sweep(workers=1, chunk_size=None):
+    sweep = casino.sweep.GridSweep(
+        casino.main.RouletteGame,
+        casino.main.Wheel,
+        PLAYERS,
+        seed=1234,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+    sweep.stakes = [20, 100]
+    sweep.durations = [10, 40]
+    sweep.limits = [10, 30]
+    sweep.samples = 6
+    return sweep
+
+
+def test_grid_sweep_cells():
+    sweep = make_sweep(chunk_size=4)
+    cells = sweep.cells()
+    assert len(cells) == 2 * 2 * 2 * 2
+    assert cells[0] == casino.sweep.GridCell(PLAYERS[0], 20, 10, 10)
+    assert cells[1].parameters() == {
+        "player": "RouletteMartingale",
+        "init_stake": 20,
+        "init_duration": 10,
+        "table_limit": 30,
+    }
+    tasks = sweep.tasks()
+    assert len(tasks) == 2 * len(cells)
+    cell, task = tasks[3]
+    assert (task.chunk, task.first_sample, task.samples) == (1, 4, 2)
+    assert (task.init_stake, task.init_duration, task.table_limit) == (20, 10, 30)
+
+    sweep.limits = []
+    with pytest.raises(ValueError):
+        sweep.cells()
+
+
+def test_grid_sweep_rows(tmpdir):
+    sweep = make_sweep()
+    rows = sweep.run()
+    assert len(rows) == len(sweep.cells())
+    assert tuple(rows[0])[:4] == casino.sweep.PARAMETERS
+    for cell, result in sweep.results.items():
+        assert len(result.durations) == 6
+        assert max(result.durations) <= cell.init_duration
+
+    # Chunking and workers do not change the results of a seeded sweep.
+    assert make_sweep(workers=2, chunk_size=4).run() == rows
+
+    sweep.save_to_csv(tmpdir.join("sweep.csv"))
+    with open(tmpdir.join("sweep.csv")) as csv_file:
+        saved = list(csv.DictReader(csv_file))
+    assert [row["table_limit"] for row in saved[:2]] == ["10", "30"]
+
+
+def test_grid_sweep_matches_bulk_simulator():
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(casino.main.Wheel(), table)
+    table.set_game(game)
+    b_sim = casino.main.BulkSimulator(game, seed=1234)
+    b_sim.players = PLAYERS
+    b_sim.samples = 6
+    b_sim.gather_all()
+
+    sweep = make_sweep()
+    sweep.stakes, sweep.durations, sweep.limits = [100], [250], [30]
+    sweep.run()
+    for row, expected in zip(sweep.rows, b_sim.player_stats):
+        assert row["player"] == expected["player"]
+        assert {key: row[key] for key in expected} == expected
+    assert sweep.metadata()["seed"] == b_sim.metadata()["seed"]
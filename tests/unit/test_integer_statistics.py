@@ -1,3 +1,5 @@
+import random
+
 # noinspection PyUnresolvedReferences
 import pytest
 
@@ -13,3 +15,62 @@ def test_integer_statistics():
     assert len(int_stat) == 11
     assert int_stat.mean() == 9.0
     assert round(int_stat.stdev(), 3) == 3.32
+
+
+def test_integer_statistics_single_pass():
+    int_stat = casino.main.IntegerStatistics([10, 8, 13, 9, 11, 14, 6, 4, 12, 7, 5])
+
+    assert int_stat.min() == 4
+    assert int_stat.max() == 14
+    assert int_stat.median() == 9
+    assert int_stat.quantile(0.05) == 4.5
+    assert int_stat.quantile(0.95) == 13.5
+    assert round(int_stat.variance(), 6) == 11.0
+    assert int_stat[0] == 10
+    assert int_stat[-2:] == [7, 5]
+    assert int_stat == [10, 8, 13, 9, 11, 14, 6, 4, 12, 7, 5]
+
+    summary = int_stat.describe()
+    assert summary["count"] == 11
+    assert summary["mean"] == 9.0
+    assert summary["median"] == 9
+    assert summary["ci_low"] < 9.0 < summary["ci_high"]
+    assert round(summary["ci_high"] - 9.0, 3) == 1.96
+
+
+def test_integer_statistics_merge():
+    rng = random.Random(3)
+    values = [rng.randint(-1000, 10 ** 6) for _ in range(500)]
+    left = casino.main.IntegerStatistics(values[:123])
+    right = casino.main.IntegerStatistics(values[123:])
+    left.merge(right)
+    whole = casino.main.IntegerStatistics(values)
+
+    assert left == whole
+    assert left.mean() == whole.mean()
+    assert round(left.variance(), 3) == round(whole.variance(), 3)
+    assert (left.min(), left.max()) == (min(values), max(values))
+
+
+def test_integer_statistics_bootstrap():
+    int_stat = casino.main.IntegerStatistics(range(100))
+    low, high = int_stat.confidence_interval(
+        method="bootstrap", rng=random.Random(1)
+    )
+    normal_low, normal_high = int_stat.confidence_interval()
+
+    assert low < 49.5 < high
+    assert abs(low - normal_low) < 1.5
+    assert abs(high - normal_high) < 1.5
+    with pytest.raises(ValueError):
+        int_stat.confidence_interval(method="unknown")
+
+
+def test_integer_statistics_empty():
+    int_stat = casino.main.IntegerStatistics()
+
+    assert not int_stat
+    with pytest.raises(ZeroDivisionError):
+        int_stat.mean()
+    with pytest.raises(ValueError):
+        int_stat.median()
@@ -1,3 +1,4 @@
+import pickle
 from fractions import Fraction
 
 # noinspection PyUnresolvedReferences
@@ -30,3 +31,35 @@ def test_outcome(mock_random_events):
     assert o3.win_amount(10) == 20
     assert o3.win_amount(10, mock_random_events[1]) == 20
     assert o4.win_amount(10) == 12
+
+
+def test_outcome_intern():
+    outcome = casino.main.Outcome.intern("Pass Line", 1)
+    assert casino.main.Outcome.intern("Pass Line", Fraction(1, 1)) is outcome
+    assert casino.main.Outcome.intern("Pass Odds", 2) is not outcome
+    assert casino.main.Outcome.intern("Pass Odds", 2) is not (
+        casino.main.Outcome.intern("Pass Odds", Fraction(3, 2))
+    )
+    assert casino.main.OutcomeField.intern("Pass Line", 1) is not outcome
+    assert isinstance(
+        casino.main.OutcomeField.intern("Field", 1), casino.main.OutcomeField
+    )
+
+
+def test_outcome_slots():
+    outcome = casino.main.Outcome("Red", 1)
+    with pytest.raises(AttributeError):
+        outcome.colour = "Red"
+    outcome.id = 3
+    assert outcome.id == 3
+
+    copy = pickle.loads(pickle.dumps(outcome))
+    assert (copy.name, copy.odds, copy.id) == ("Red", Fraction(1, 1), 3)
+
+
+def test_slots():
+    outcome = casino.main.Outcome("Red", 1)
+    throw = casino.main.PointThrow(2, 2)
+    bin_ = casino.main.Bin([outcome])
+    for obj in (outcome, throw, bin_):
+        assert not hasattr(obj, "__dict__")
@@ -0,0 +1,92 @@
+import array
+
+# noinspection PyUnresolvedReferences
+import pytest
+
+import casino.main
+import casino.players
+import casino.results
+
+
+def make_result(player, durations, maxima, end_stakes):
+    return casino.main.SimulationResult(
+        player,
+        0,
+        casino.main.IntegerStatistics(durations),
+        casino.main.IntegerStatistics(maxima),
+        casino.main.IntegerStatistics(end_stakes),
+        minima=casino.main.IntegerStatistics(-stake for stake in maxima),
+    )
+
+
+def test_results_store_round_trip(tmpdir):
+    store = casino.results.ResultsStore({"seed": 7, "init_stake": 100})
+    store.add(make_result("A", [1, 2], [110, 120], [90, -3]))
+    store.add(make_result("A", [3], [130], [2**40]))
+    store.add(make_result("B", [4, 5], [140, 150], [0, 1]))
+    assert len(store) == 5
+    assert store.players == {"A": (0, 3), "B": (3, 5)}
+
+    with pytest.raises(ValueError):
+        store.add(make_result("A", [6], [160], [6]))
+    with pytest.raises(ValueError):
+        store.add(make_result("C", [6, 7], [160], [6]))
+
+    path = tmpdir.join("sessions.cols")
+    store.save(path)
+    with casino.results.ResultsStore.load(path) as loaded:
+        assert loaded.metadata == {"seed": 7, "init_stake": 100}
+        assert loaded.players == store.players
+        assert list(loaded.column("durations")) == [1, 2, 3, 4, 5]
+        assert list(loaded.column("end_stakes", "A")) == [90, -3, 2**40]
+        assert loaded.statistics("maxima", "B").mean() == 145
+        assert list(loaded.column("minima", "B")) == [-140, -150]
+        assert loaded.summary() == store.summary()
+        assert loaded.result("B").end_stakes == store.result("B").end_stakes
+        with pytest.raises(ValueError):
+            loaded.add(make_result("C", [1], [1], [1]))
+
+    with open(path, "rb") as results_file:
+        data = results_file.read()
+    assert data.startswith(casino.results.MAGIC)
+    # The last column holds the end stakes as little-endian int64s.
+    end_stakes = array.array("q", data[-5 * 8 :])
+    assert list(end_stakes) == [90, -3, 2**40, 0, 1]
+
+
+def test_results_store_rejects_other_files(tmpdir):
+    path = tmpdir.join("stats.csv")
+    path.write("player,duration_mean\n")
+    with pytest.raises(ValueError):
+        casino.results.ResultsStore.load(path)
+
+
+@pytest.mark.parametrize("seed", [None, 1234])
+def test_bulk_simulator_save_results(tmpdir, seed):
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(casino.main.Wheel(), table)
+    table.set_game(game)
+    b_sim = casino.main.BulkSimulator(game, seed=seed)
+    b_sim.players = [
+        casino.players.RouletteMartingale,
+        casino.players.RoulettePassenger57,
+    ]
+    b_sim.samples = 5
+    b_sim.init_stake, b_sim.init_duration = 20, 10
+    b_sim.gather_all()
+
+    path = tmpdir.join("sessions.cols")
+    b_sim.save_results(path)
+    with casino.results.ResultsStore.load(path) as loaded:
+        assert loaded.metadata == b_sim.metadata()
+        assert loaded.metadata["init_stake"] == 20
+        assert loaded.summary() == b_sim.player_stats
+        assert list(loaded.column("minima")) == [
+            minimum for result in b_sim.results for minimum in result.minima
+        ]
+        assert all(
+            low <= high
+            for low, high in zip(loaded.column("minima"), loaded.column("maxima"))
+        )
+        assert len(loaded) == 10
+        assert max(loaded.column("durations")) <= 10
@@ -58,3 +58,9 @@ def test_roulette_1326(monkeypatch, mock_bet, mock_table, mock_game):
     player.lose(table.bets[7])
     assert player.stake == 113
     assert isinstance(player.state, casino.players.Roulette1326NoWins)
+
+    player.place_bets()
+    player.win(table.bets[8])
+    assert isinstance(player.state, casino.players.Roulette1326OneWin)
+    player.reset(250, 100)
+    assert isinstance(player.state, casino.players.Roulette1326NoWins)
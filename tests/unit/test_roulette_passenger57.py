@@ -0,0 +1,23 @@
+# noinspection PyUnresolvedReferences
+import pytest
+
+import casino.main
+import casino.players
+
+
+def test_roulette_passenger57(monkeypatch, mock_table, mock_bet, mock_game):
+    monkeypatch.setattr(casino.main, "Table", mock_table)
+    monkeypatch.setattr(casino.main, "Bet", mock_bet)
+    table = casino.main.Table()
+    table.set_game(mock_game())
+    player = casino.players.RoulettePassenger57(table)
+    player.reset(250, 2)
+
+    player.place_bets()
+    assert player.stake == 1
+    assert table.bets[0].amount == 1
+
+    player.bet_amount = 5
+    player.place_bets()  # Bet is reduced to the remaining stake.
+    assert player.stake == 0
+    assert table.bets[1].amount == 1
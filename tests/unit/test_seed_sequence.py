@@ -0,0 +1,42 @@
+import random
+
+# noinspection PyUnresolvedReferences
+import pytest
+
+import casino.main
+import casino.players
+
+
+def test_seed_sequence():
+    root = casino.main.SeedSequence(1234)
+    assert root.child("a", 1) == casino.main.SeedSequence(1234, ("a", 1))
+    assert root.child("a").child(1) == root.child("a", 1)
+    assert root.spawn(3, start=2) == [root.child(2), root.child(3), root.child(4)]
+
+    seeds = {root.seed_int(), root.child(0).seed_int(), root.child(1).seed_int()}
+    assert len(seeds) == 3
+    assert root.child("0").seed_int() != root.child(0).seed_int()
+    assert casino.main.SeedSequence("1234").seed_int() != root.seed_int()
+
+    assert root.random().random() == root.random().random()
+
+
+def test_simulator_seed_session():
+    def run(first_sample, samples):
+        table = casino.main.Table()
+        game = casino.main.RouletteGame(
+            casino.main.Wheel(layout=casino.main.Wheel.shared_layout()), table
+        )
+        table.set_game(game)
+        player = casino.players.RouletteRandom(table, random.Random())
+        sim = casino.main.Simulator(game, player, casino.main.SeedSequence(99))
+        sim.init_duration = 10
+        sim.first_sample = first_sample
+        sim.samples = samples
+        sim.gather()
+        return list(sim.end_stakes)
+
+    assert run(0, 5) == run(0, 3) + run(3, 2)
+
+    with pytest.raises(ValueError):
+        casino.main.Simulator(None, None).seed_session(0)  # type: ignore
@@ -11,7 +11,10 @@ class TestTable:
     def test_empty_init(self):
         t = casino.main.Table()
         t.set_game(self.game)
-        assert t.bets == []
+        assert t.bets == ()
+        # The bets are read-only, bets are added with place_bet.
+        with pytest.raises(AttributeError):
+            t.bets.append(None)  # type: ignore
 
     def test_multi_init(self, sample_bets):
         b1, b2, _ = sample_bets
@@ -42,7 +45,7 @@ class TestTable:
         assert t.bets_total == 8
         t.clear()
         assert t.bets_total == 0
-        assert t.bets == []
+        assert t.bets == ()
 
     def test_place_invalid_bet(self, invalid_bets):
         t = casino.main.Table()
@@ -79,3 +82,120 @@ class TestTable:
             "Bet(amount=2, Outcome=Outcome(name='4-1 Split', odds=Fraction(4, 1))), "
             "Bet(amount=5, Outcome=Outcome(name='Dozen 1', odds=Fraction(6, 1))))"
         )
+
+    def test_contains_outcome(self, sample_bets, mock_outcome):
+        b1, b2, b3 = sample_bets
+        b2.outcome.id = 7
+        t = casino.main.Table()
+        t.set_game(self.game)
+        for bet in sample_bets:
+            t.place_bet(bet)
+        assert t.contains_outcome("Red")
+        assert t.contains_outcome(b2.outcome)
+        assert not t.contains_outcome("Black")
+
+        t.move_bet(b1, mock_outcome("Black", 1))
+        assert t.contains_outcome("Black")
+        assert not t.contains_outcome("Red")
+        t.remove_bet(b2)
+        assert not t.contains_outcome(b2.outcome)
+        assert t.audit()
+
+    def test_remove_during_iteration(self, sample_bets):
+        b1, b2, b3 = sample_bets
+        t = casino.main.Table()
+        t.set_game(self.game)
+        for bet in sample_bets:
+            t.place_bet(bet)
+
+        seen = []
+        for bet in t:
+            seen.append(bet)
+            t.remove_bet(b2 if bet is b1 else bet)
+        assert seen == [b1, b3]
+        assert t.bets == (b1,)
+        assert len(t) == 1
+        assert t.bets_total == 1
+        assert t.player_totals == {b1.player: 1}
+        assert t.audit()
+
+        with pytest.raises(ValueError):
+            t.remove_bet(b2)
+
+    def test_player_totals(self, sample_bets):
+        b1, b2, b3 = sample_bets
+        b2.player = b1.player
+        t = casino.main.Table()
+        t.set_game(self.game)
+        t.bets = sample_bets
+        assert t.player_totals == {b1.player: 3, b3.player: 5}
+        assert t.validate()
+
+        t.player_totals[b3.player] = 40
+        with pytest.raises(casino.main.InvalidBet):
+            t.validate()
+        t.player_totals[b3.player] = 5
+        t.bets_total = 7
+        with pytest.raises(ValueError):
+            t.audit()
+
+    def test_validation_policies(self, sample_bets):
+        t = casino.main.Table(validation=casino.main.SampledValidation(3))
+        t.set_game(self.game)
+        for bet in sample_bets:
+            t.place_bet(bet)
+        t.player_totals[sample_bets[0].player] = 40
+
+        invalid_cycles = []
+        for cycle in range(7):
+            try:
+                t.validate_cycle()
+            except casino.main.InvalidBet:
+                invalid_cycles.append(cycle)
+        assert invalid_cycles == [0, 3, 6]
+
+        # Each session is validated from its first cycle again.
+        t.reset()
+        assert t.bets == ()
+        t.player_totals[sample_bets[0].player] = 40
+        with pytest.raises(casino.main.InvalidBet):
+            t.validate_cycle()
+
+        t.validation = casino.main.FullValidation()
+        with pytest.raises(casino.main.InvalidBet):
+            t.validate_cycle()
+
+        t.player_totals[sample_bets[0].player] = 1
+        t.bets_total = 7
+        t.validation = casino.main.DebugValidation()
+        with pytest.raises(ValueError):
+            t.validate_cycle()
+
+        with pytest.raises(ValueError):
+            casino.main.SampledValidation(0)
+
+    def test_player_limits(self, sample_bets, mock_bet, mock_outcome):
+        b1, b2, b3 = sample_bets
+        t = casino.main.Table()
+        t.set_game(self.game)
+        t.set_player_limit(b3.player, 6)
+        assert t.limit_for(b3.player) == 6
+        assert t.limit_for(b1.player) == 30
+        for bet in sample_bets:
+            t.place_bet(bet)
+        assert t.has_bets(b1.player)
+        assert t.contains_outcome("Red", b1.player)
+        assert not t.contains_outcome("Red", b2.player)
+
+        # Each player has their own limit.
+        t.place_bet(mock_bet(29, mock_outcome("Black", 1), b1.player))
+        with pytest.raises(casino.main.InvalidBet):
+            t.place_bet(mock_bet(2, mock_outcome("Black", 1), b3.player))
+        t.place_bet(mock_bet(1, mock_outcome("Black", 1), b3.player))
+        assert t.bets_total == 38
+        assert t.validate()
+        assert t.audit()
+
+        t.remove_bet(b1)
+        assert t.has_bets(b1.player)
+        assert not t.contains_outcome("Red", b1.player)
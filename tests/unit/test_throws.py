@@ -45,13 +45,12 @@ class TestThrows:
         assert len(throw.winners) == 8
 
         for outcome in one_roll_winners | one_roll_losers:
-            assert throw.resolve_one_roll(mock_bet(10, outcome, player))
+            assert throw.resolve_propositions(mock_bet(10, outcome, player))
         for outcome in hardways_winners | hardways_losers:
-            assert throw.resolve_hard_ways(mock_bet(10, outcome, player))
+            assert throw.resolve_propositions(mock_bet(10, outcome, player))
 
         a_bet = mock_bet(10, mock_outcome("some outcome", 1), player)
-        assert not throw.resolve_one_roll(a_bet)
-        assert not throw.resolve_hard_ways(a_bet)
+        assert not throw.resolve_propositions(a_bet)
 
         with pytest.raises(NotImplementedError):
             throw.update_game(self._game)
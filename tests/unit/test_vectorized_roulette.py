@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+import casino.main
+import casino.players
+
+np = pytest.importorskip("numpy")
+import casino.vectorized  # noqa: E402
+
+
+class ReplayRandom(random.Random):
+    """Returns the given bin numbers from `choice` instead of random ones."""
+
+    def __init__(self, bin_numbers):
+        super().__init__()
+        self.bin_numbers = iter(bin_numbers)
+
+    def choice(self, seq):
+        return seq[next(self.bin_numbers)]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return casino.vectorized.VectorizedRoulette(casino.main.Wheel())
+
+
+def test_net_payouts(engine):
+    assert engine.net_payouts.shape == (38, len(engine.outcomes))
+    black = engine.outcome_columns["black"]
+    straight_8 = engine.outcome_columns["number 8"]
+    assert engine.net_payouts[2, black] == 1
+    assert engine.net_payouts[1, black] == -1
+    assert engine.net_payouts[8, straight_8] == 35
+    assert (engine.net_payouts[:, straight_8] == 35).sum() == 1
+
+
+def test_flat_bet_matches_simulator(engine):
+    rng = random.Random(7)
+    spins = engine.spins_from_random(rng, sessions=30, duration=40)
+    durations, maxima, end_stakes = engine.flat_bet(spins, "Black", 1, init_stake=10)
+
+    wheel = casino.main.Wheel()
+    table = casino.main.Table()
+    game = casino.main.RouletteGame(wheel, table)
+    table.set_game(game)
+    sim = casino.main.Simulator(game, casino.players.RoulettePassenger57(table))
+    sim.init_duration, sim.init_stake, sim.samples = 40, 10, 1
+    for row in spins:
+        wheel.rng = ReplayRandom(row)
+        sim.gather()
+
+    assert list(durations) == list(sim.durations)
+    assert list(maxima) == list(sim.maxima)
+    assert list(end_stakes) == list(sim.end_stakes)
+    assert min(durations) < 40  # Some sessions are cut short by ruin.
+
+
+def test_flat_bet_validation(engine):
+    spins = engine.spin(2, 5, np.random.default_rng(1))
+    assert spins.shape == (2, 5)
+    with pytest.raises(casino.main.InvalidBet):
+        engine.flat_bet(spins, "Black", 31, init_stake=62)
+    with pytest.raises(ValueError):
+        engine.flat_bet(spins, "Black", 3, init_stake=10)
+    with pytest.raises(KeyError):
+        engine.flat_bet(spins, "does_not_exist", 1, init_stake=10)
@@ -0,0 +1,31 @@
+import pytest
+
+import casino.main
+
+
+def test_outcome_ids():
+    wheel = casino.main.Wheel()
+    black = wheel.get_outcome("Black")
+    black_id = wheel.get_outcome_id("black")
+
+    assert black.id == black_id
+    assert wheel.outcome_index[black_id] is black
+    assert sorted(wheel.outcome_ids.values()) == list(range(len(wheel.outcome_index)))
+    assert len(wheel.outcome_index) == len(wheel.all_outcomes)
+    for bin_ in wheel.bins:
+        assert bin_.mask == sum(1 << outcome.id for outcome in bin_.outcomes)
+    assert black in wheel.get_event(2)
+    assert black not in wheel.get_event(1)
+    # Unregistered outcomes are looked up by name.
+    assert casino.main.Outcome("Black", 1) in wheel.get_event(2)
+
+    with pytest.raises(KeyError):
+        wheel.get_outcome_id("does_not_exist")
+
+
+def test_outcome_id_conflict():
+    outcome = casino.main.Outcome("Red", 1)
+    outcome.id = 5
+    wheel = casino.main.Wheel()
+    with pytest.raises(ValueError):
+        wheel.register_outcomes([outcome])